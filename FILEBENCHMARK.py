@@ -0,0 +1,138 @@
+# -*- coding:utf-8 -*-
+
+# @File : FILEBENCHMARK.py
+# @Description: nc(netCDF4)文件存储设置 (压缩和分块) 的性能测试:
+#               使用合成的一天观测数据, 比较不同存储设置下的写入时间、文件大小和读取一小时数据的时间
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import netCDF4 as nc
+
+from filewriter import NCGenerator, DayBuffer, StorageProfile, STORAGE_PROFILES
+from instruments import get_instrument
+
+
+def get_field_info(instrument_name):
+    """
+    从设备注册表中获取设备的字段信息, 返回generate_one_day_nc_file的关键字参数
+    """
+    names = ('header_info_code', 'header_info_longname', 'header_info_unit', 'header_info_nc_type',
+             'header_info_value', 'obs_info_code', 'obs_info_longname', 'obs_info_unit', 'obs_info_nc_type')
+    return dict(zip(names, get_instrument(instrument_name).nc_args))
+
+
+def synthetic_value(instrument_name, code, nc_type, rng, when):
+    """
+    按字段类型生成一个合成观测值 (廓线平滑变化, 谱数据大部分为0, 与实际观测数据的分布相近)
+    """
+    if code.startswith('Datetime') or code == 'GPS_DT':
+        return when
+    if instrument_name == 'RSD' and code == 'Prec_spec':
+        return ['%03d' % (rng.randint(1, 30) if rng.random() < 0.05 else 0) for _ in range(440)]
+    if instrument_name == 'MRD' and nc_type == 'array':
+        base = rng.uniform(-5, 25)
+        return [round(base - 0.2 * k + rng.uniform(-0.1, 0.1), 2) for k in range(58)]
+    if instrument_name == 'YCCL_L2' and nc_type == 'array':
+        return [rng.randint(0, 2000) if k < 60 else rng.randint(0, 20) for k in range(450)]
+    if nc_type.startswith('array31') or nc_type.startswith('array32'):
+        size = 31 if '31' in nc_type else 32
+        if nc_type.endswith('_i'):
+            return [100 * k for k in range(size)]
+        return [round(rng.uniform(0, 10), 3) if rng.random() < 0.3 else 0.0 for _ in range(size)]
+    if nc_type == 'array64':
+        size = 32 if instrument_name == 'RRD_Lraw' else 31
+        return [[round(rng.uniform(0, 1), 3) if rng.random() < 0.05 else 0.0 for _ in range(size)]
+                for _ in range(64)]
+    if nc_type == 'f' or 'Numb_part_ch' in code:
+        return round(rng.uniform(0, 30), 2)
+    if nc_type in ('i', 'u1', 'u2', 'u4'):
+        return 0
+    return 'Nan'
+
+
+def synthetic_day(instrument_name, obs_info_code, obs_info_nc_type, records=1440, seed=0):
+    """
+    生成一天的合成观测数据 (DayBuffer)
+    """
+    rng = random.Random(seed)
+    start = datetime(2020, 1, 1)
+    step = 86400 // records
+    one_day_data = DayBuffer(obs_info_code)
+    for i in range(records):
+        when = start + timedelta(seconds=step * i)
+        one_day_data.append({code: synthetic_value(instrument_name, code, nc_type, rng, when)
+                             for code, nc_type in zip(obs_info_code, obs_info_nc_type)})
+    return one_day_data
+
+
+def with_complevel(complevel):
+    """
+    在默认存储设置的基础上修改压缩级别
+    """
+    return {name: StorageProfile(complevel, profile.shuffle, profile.fletcher32, profile.time_chunk, profile.chunks)
+            for name, profile in STORAGE_PROFILES.items()}
+
+
+def with_sparse(codes=('Prec_spec', 'Spectral_reflectivities', 'Spec_drop_dens')):
+    """
+    在默认存储设置的基础上将谱变量保存为稀疏格式
+    """
+    return {name: StorageProfile(profile.complevel, profile.shuffle, profile.fletcher32, profile.time_chunk,
+                                 profile.chunks, sparse=codes)
+            for name, profile in STORAGE_PROFILES.items()}
+
+
+def read_one_hour(filename):
+    """
+    读取文件中所有观测要素前一小时 (前60条记录) 的数据
+    """
+    with nc.Dataset(filename) as nc_obj:
+        obs_group = nc_obj.groups['observational_information']
+        for var in obs_group.variables.values():
+            var[:60]
+
+
+def benchmark(instruments, records):
+    # 存储设置名称: 各设备的存储设置
+    profiles = {
+        'none': {},
+        'deflate1': with_complevel(1),
+        'default': dict(STORAGE_PROFILES),
+        'deflate9': with_complevel(9),
+        'sparse': with_sparse(),
+    }
+    print(f'{"instrument":<10} {"profile":<10} {"write(s)":>9} {"size(MB)":>9} {"ratio":>7} {"read 1h(s)":>11}')
+    with tempfile.TemporaryDirectory() as base_dir:
+        for instrument_name in instruments:
+            field_info = get_field_info(instrument_name)
+            one_day_data = synthetic_day(instrument_name, field_info['obs_info_code'],
+                                         field_info['obs_info_nc_type'], records)
+            base_size = None
+            for profile_name, storage_profiles in profiles.items():
+                generator = NCGenerator(os.path.join(base_dir, profile_name), 'localhost', None, None, 'benchmark',
+                                        storage_profiles=storage_profiles)
+                begin = time.perf_counter()
+                filename = generator.generate_one_day_nc_file(instrument_name, one_day_data, **field_info)
+                write_time = time.perf_counter() - begin
+                size = os.path.getsize(filename)
+                base_size = base_size or size
+                begin = time.perf_counter()
+                read_one_hour(filename)
+                read_time = time.perf_counter() - begin
+                generator.mongodb.close_mongodb_client()
+                print(f'{instrument_name:<10} {profile_name:<10} {write_time:>9.3f} {size / 2 ** 20:>9.2f} '
+                      f'{size / base_size:>7.2f} {read_time:>11.4f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='nc(netCDF4)文件存储设置性能测试')
+    parser.add_argument('--instruments', default='AWS,FSD,MRD,RSD,YCCL_L2,RRD_Lraw',
+                        help='测试的设备名, 以逗号分隔')
+    parser.add_argument('--records', type=int, default=1440, help='一天的记录条数')
+    args = parser.parse_args()
+    benchmark(args.instruments.split(','), args.records)
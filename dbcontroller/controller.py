@@ -1,19 +1,113 @@
 # -*- coding:utf-8 -*-
+from datetime import datetime, timedelta
+from bson.codec_options import CodecOptions
+from bson.son import SON
+from bson.raw_bson import RawBSONDocument
+import os
+import threading
 import pymongo
+from instruments import get_time_code
+
+# 新建连接池的大小 (pymongo.MongoClient的maxPoolSize / minPoolSize), 可通过set_pool_size修改
+POOL_OPTIONS = {'maxPoolSize': 100, 'minPoolSize': 0}
+
+_clients = {}   # (IP地址, 端口, 用户名, 密码, 验证数据库): [MongoClient, 引用数, 已验证的(数据库, 用户名, 密码)集合]
+_clients_lock = threading.Lock()
+
+
+def set_pool_size(max_pool_size=100, min_pool_size=0):
+    """
+    设置连接池的大小, 只对之后新建的连接池生效
+
+    :param max_pool_size:   每个服务器的最大连接数, 默认为100
+    :param min_pool_size:   每个服务器保持的最小连接数, 默认为0
+    """
+    with _clients_lock:
+        POOL_OPTIONS.update(maxPoolSize=max_pool_size, minPoolSize=min_pool_size)
+
+
+def acquire_client(ip_address, port=27017, username=None, pwd=None, auth_source=None):
+    """
+    从进程内的连接池注册表获取MongoClient, (IP地址, 端口, 登录验证信息) 相同时共用同一个连接池.
+    带用户名时由MongoClient在建立每个连接时完成验证, 不再单独调用authenticate
+
+    :param ip_address:  MongoDB数据库服务器IP地址
+    :param port:        MongoDB数据库服务器端口，默认为27017
+    :param username:    登录验证的用户名，默认为空 (不验证)
+    :param pwd:         登录验证的密码，默认为空
+    :param auth_source: 登录验证的数据库，默认为空 ('admin')
+    :return:            pymongo.MongoClient
+    """
+    key = (ip_address, port, username, pwd, auth_source)
+    with _clients_lock:
+        entry = _clients.get(key)
+        if entry is None:
+            kwargs = dict(POOL_OPTIONS)
+            if username is not None:
+                kwargs.update(username=username, password=pwd, authSource=auth_source or 'admin')
+            client = pymongo.MongoClient('mongodb://' + ip_address + ':' + str(port) + '/', **kwargs)
+            entry = _clients[key] = [client, 0, set()]
+        entry[1] += 1
+        return entry[0]
+
+
+def release_client(ip_address, port=27017, username=None, pwd=None, auth_source=None):
+    """
+    释放acquire_client获取的MongoClient, 引用数为0时关闭连接池
+    """
+    key = (ip_address, port, username, pwd, auth_source)
+    with _clients_lock:
+        entry = _clients.get(key)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del _clients[key]
+            entry[0].close()
+
+
+def _reset_clients():
+    """
+    fork后的子进程中清空注册表: 从父进程继承的MongoClient不能在子进程中使用, 子进程需要重新建立连接池
+    """
+    global _clients_lock
+    _clients.clear()
+    _clients_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_clients)
 
 
 class MyMongodb:
-    def __init__(self, ip_address, port=27017):
+    def __init__(self, ip_address, port=27017, username=None, pwd=None, auth_source=None):
         """
-        初始化设置
+        初始化设置.
+        连接从进程内的连接池注册表获取, 多个MyMongodb (例如每台设备一个的NCGenerator、CSVGenerator) 共用同一个连接池
 
         :param ip_address:  MongoDB数据库服务器IP地址
         :param port:        MongoDB数据库服务器端口，默认为27017
+        :param username:    登录验证的用户名，默认为空 (不验证)
+        :param pwd:         登录验证的密码，默认为空
+        :param auth_source: 登录验证的数据库，默认为空 ('admin')
         """
         self.link = 'mongodb://' + ip_address + ':' + str(port) + '/'
-        self.client = pymongo.MongoClient(self.link)
+        self.client_key = (ip_address, port, username, pwd, auth_source)
+        self.pid = os.getpid()
+        self._client = acquire_client(*self.client_key)
+
+    @property
+    def client(self):
+        """
+        pymongo.MongoClient, fork后在子进程中第一次使用时重新获取
+        """
+        if self.pid != os.getpid():
+            self.pid = os.getpid()
+            self._client = acquire_client(*self.client_key)
+        return self._client
 
-    def get_collection_data(self, database_name, collection_name, username=None, pwd=None):
+    def get_collection_data(self, database_name, collection_name, username=None, pwd=None, fields=None,
+                            start=None, end=None, batch_size=None, raw=False):
         """
         获取MongoDB数据库指定集合的数据, 默认不进行验证.
         连接成功时返回集合数据, 该数据可通过for循环迭代, 也可使用list()转换为list类型
@@ -22,25 +116,276 @@ class MyMongodb:
         :param collection_name: 需要连接的MongoDB数据集合
         :param username:        登录验证的用户名，默认为空
         :param pwd:             登录验证的密码，默认为空
+        :param fields:          需要返回的字段代码列表，默认为空 (返回全部字段)；
+                                不为空时仅由服务器返回这些字段，不返回'_id'
+        :param start:           查询的起始时间 (包含), datetime类型，默认为空 (不限制)
+        :param end:             查询的结束时间 (不包含), datetime类型，默认为空 (不限制)
+        :param batch_size:      游标每批从服务器获取的记录条数，默认为空 (使用服务器默认值)
+        :param raw:             是否返回未解码的原始BSON记录 (bson.raw_bson.RawBSONDocument)，默认为False
         :return:                连接成功时返回MongoDB数据集合, 类型为pymongo.cursor.Cursor, 连接失败时抛出异常
         """
+        collection = self.get_collection(database_name, collection_name, username, pwd)
+        time_field = self.get_time_field(collection_name)
+        query = self.get_time_range_query(time_field, start, end)
+        projection = self.get_projection(fields)
+        if raw:
+            collection = collection.with_options(codec_options=CodecOptions(document_class=RawBSONDocument))
+        cursor = collection.find(query, projection=projection).sort(time_field)
+        if batch_size is not None:
+            cursor = cursor.batch_size(batch_size)
+        return cursor
+
+    def get_collection(self, database_name, collection_name, username=None, pwd=None):
+        """
+        连接MongoDB数据库指定集合, 默认不进行验证.
+
+        :param database_name:   需要连接的MongoDB数据库名称
+        :param collection_name: 需要连接的MongoDB数据集合
+        :param username:        登录验证的用户名，默认为空
+        :param pwd:             登录验证的密码，默认为空
+        :return:                连接成功时返回集合对象, 类型为pymongo.collection.Collection, 连接失败时抛出异常
+        """
         # noinspection PyBroadException
         try:
             database = self.client[database_name]
-            database.authenticate(username, pwd)
+            self.authenticate(database, username, pwd)
             collection = database[collection_name]
             if collection:
                 print(f'Mongodb collection connect SUCCESS: \n'
                       f'\tdatabase_name: {database_name}\n\tcollection_name: {collection_name}')
-                if collection_name == 'MRD_VQ':
-                    return collection.find().sort('Datetime_301')
-                else:
-                    return collection.find().sort('Datetime')
+                return collection
         except Exception as e:
             raise Exception("Mongodb collection connect ERROR : " + str(e))
 
+    def get_distinct_days(self, database_name, collection_name, username=None, pwd=None, start=None, end=None):
+        """
+        通过聚合查询获取集合中存在观测记录的日期 (按时间字段的年月日分组), 结果按时间升序排列
+
+        :param database_name:   需要连接的MongoDB数据库名称
+        :param collection_name: 需要连接的MongoDB数据集合
+        :param username:        登录验证的用户名，默认为空
+        :param pwd:             登录验证的密码，默认为空
+        :param start:           查询的起始时间 (包含), datetime类型，默认为空 (不限制)
+        :param end:             查询的结束时间 (不包含), datetime类型，默认为空 (不限制)
+        :return:                每个观测日0时的datetime列表
+        """
+        collection = self.get_collection(database_name, collection_name, username, pwd)
+        time_field = self.get_time_field(collection_name)
+        # 时间字段可能存在'Nan'等非时间类型的值, 只对时间类型的记录分组
+        query = {time_field: {'$type': 'date'}}
+        query[time_field].update(self.get_time_range_query(time_field, start, end).get(time_field, {}))
+        pipeline = [
+            {'$match': query},
+            {'$group': {'_id': {'$dateToString': {'format': '%Y-%m-%d', 'date': '$' + time_field}}}},
+            {'$sort': {'_id': 1}}
+        ]
+        return [datetime.strptime(d['_id'], '%Y-%m-%d') for d in collection.aggregate(pipeline, allowDiskUse=True)]
+
+    def get_sample_days(self, database_name, collection_name, username=None, pwd=None, size=1, start=None, end=None,
+                        is_random=False):
+        """
+        获取用于生成样例文件的观测日 (只查询少量记录, 不遍历或排序整个集合).
+        默认取最早的size个观测日: 每次按时间索引查询下一个观测日的第一条记录 (find_one + sort, 只扫描一条索引);
+        is_random为True时通过$sample随机抽取记录, 取其所在的观测日 (不超过size个, 不同记录可能位于同一观测日)
+
+        :param database_name:   需要连接的MongoDB数据库名称
+        :param collection_name: 需要连接的MongoDB数据集合
+        :param username:        登录验证的用户名，默认为空
+        :param pwd:             登录验证的密码，默认为空
+        :param size:            观测日数, 默认为1
+        :param start:           查询的起始时间 (包含), datetime类型，默认为空 (不限制)
+        :param end:             查询的结束时间 (不包含), datetime类型，默认为空 (不限制)
+        :param is_random:       是否随机抽取观测日, 默认为False
+        :return:                每个观测日0时的datetime列表 (按时间升序排列)
+        """
+        collection = self.get_collection(database_name, collection_name, username, pwd)
+        time_field = self.get_time_field(collection_name)
+        projection = {time_field: 1, '_id': 0}
+        if is_random:
+            query = {time_field: {'$type': 'date'}}
+            query[time_field].update(self.get_time_range_query(time_field, start, end).get(time_field, {}))
+            pipeline = [
+                {'$match': query},
+                {'$sample': {'size': size}},
+                {'$project': projection}
+            ]
+            days = {datetime(d[time_field].year, d[time_field].month, d[time_field].day)
+                    for d in collection.aggregate(pipeline, allowDiskUse=True)}
+            return sorted(days)
+        days = []
+        while len(days) < size:
+            query = {time_field: {'$type': 'date'}}
+            query[time_field].update(self.get_time_range_query(time_field, start, end).get(time_field, {}))
+            data = collection.find_one(query, projection=projection, sort=[(time_field, pymongo.ASCENDING)])
+            if data is None:
+                break
+            day = datetime(data[time_field].year, data[time_field].month, data[time_field].day)
+            days.append(day)
+            start = day + timedelta(days=1)  # 下一次从下一个观测日开始查询
+        return days
+
+    def get_fingerprint(self, database_name, collection_name, username=None, pwd=None, start=None, end=None):
+        """
+        获取时间范围内数据的指纹 (记录条数和最大的'_id'), 用于判断本地缓存是否与数据库一致
+
+        :param database_name:   需要连接的MongoDB数据库名称
+        :param collection_name: 需要连接的MongoDB数据集合
+        :param username:        登录验证的用户名，默认为空
+        :param pwd:             登录验证的密码，默认为空
+        :param start:           查询的起始时间 (包含), datetime类型，默认为空 (不限制)
+        :param end:             查询的结束时间 (不包含), datetime类型，默认为空 (不限制)
+        :return:                [记录条数, 最大的'_id'的字符串], 没有记录时最大的'_id'为None
+        """
+        collection = self.get_collection(database_name, collection_name, username, pwd)
+        query = self.get_time_range_query(self.get_time_field(collection_name), start, end)
+        count = collection.count_documents(query)
+        last = collection.find_one(query, projection={'_id': 1}, sort=[('_id', pymongo.DESCENDING)])
+        return [count, str(last['_id']) if last is not None else None]
+
+    def ensure_time_index(self, database_name, collection_name, username=None, pwd=None):
+        """
+        检查集合是否有以时间字段开头的索引 (按时间范围查询和排序所需), 没有时在后台创建 {时间字段: 1} 索引.
+        时间范围查询、按天聚合和样例观测日查询的条件都只包含时间字段, 以时间字段开头的单字段索引即可满足
+
+        :param database_name:   需要连接的MongoDB数据库名称
+        :param collection_name: 需要连接的MongoDB数据集合
+        :param username:        登录验证的用户名，默认为空
+        :param pwd:             登录验证的密码，默认为空
+        :return:                索引名称
+        """
+        collection = self.get_collection(database_name, collection_name, username, pwd)
+        time_field = self.get_time_field(collection_name)
+        for name, info in collection.index_information().items():
+            if info['key'][0][0] == time_field:
+                return name
+        print(f'Mongodb index missing, creating: {collection_name}.{time_field}')
+        return collection.create_index([(time_field, pymongo.ASCENDING)])
+
+    def check_query_plan(self, database_name, collection_name, username=None, pwd=None, fields=None, start=None,
+                         end=None):
+        """
+        获取导出查询 (与get_collection_data相同的查询条件、投影和排序) 的执行计划并打印.
+        只使用queryPlanner模式 (不执行查询), 计划中有全集合扫描 (COLLSCAN) 或内存排序 (SORT) 时打印警告
+
+        :param database_name:   需要连接的MongoDB数据库名称
+        :param collection_name: 需要连接的MongoDB数据集合
+        :param username:        登录验证的用户名，默认为空
+        :param pwd:             登录验证的密码，默认为空
+        :param fields:          需要返回的字段代码列表，默认为空 (返回全部字段)
+        :param start:           查询的起始时间 (包含), datetime类型，默认为空 (不限制)
+        :param end:             查询的结束时间 (不包含), datetime类型，默认为空 (不限制)
+        :return:                获胜计划中各阶段的名称列表 (从外到内), 例如 ['PROJECTION_SIMPLE', 'FETCH', 'IXSCAN']
+        """
+        collection = self.get_collection(database_name, collection_name, username, pwd)
+        time_field = self.get_time_field(collection_name)
+        command = SON([('find', collection_name),
+                       ('filter', self.get_time_range_query(time_field, start, end)),
+                       ('sort', {time_field: pymongo.ASCENDING})])
+        projection = self.get_projection(fields)
+        if projection is not None:
+            command['projection'] = projection
+        result = collection.database.command('explain', command, verbosity='queryPlanner')
+        stages = self.get_plan_stages(result['queryPlanner']['winningPlan'])
+        print(f'Mongodb query plan: {collection_name}: {" <- ".join(stages)}')
+        if 'COLLSCAN' in stages:
+            print(f'WARNING: query on {collection_name} scans the whole collection (COLLSCAN), '
+                  f'create an index on {time_field} with ensure_time_index()')
+        if 'SORT' in stages:
+            print(f'WARNING: query on {collection_name} sorts {time_field} in memory (SORT), '
+                  f'large collections may exceed the sort memory limit')
+        return stages
+
+    @staticmethod
+    def get_plan_stages(plan):
+        """
+        获取执行计划中各阶段的名称 (深度优先, 从外到内)
+
+        :param plan:    执行计划 (explain结果中的winningPlan)
+        :return:        阶段名称列表
+        """
+        stages = []
+        if isinstance(plan, dict):
+            if 'stage' in plan:
+                stages.append(plan['stage'])
+            for value in plan.values():
+                stages.extend(MyMongodb.get_plan_stages(value))
+        elif isinstance(plan, list):
+            for value in plan:
+                stages.extend(MyMongodb.get_plan_stages(value))
+        return stages
+
+    def authenticate(self, database, username=None, pwd=None):
+        """
+        登录验证, 每个连接池对同一 (数据库, 用户名, 密码) 只验证一次.
+        用户名为空, 或与创建连接池时的验证信息相同 (已由MongoClient验证) 时不再验证
+
+        :param database:    pymongo.database.Database
+        :param username:    登录验证的用户名，默认为空
+        :param pwd:         登录验证的密码，默认为空
+        """
+        if username is None:
+            return
+        ip_address, port, client_username, client_pwd, auth_source = self.client_key
+        if (username, pwd) == (client_username, client_pwd) and database.name == (auth_source or 'admin'):
+            return
+        client = self.client
+        with _clients_lock:
+            entry = _clients.get(self.client_key)
+            authenticated = entry[2] if entry is not None and entry[0] is client else set()
+            if (database.name, username, pwd) in authenticated:
+                return
+            database.authenticate(username, pwd)
+            authenticated.add((database.name, username, pwd))
+
+    @staticmethod
+    def get_time_field(collection_name):
+        """
+        获取集合中用于排序和按时间查询的时间字段
+
+        :param collection_name: MongoDB数据集合名称
+        :return:                时间字段代码, 由设备注册表确定 (MRD为'Datetime_301'), 其他集合为'Datetime'
+        """
+        if collection_name.endswith('_VQ'):
+            return get_time_code(collection_name[:-len('_VQ')])
+        return 'Datetime'
+
+    @staticmethod
+    def get_time_range_query(time_field, start=None, end=None):
+        """
+        生成按时间范围查询的条件, 区间为 [start, end)
+
+        :param time_field:  时间字段代码
+        :param start:       起始时间 (包含), 为空时不限制
+        :param end:         结束时间 (不包含), 为空时不限制
+        :return:            查询条件字典
+        """
+        time_range = {}
+        if start is not None:
+            time_range['$gte'] = start
+        if end is not None:
+            time_range['$lt'] = end
+        if len(time_range) == 0:
+            return {}
+        return {time_field: time_range}
+
+    @staticmethod
+    def get_projection(fields):
+        """
+        根据字段代码列表生成MongoDB查询的投影 (projection)
+
+        :param fields:  需要返回的字段代码列表, 为空时返回None (即返回全部字段)
+        :return:        投影字典, 例如 {'Datetime': 1, 'Temp': 1, '_id': 0}
+        """
+        if fields is None:
+            return None
+        projection = {field: 1 for field in fields}
+        projection['_id'] = 0
+        return projection
+
     def close_mongodb_client(self):
         """
-        关闭MongoDB数据库连接
+        释放MongoDB数据库连接, 共用该连接池的MyMongodb全部释放后关闭连接池
         """
-        self.client.close()
+        if self._client is not None and self.pid == os.getpid():
+            release_client(*self.client_key)
+        self._client = None
@@ -1,2 +1,4 @@
 # -*- coding:utf-8 -*-
 from .reader import *
+from .ncreader import *
+from .parquetreader import *
@@ -0,0 +1,109 @@
+# -*- coding:utf-8 -*-
+import netCDF4 as nc
+import numpy as np
+
+
+class NCReader:
+    def __init__(self, filename):
+        """
+        传入文件名参数
+        :param filename: 文件名
+        """
+        self.filename = filename
+
+    def read(self):
+        """
+        读取nc文件，并且返回文件头信息和观测数据, 稀疏格式保存的谱变量还原为稠密数组
+        :return: 包含文件头和观测数据的字典，其中文件头是字典 (组名: {变量名: 值})、观测数据是字典 (变量名: numpy.ndarray)
+        """
+        with nc.Dataset(self.filename) as nc_obj:
+            header_data = {}
+            for name, group in nc_obj.groups['file_information'].groups.items():
+                header_data[name] = {code: self.scalar_or_list(var[...]) for code, var in group.variables.items()}
+            obs_group = nc_obj.groups['observational_information']
+            obs_data = {code: self.read_variable(code, obs_group) for code, var in obs_group.variables.items()
+                        if not self.is_index_variable(var)}
+        return {'header': header_data, 'obs': obs_data}
+
+    @staticmethod
+    def scalar_or_list(value):
+        """
+        文件头变量的值, 数组转换为列表
+        """
+        return value.tolist() if isinstance(value, np.ndarray) else value
+
+    @staticmethod
+    def is_index_variable(var):
+        """
+        是否为稀疏格式的索引变量 (CF规范"按收集压缩"的索引变量, 带compress属性)
+        :param var: netCDF4.Variable
+        :return: bool
+        """
+        return 'compress' in var.ncattrs()
+
+    def read_variable(self, code, obs_group=None):
+        """
+        读取一个观测要素, 稀疏格式 (见filewriter.write_array_variable) 的变量按索引还原为稠密数组, 未保存的元素为0
+        :param code: 观测要素代码
+        :param obs_group: 观测信息组 (netCDF4.Group), 为空时打开文件读取
+        :return: numpy.ndarray
+        """
+        if obs_group is None:
+            with nc.Dataset(self.filename) as nc_obj:
+                return self.read_variable(code, nc_obj.groups['observational_information'])
+        var = obs_group.variables[code]
+        sparse = self.read_sparse(code, obs_group)
+        if sparse is None:
+            return var[:]
+        dims, shape, coords, values = sparse
+        dense = np.zeros(shape, dtype=values.dtype)
+        dense[coords] = values
+        return dense
+
+    def read_sparse(self, code, obs_group=None):
+        """
+        读取一个稀疏格式的观测要素, 不还原为稠密数组 (例如只查找有降水的时刻)
+        :param code: 观测要素代码
+        :param obs_group: 观测信息组 (netCDF4.Group), 为空时打开文件读取
+        :return: (维度名, 稠密数组的形状, 各维度的下标数组 (tuple), 非0元素的值), 不是稀疏格式时返回None
+        """
+        if obs_group is None:
+            with nc.Dataset(self.filename) as nc_obj:
+                return self.read_sparse(code, nc_obj.groups['observational_information'])
+        var = obs_group.variables[code]
+        index_var = self.index_variable(var, obs_group)
+        if index_var is None:
+            return None
+        dims = tuple(index_var.compress.split())
+        shape = tuple(len(obs_group.dimensions[dim]) for dim in dims)
+        coords = np.unravel_index(np.asarray(index_var[:], dtype=np.int64), shape)
+        return dims, shape, coords, np.asarray(var[:])
+
+    def index_variable(self, var, obs_group):
+        """
+        稀疏格式的观测要素的索引变量
+        :param var: 观测要素变量 (netCDF4.Variable)
+        :param obs_group: 观测信息组 (netCDF4.Group)
+        :return: 索引变量 (netCDF4.Variable), 不是稀疏格式时返回None
+        """
+        if len(var.dimensions) != 1 or var.dimensions[0] not in obs_group.variables:
+            return None
+        index_var = obs_group.variables[var.dimensions[0]]
+        return index_var if self.is_index_variable(index_var) and index_var.name != var.name else None
+
+    def nonzero_times(self, code):
+        """
+        观测要素不为0 (例如有降水粒子) 的时刻, 稀疏格式的变量只读取索引, 不还原为稠密数组
+        :param code: 观测要素代码
+        :return: 时间维度的下标数组 (按时间排序, 不重复)
+        """
+        with nc.Dataset(self.filename) as nc_obj:
+            obs_group = nc_obj.groups['observational_information']
+            var = obs_group.variables[code]
+            index_var = self.index_variable(var, obs_group)
+            if index_var is not None:
+                # 时间维度为第一个维度, 按行展开的下标除以其他维度的元素个数即为时间下标
+                size = int(np.prod([len(obs_group.dimensions[dim]) for dim in index_var.compress.split()[1:]]))
+                return np.unique(np.asarray(index_var[:], dtype=np.int64) // size)
+            values = np.asarray(obs_group.variables[code][:])
+            return np.flatnonzero(values.reshape(len(values), -1).any(axis=1))
@@ -0,0 +1,71 @@
+# -*- coding:utf-8 -*-
+from datetime import datetime
+import glob
+import os
+from instruments import get_time_code
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # 未安装pyarrow时不能读取Parquet文件
+    pq = None
+
+
+class ParquetReader:
+    def __init__(self, filename):
+        """
+        传入文件名参数
+        :param filename: 文件名
+        """
+        self.filename = filename
+
+    def read(self, columns=None):
+        """
+        读取Parquet文件，并且返回文件头信息和观测数据
+        :param columns: 读取的观测要素代码, 默认为空 (全部读取)
+        :return: 包含文件头和观测数据的字典，其中文件头是字典、观测数据是pandas.Dataframe (数组为numpy.ndarray)
+        """
+        table = pq.read_table(self.filename, columns=columns)
+        return {'header': read_parquet_header(table.schema), 'obs': table.to_pandas()}
+
+
+def read_parquet_header(schema):
+    """
+    读取Parquet文件的文件头 (文件的键值元数据)
+    :param schema: pyarrow.Schema
+    :return: 文件头字典 (字段代码: 值)
+    """
+    metadata = schema.metadata or {}
+    return {key.decode('utf-8'): value.decode('utf-8') for key, value in metadata.items()
+            if not key.startswith(b'ARROW:') and key != b'pandas'}
+
+
+def read_parquet_files(base_dir, instrument_name, start=None, end=None, columns=None):
+    """
+    读取一个设备一段时间 (例如几个月) 的Parquet文件, 合并为一个pandas.Dataframe.
+    先按 "base_dir/instrument_name/year/month" 目录选取时间范围内的文件,
+    再按时间字段过滤记录 (利用文件中的列统计信息跳过时间范围外的行组)
+
+    :param base_dir: Parquet文件存储根目录
+    :param instrument_name: 设备名
+    :param start: 起始时间 (包含), datetime类型，默认为空
+    :param end: 结束时间 (不包含), datetime类型，默认为空
+    :param columns: 读取的观测要素代码, 默认为空 (全部读取)
+    :return: pandas.Dataframe, 没有文件时返回None
+    """
+    filenames = []
+    for filename in sorted(glob.glob(os.path.join(base_dir, instrument_name, '*', '*', '*.parquet'))):
+        year, month = filename.split(os.sep)[-3:-1]
+        month_start = datetime(int(year), int(month), 1)
+        month_end = datetime(int(year) + int(month) // 12, int(month) % 12 + 1, 1)
+        if (start is None or month_end > start) and (end is None or month_start < end):
+            filenames.append(filename)
+    if not filenames:
+        return None
+    time_code = get_time_code(instrument_name)
+    filters = []
+    if start is not None:
+        filters.append((time_code, '>=', start))
+    if end is not None:
+        filters.append((time_code, '<', end))
+    dataset = pq.ParquetDataset(filenames, filters=filters or None)
+    return dataset.read(columns=columns).to_pandas()
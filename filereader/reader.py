@@ -2,304 +2,11 @@
 import csv
 import pandas as pd
 import numpy as np
+from instruments import INSTRUMENTS, get_instrument, find_instrument
 
-header_code_dict = {
-    'AWS': [
-        'Station_name',
-        'Country',
-        'Province',
-        'City',
-        'County',
-        'Station_ID',
-        'LAT',
-        'LON',
-        'ALT',
-        'Station_type',
-        'Station_level',
-        'Admi_code_CHN',
-        'Mete_data_code',
-        'Manufacturer_model',
-        'Software_version',
-        'Pres_sens_HGT',
-        'Temp_RH_sens_HGT',
-        'Wind_sens_HGT',
-        'Data_level',
-        'Timezone',
-        'Time_resolution',
-        'Obse_begi_DT',
-        'Obse_end_DT',
-        'Data_crea_DT',
-        'Dataset_version'
-    ],
-    'AERM': [
-        'Station_name',
-        'Country',
-        'Province',
-        'City',
-        'County',
-        'Station_ID',
-        'LAT',
-        'LON',
-        'ALT',
-        'Station_type',
-        'Station_level',
-        'Admi_code_CHN',
-        'Mete_data_code',
-        'Manufacturer_model',
-        'Software_version',
-        'AERM_sens_HGT',
-        'Data_level',
-        'Timezone',
-        'Time_resolution',
-        'Obse_begi_DT',
-        'Obse_end_DT',
-        'Data_crea_DT',
-        'Dataset_version'
-    ],
-    'VIS': [
-        'Station_name',
-        'Country',
-        'Province',
-        'City',
-        'County',
-        'Station_ID',
-        'LAT',
-        'LON',
-        'ALT',
-        'Station_type',
-        'Station_level',
-        'Admi_code_CHN',
-        'Mete_data_code',
-        'Manufacturer_model',
-        'Software_version',
-        'VIS_sens_HGT',
-        'Data_level',
-        'Timezone',
-        'Time_resolution',
-        'Obse_begi_DT',
-        'Obse_end_DT',
-        'Data_crea_DT',
-        'Dataset_version'
-    ],
-    'YCCL_L3': [
-        'Station_name',
-        'Country',
-        'Province',
-        'City',
-        'County',
-        'Station_ID',
-        'LAT',
-        'LON',
-        'ALT',
-        'Station_type',
-        'Station_level',
-        'Admi_code_CHN',
-        'Mete_data_code',
-        'Manufacturer_model',
-        'Software_version',
-        'YCCL_sens_HGT',
-        'Data_level',
-        'Timezone',
-        'Time_resolution',
-        'Obse_begi_DT',
-        'Obse_end_DT',
-        'Data_crea_DT',
-        'Dataset_version'
-    ],
-    'RSD': [
-        'Station_name',
-        'Country',
-        'Province',
-        'City',
-        'County',
-        'Station_ID',
-        'LAT',
-        'LON',
-        'ALT',
-        'Station_type',
-        'Station_level',
-        'Admi_code_CHN',
-        'Mete_data_code',
-        'Manufacturer_model',
-        'Software_version',
-        'RSD_sens_HGT',
-        'Data_level',
-        'Timezone',
-        'Time_resolution',
-        'Numb_part_diam_clas',
-        'Numb_part_velo_clas',
-        'Part_diam_clas',
-        'Part_velo_clas',
-        'Obse_begi_DT',
-        'Obse_end_DT',
-        'Data_crea_DT',
-        'Dataset_version'
-    ],
-    'MRD': [
-        'Station_name',
-        'Country',
-        'Province',
-        'City',
-        'County',
-        'Station_ID',
-        'LAT',
-        'LON',
-        'ALT',
-        'Station_type',
-        'Station_level',
-        'Admi_code_CHN',
-        'Mete_data_code',
-        'Manufacturer_model',
-        'Software_version',
-        'MRD_sens_HGT',
-        'Data_level',
-        'Timezone',
-        'HGT',
-        'Obse_begi_DT',
-        'Obse_end_DT',
-        'Data_crea_DT',
-        'Dataset_version'
-    ],
-    'YCCL_L2': [
-        'Station_name',
-        'Country',
-        'Province',
-        'City',
-        'County',
-        'Station_ID',
-        'LAT',
-        'LON',
-        'ALT',
-        'Station_type',
-        'Station_level',
-        'Admi_code_CHN',
-        'Mete_data_code',
-        'Manufacturer_model',
-        'Software_version',
-        'YCCL_sens_HGT',
-        'Date_level',
-        'Timezone',
-        'Time_resolution',
-        'Obse_begi_DT',
-        'Obse_end_DT',
-        'Data_crea_DT',
-        'Dataset_version'
-    ],
-    'FSD': [
-        'Station_name',
-        'Country',
-        'Province',
-        'City',
-        'County',
-        'Station_ID',
-        'LAT',
-        'LON',
-        'ALT',
-        'Station_type',
-        'Station_level',
-        'Admi_code_CHN',
-        'Mete_data_code',
-        'Manufacturer_model',
-        'Software_version',
-        'FSD_sens_HGT',
-        'Data_level',
-        'Timezone',
-        'Time_resolution',
-        'Sample_area',
-        'Channel_count',
-        'Size_each_bin',
-        'Obse_begi_DT',
-        'Obse_end_DT',
-        'Data_crea_DT',
-        'Dataset_version'
-    ],
-    'PRE': [
-        'Station_name',
-        'Country',
-        'Province',
-        'City',
-        'County',
-        'Station_ID',
-        'LAT',
-        'LON',
-        'ALT',
-        'Station_type',
-        'Station_level',
-        'Admi_code_CHN',
-        'Mete_data_code',
-        'Manufacturer_model',
-        'Software_version',
-        'Prec_sens_HGT',
-        'Data_level',
-        'Timezone',
-        'Time_resolution',
-        'Obse_begi_DT',
-        'Obse_end_DT',
-        'Data_crea_DT',
-        'Dataset_version'
-    ],
-    'RRD_Lraw': [
-        'Station_name',
-        'Country',
-        'Province',
-        'City',
-        'County',
-        'Station_ID',
-        'LAT',
-        'LON',
-        'ALT',
-        'Station_type',
-        'Station_level',
-        'Admi_code_CHN',
-        'Mete_data_code',
-        'Manufacturer_model',
-        'RRD_sens_HGT',
-        'Service_version',
-        'Device_version',
-        'Devi_seri_numb',
-        'Bandwidth',
-        'Calibration_constant',
-        'MMR_data_qual',
-        'Data_level',
-        'Timezone',
-        'Time_resolution',
-        'Obse_begi_DT',
-        'Obse_end_DT',
-        'Data_crea_DT',
-        'Dataset_version'
-    ],
-    'RRD_Lpro_and_Lave': [
-        'Station_name',
-        'Country',
-        'Province',
-        'City',
-        'County',
-        'Station_ID',
-        'LAT',
-        'LON',
-        'ALT',
-        'Station_type',
-        'Station_level',
-        'Admi_code_CHN',
-        'Mete_data_code',
-        'Manufacturer_model',
-        'RRD_sens_HGT',
-        'Service_version',
-        'Device_version',
-        'Devi_seri_numb',
-        'Calibration_constant',
-        'MMR_data_qual',
-        'Time_AVG',
-        'Sampling_rate',
-        'Data_level',
-        'Timezone',
-        'Time_resolution',
-        'Obse_begi_DT',
-        'Obse_end_DT',
-        'Data_crea_DT',
-        'Dataset_version'
-    ]
-}
+# 设备名: 文件头字段代码 (由设备注册表生成)
+header_code_dict = {name: spec.header_code for name, spec in INSTRUMENTS.items()}
+header_code_dict['RRD_Lpro_and_Lave'] = INSTRUMENTS['RRD_Lave'].header_code
 
 
 class CSVReader:
@@ -315,25 +22,59 @@ class CSVReader:
         读取csv文件，并且返回文件头信息和观测数据
         :return: 包含文件头和观测数据的字典
         """
-        instrument_name = self.filename.split('/')[-1].split('_')[5]
-        if instrument_name == 'YCCL' or instrument_name == 'RRD':
-            instrument_name += '_' + self.filename.split('/')[-1].split('_')[7]
-        if instrument_name in ['AWS', 'AERM', 'VIS', 'YCCL_L3']:
-            return self.one_dime_csv_read(instrument_name)
-        elif instrument_name == 'RSD':
-            return self.rsd_csv_read()
-        elif instrument_name == 'MRD':
-            return self.mrd_csv_read()
-        elif instrument_name == 'YCCL_L2':
-            return self.yccl_l2_csv_read()
-        elif instrument_name == 'FSD':
-            return self.fsd_csv_read()
-        elif instrument_name == 'PRE':
-            return self.pre_csv_read()
-        elif instrument_name == 'RRD_Lraw':
-            return self.rrd_lraw_csv_read()
-        elif instrument_name == 'RRD_Lpro' or instrument_name == 'RRD_Lave':
-            return self.rrd_lpro_and_lave_csv_read()
+        # 由文件名中的资料代码和数据级别查找设备, 使用设备注册的读取函数
+        name_parts = self.filename.split('/')[-1].split('_')
+        spec = find_instrument(name_parts[5], name_parts[7])
+        if spec is None:
+            return None
+        return getattr(self, spec.csv_reader)(*spec.csv_reader_args)
+
+    def read_header(self, spec, header_values):
+        """
+        将文件头的值与设备的文件头字段代码对应, 以空格分隔的列表值拆分为列表
+        :param spec: 设备 (InstrumentSpec)
+        :param header_values: 文件头的值
+        :return: 文件头字典
+        """
+        return {code: value.split(' ') if code in spec.header_array_codes else value
+                for code, value in zip(spec.header_code, header_values)}
+
+    def table_csv_read(self, instrument_name):
+        """
+        每条记录为一行的csv文件的读取, 由多列组成的观测要素 (列名后面的列名为空) 读取为numpy.ndarray.
+        每个文件只根据列名生成一次读取计划 (每个观测要素的列范围和数组形状), 之后逐行按计划取值
+        :param instrument_name: 设备名
+        :return: 包含文件头和观测数据的字典，其中文件头是字典、观测数据数pandas.Dataframe, 多维数据是numpy.ndarray
+        """
+        spec = get_instrument(instrument_name)
+        with open(self.filename, encoding='utf-8') as f:
+            reader = csv.reader(f)
+            header_values = next(reader)
+            obs_codes = next(reader)
+            obs_values = list(reader)
+        header_data = self.read_header(spec, header_values)
+        plan = []   # (起始列, 结束列, 数组形状), 单列观测要素的结束列为None
+        for j, code in enumerate(obs_codes):
+            if code in spec.csv_array_shapes:
+                end = j + 1
+                while end < len(obs_codes) and obs_codes[end] == '':
+                    end += 1
+                plan.append((j, end, spec.csv_array_shapes[code]))
+            elif code != '':
+                plan.append((j, None, None))
+        obs_data = []
+        for row in obs_values:
+            one_row_values = []
+            for begin, end, shape in plan:
+                if end is None:
+                    one_row_values.append(row[begin])
+                elif shape is None:
+                    one_row_values.append(np.array(row[begin:end]))
+                else:
+                    one_row_values.append(np.array(row[begin:end]).reshape(shape))
+            obs_data.append(one_row_values)
+        obs_data = pd.DataFrame(obs_data, columns=[code for code in obs_codes if code != ''])
+        return {'header': header_data, 'obs': obs_data}
 
     def one_dime_csv_read(self, instrument_name):
         """
@@ -341,7 +82,7 @@ class CSVReader:
         :param instrument_name: 设备名
         :return: 包含文件头和观测数据的字典，其中文件头是字典、观测数据数pandas.Dataframe
         """
-        header_code = header_code_dict[instrument_name]
+        spec = get_instrument(instrument_name)
         obs_values = []
         with open(self.filename) as f:
             reader = csv.reader(f)
@@ -349,9 +90,7 @@ class CSVReader:
             obs_codes = next(reader)
             for row in reader:
                 obs_values.append(row)
-        header_data = {}
-        for i in range(len(header_values)):
-            header_data.update({header_code[i]: header_values[i]})
+        header_data = self.read_header(spec, header_values)
         obs_data = pd.DataFrame(obs_values, columns=obs_codes)
         return {'header': header_data, 'obs': obs_data}
 
@@ -360,165 +99,35 @@ class CSVReader:
         RSD设备的文件读取
         :return: 包含文件头和观测数据的字典，其中文件头是字典、观测数据数pandas.Dataframe, 多维数据是numpy.ndarray
         """
-        header_code = header_code_dict['RSD']
-        obs_values = []
-        with open(self.filename, encoding='utf-8') as f:
-            reader = csv.reader(f)
-            header_values = next(reader)
-            obs_codes = next(reader)
-            for row in reader:
-                obs_values.append(row)
-        header_data = {}
-        for i in range(len(header_values)):
-            if header_code[i] == 'Part_diam_clas' or header_code[i] == 'Part_velo_clas':
-                header_data.update({header_code[i]: header_values[i].split(' ')})
-            else:
-                header_data.update({header_code[i]: header_values[i]})
-        obs_data = []
-        true_obs_codes = []
-        for code in obs_codes:
-            if code != '':
-                true_obs_codes.append(code)
-        for i in range(len(obs_values)):
-            one_day_values = []
-            one_day_prec_spec_value = []
-            for j in range(len(obs_codes)):
-                if obs_codes[j] == 'Prec_spec' or obs_codes[j] == '':
-                    one_day_prec_spec_value.append(obs_values[i][j])
-                elif obs_codes[j] == 'Q_data':
-                    one_day_values.append(np.array(one_day_prec_spec_value).reshape(22, 20))
-                    one_day_values.append(obs_values[i][j])
-                else:
-                    one_day_values.append(obs_values[i][j])
-            obs_data.append(one_day_values)
-        obs_data = pd.DataFrame(obs_data, columns=true_obs_codes)
-        return {'header': header_data, 'obs': obs_data}
+        return self.table_csv_read('RSD')
 
     def mrd_csv_read(self):
         """
         MRD设备的文件读取
         :return: 包含文件头和观测数据的字典，其中文件头是字典、观测数据数pandas.Dataframe, 多维数据是numpy.ndarray
         """
-        header_code = header_code_dict['MRD']
-        obs_values = []
-        with open(self.filename, encoding='utf-8') as f:
-            reader = csv.reader(f)
-            header_values = next(reader)
-            obs_codes = next(reader)
-            for row in reader:
-                obs_values.append(row)
-        header_data = {}
-        for i in range(len(header_values)):
-            if header_code[i] == 'HGT':
-                header_data.update({header_code[i]: header_values[i].split(' ')})
-            else:
-                header_data.update({header_code[i]: header_values[i]})
-        obs_data = []
-        true_obs_codes = []
-        for code in obs_codes:
-            if code != '':
-                true_obs_codes.append(code)
-        for i in range(len(obs_values)):
-            one_day_values = []
-            one_day_multi_dime_value = []
-            for j in range(len(obs_codes)):
-                if obs_codes[j] == 'Temp_prof' or obs_codes[j] == 'VAP_prof' or \
-                        obs_codes[j] == 'LWC_prof' or obs_codes[j] == 'RH_prof' or obs_codes[j] == '':
-                    one_day_multi_dime_value.append(obs_values[i][j])
-                elif obs_codes[j] == 'Datetime_402' or obs_codes[j] == 'Datetime_403' or \
-                        obs_codes[j] == 'Datetime_404' or obs_codes[j] == 'Q_Temp_ambi':
-                    one_day_values.append(np.array(one_day_multi_dime_value))
-                    one_day_multi_dime_value.clear()
-                    one_day_values.append(obs_values[i][j])
-                else:
-                    one_day_values.append(obs_values[i][j])
-            obs_data.append(one_day_values)
-        obs_data = pd.DataFrame(obs_data, columns=true_obs_codes)
-        return {'header': header_data, 'obs': obs_data}
+        return self.table_csv_read('MRD')
 
     def yccl_l2_csv_read(self):
         """
         云高仪设备二级数据的读取
         :return: 包含文件头和观测数据的字典，其中文件头是字典、观测数据数pandas.Dataframe, 多维数据是numpy.ndarray
         """
-        header_code = header_code_dict['YCCL_L2']
-        obs_values = []
-        with open(self.filename, encoding='utf-8') as f:
-            reader = csv.reader(f)
-            header_values = next(reader)
-            obs_codes = next(reader)
-            for row in reader:
-                obs_values.append(row)
-        header_data = {}
-        for i in range(len(header_values)):
-            header_data.update({header_code[i]: header_values[i]})
-        obs_data = []
-        true_obs_codes = []
-        for code in obs_codes:
-            if code != '':
-                true_obs_codes.append(code)
-        for i in range(len(obs_values)):
-            one_day_values = []
-            one_day_multi_dime_value = []
-            for j in range(len(obs_codes)):
-                if obs_codes[j] == 'BS_prof' or obs_codes[j] == '':
-                    one_day_multi_dime_value.append(obs_values[i][j])
-                elif obs_codes[j] == 'Q_BS_prof':
-                    one_day_values.append(np.array(one_day_multi_dime_value))
-                    one_day_multi_dime_value.clear()
-                    one_day_values.append(obs_values[i][j])
-                else:
-                    one_day_values.append(obs_values[i][j])
-            obs_data.append(one_day_values)
-        obs_data = pd.DataFrame(obs_data, columns=true_obs_codes)
-        return {'header': header_data, 'obs': obs_data}
+        return self.table_csv_read('YCCL_L2')
 
     def fsd_csv_read(self):
         """
         FSD设备数据的读取
         :return: 包含文件头和观测数据的字典，其中文件头是字典、观测数据数pandas.Dataframe, 多维数据是numpy.ndarray
         """
-        header_code = header_code_dict['FSD']
-        obs_values = []
-        with open(self.filename, encoding='utf-8') as f:
-            reader = csv.reader(f)
-            header_values = next(reader)
-            obs_codes = next(reader)
-            for row in reader:
-                obs_values.append(row)
-        header_data = {}
-        for i in range(len(header_values)):
-            if header_code[i] == 'Size_each_bin':
-                header_data.update({header_code[i]: header_values[i].split(' ')})
-            else:
-                header_data.update({header_code[i]: header_values[i]})
-        obs_data = []
-        true_obs_codes = []
-        for code in obs_codes:
-            if code != '':
-                true_obs_codes.append(code)
-        for i in range(len(obs_values)):
-            one_day_values = []
-            one_day_multi_dime_value = []
-            for j in range(len(obs_codes)):
-                if obs_codes[j] == 'Numb_part_chan' or obs_codes[j] == '':
-                    one_day_multi_dime_value.append(obs_values[i][j])
-                elif obs_codes[j] == 'Numb_conc':
-                    one_day_values.append(np.array(one_day_multi_dime_value))
-                    one_day_multi_dime_value.clear()
-                    one_day_values.append(obs_values[i][j])
-                else:
-                    one_day_values.append(obs_values[i][j])
-            obs_data.append(one_day_values)
-        obs_data = pd.DataFrame(obs_data, columns=true_obs_codes)
-        return {'header': header_data, 'obs': obs_data}
+        return self.table_csv_read('FSD')
 
     def pre_csv_read(self):
         """
         PRE设备文件的读取
         :return: 包含文件头和观测数据的字典，观测数据又包含温度时间、降雨量时间和整点时间的字典，多维数据是numpy.ndarray
         """
-        header_code = header_code_dict['PRE']
+        spec = get_instrument('PRE')
         obs_values = []
         with open(self.filename, encoding='utf-8') as f:
             reader = csv.reader(f)
@@ -526,12 +135,7 @@ class CSVReader:
             obs_codes = next(reader)
             for row in reader:
                 obs_values.append(row)
-        header_data = {}
-        for i in range(len(header_values)):
-            if header_code[i] == 'Size_each_bin':
-                header_data.update({header_code[i]: header_values[i].split(' ')})
-            else:
-                header_data.update({header_code[i]: header_values[i]})
+        header_data = self.read_header(spec, header_values)
         obs_values = np.array(obs_values)
         temp_data = obs_values[:, 0:3]
         for i in range(len(temp_data)):
@@ -565,23 +169,14 @@ class CSVReader:
         RRD设备原始数据的文件读取
         :return: 包含文件头和观测数据的字典，其中文件头是字典、观测数据数pandas.Dataframe, 多维数据是numpy.ndarray
         """
-        header_code = header_code_dict['RRD_Lraw']
+        spec = get_instrument('RRD_Lraw')
         obs_values = []
-        obs_codes = [
-            'Datetime',
-            'HGT',
-            'Transfer_function',
-            'Spectral_reflectivities',
-            'Q_data'
-        ]
         with open(self.filename, encoding='utf-8') as f:
             reader = csv.reader(f)
             header_values = next(reader)
             for row in reader:
                 obs_values.append(row)
-        header_data = {}
-        for i in range(len(header_values)):
-            header_data.update({header_code[i]: header_values[i]})
+        header_data = self.read_header(spec, header_values)
         obs_data = []
         one_day_values = []
         spec_ref_values = []
@@ -599,7 +194,7 @@ class CSVReader:
                 one_day_values.append(obs_values[i][1:])
             else:
                 one_day_values.append(obs_values[i][1])
-        obs_data = pd.DataFrame(obs_data, columns=obs_codes)
+        obs_data = pd.DataFrame(obs_data, columns=spec.obs_code)
         return {'header': header_data, 'obs': obs_data}
 
     def rrd_lpro_and_lave_csv_read(self):
@@ -607,31 +202,14 @@ class CSVReader:
         RRD设备再处理数据和平均数据的文件的读取
         :return: 包含文件头和观测数据的字典，其中文件头是字典、观测数据数pandas.Dataframe, 多维数据是numpy.ndarray
         """
-        header_code = header_code_dict['RRD_Lpro_and_Lave']
+        spec = get_instrument('RRD_Lave')
         obs_values = []
-        obs_codes = [
-            'Datetime',
-            'HGT',
-            'Transfer_function',
-            'Spectral_reflectivities',
-            'Drop_size',
-            'Spec_drop_dens',
-            'Path_Inte_Atte',
-            'Z_Atte',
-            'Z_Atte_corr',
-            'Rain_rate',
-            'LWC',
-            'W',
-            'Q_data'
-        ]
         with open(self.filename, encoding='utf-8') as f:
             reader = csv.reader(f)
             header_values = next(reader)
             for row in reader:
                 obs_values.append(row)
-        header_data = {}
-        for i in range(len(header_values)):
-            header_data.update({header_code[i]: header_values[i]})
+        header_data = self.read_header(spec, header_values)
         obs_data = []
         one_day_values = []
         multi_dime_values = []
@@ -656,5 +234,5 @@ class CSVReader:
                 one_day_values = []
             else:
                 one_day_values.append(obs_values[i][1])
-        obs_data = pd.DataFrame(obs_data, columns=obs_codes)
+        obs_data = pd.DataFrame(obs_data, columns=spec.obs_code)
         return {'header': header_data, 'obs': obs_data}
@@ -1,2 +1,14 @@
 # -*- coding:utf-8 -*-
 from .writer import *
+from .buffer import *
+from .encoder import *
+from .storage import *
+from .manifest import *
+from .prefetch import *
+from .pipeline import *
+from .rawbson import *
+from .spectrum import *
+from .spool import *
+from .orchestrator import *
+from .parquet import *
+from .zarrstore import *
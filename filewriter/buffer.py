@@ -0,0 +1,237 @@
+# -*- coding:utf-8 -*-
+from datetime import datetime
+import numpy as np
+
+
+class DayBuffer:
+    def __init__(self, codes, capacity=1440):
+        """
+        一天观测数据的列式缓存.
+        每条记录按字段直接写入各字段的numpy数组: 浮点数、整数 (包括质控码) 字段使用float64/int64数组,
+        廓线、谱等数组字段使用二维 (或三维) 数组, 其他字段 (时间、字符串等) 使用object数组.
+        字段类型由第一条记录确定, 之后出现类型不一致的记录 (例如浮点数字段中的'Nan')时, 该字段转为object数组,
+        保证写入文件的值与数据库中的原始值一致.
+
+        :param codes:       观测信息字段代码
+        :param capacity:    初始容量 (记录条数), 默认为1440 (一天的分钟数), 容量不足时自动翻倍
+        """
+        self.codes = list(codes)
+        self.capacity = capacity
+        self.size = 0
+        self.columns = {}   # 字段代码: numpy数组
+        self.kinds = {}     # 字段代码: 'float' / 'int' / 'array' / 'object'
+
+    @classmethod
+    def from_columns(cls, codes, columns, kinds):
+        """
+        由各字段的numpy数组创建DayBuffer (例如从缓存文件中读取的数据)
+
+        :param codes:   观测信息字段代码
+        :param columns: 字段代码: numpy数组 (长度均为记录条数)
+        :param kinds:   字段代码: 'float' / 'int' / 'array' / 'object'
+        :return:        DayBuffer
+        """
+        buffer = cls(codes)
+        buffer.kinds = dict(kinds)
+        buffer.columns = {code: columns[code] for code in buffer.codes}
+        buffer.size = len(buffer.columns[buffer.codes[0]]) if buffer.codes else 0
+        buffer.capacity = max(buffer.size, 1)
+        return buffer
+
+    def __len__(self):
+        return self.size
+
+    def __getstate__(self):
+        # 序列化 (例如传给工作进程) 时只保存已写入的记录, 不保存多余的容量
+        state = dict(self.__dict__)
+        state['columns'] = {code: column[:self.size] for code, column in self.columns.items()}
+        state['capacity'] = max(self.size, 1)
+        return state
+
+    def __getitem__(self, key):
+        """
+        按字段代码获取一列数据 (长度为记录条数的numpy数组), 或按下标获取一条记录 (字典)
+        """
+        if isinstance(key, str):
+            return self.columns[key][:self.size]
+        if key < 0:
+            key += self.size
+        if not 0 <= key < self.size:
+            raise IndexError('DayBuffer index out of range')
+        return {code: self.columns[code][key] for code in self.codes}
+
+    def append(self, data):
+        """
+        添加一条记录, 记录中缺少字段时抛出KeyError
+
+        :param data: 一条观测记录 (字典或其他支持按字段代码取值的对象), 数组字段的值可以是list或numpy数组
+        """
+        if self.size == self.capacity:
+            self._grow()
+        for code in self.codes:
+            value = data[code]
+            column = self.columns.get(code)
+            if column is None:
+                column = self._new_column(code, value)
+            kind = self.kinds[code]
+            if kind == 'float':
+                if type(value) is float:
+                    column[self.size] = value
+                    continue
+            elif kind == 'int':
+                if type(value) is int and -2 ** 63 <= value < 2 ** 63:
+                    column[self.size] = value
+                    continue
+            elif kind == 'array':
+                try:
+                    array = np.asarray(value)
+                except ValueError:
+                    array = None
+                if array is not None and array.shape == column.shape[1:] and array.dtype == column.dtype:
+                    column[self.size] = array
+                    continue
+            else:
+                column[self.size] = value.tolist() if isinstance(value, np.ndarray) else value
+                continue
+            # 类型不一致, 转为object数组后保存原始值
+            column = self._to_object(code)
+            column[self.size] = value.tolist() if isinstance(value, np.ndarray) else value
+        self.size += 1
+
+    def values(self, code):
+        """
+        获取一列数据的numpy数组, object数组会按原始值重新推断数据类型
+        (与 np.array([d[code] for d in one_day_data]) 的结果一致)
+
+        :param code:    字段代码
+        :return:        numpy数组
+        """
+        column = self[code]
+        if column.dtype == object:
+            return np.array(column.tolist())
+        return column
+
+    def datetime_strings(self, code, fmt="%Y-%m-%d %H:%M:%S"):
+        """
+        将时间字段转换为字符串, 非时间类型的值 (例如'Nan') 保持不变
+
+        :param code:    时间字段代码
+        :param fmt:     时间格式
+        :return:        object类型的numpy数组
+        """
+        return np.array([v.strftime(fmt) if hasattr(v, 'strftime') else v for v in self[code]], dtype='object')
+
+    def datetime_seconds(self, code):
+        """
+        将时间字段通过datetime64一次性转换为1970-01-01 00:00:00起的秒数 (不做时区转换),
+        非时间类型的值 (例如'Nan') 被掩码
+
+        :param code:    时间字段代码
+        :return:        int64类型的numpy掩码数组 (numpy.ma.MaskedArray)
+        """
+        column = self[code]
+        try:
+            mask = np.zeros(self.size, dtype=bool)
+            times = column.astype('datetime64[s]')
+        except (TypeError, ValueError):
+            mask = np.array([not isinstance(v, datetime) for v in column.tolist()], dtype=bool)
+            times = np.where(mask, None, column).astype('datetime64[s]')
+        return np.ma.masked_array(times.astype(np.int64), mask=mask | np.isnat(times))
+
+    def not_equal(self, code, value):
+        """
+        获取一列数据中不等于指定值的记录的掩码
+
+        :param code:    字段代码
+        :param value:   比较的值, 例如'Nan'
+        :return:        bool类型的numpy数组
+        """
+        column = self[code]
+        if column.dtype != object and isinstance(value, str):
+            return np.ones(self.size, dtype=bool)
+        return np.array([v != value for v in column.tolist()], dtype=bool)
+
+    def subset(self, index):
+        """
+        按掩码或下标选取部分记录, 返回新的DayBuffer
+
+        :param index:   bool掩码或下标数组
+        :return:        DayBuffer
+        """
+        buffer = DayBuffer(self.codes)
+        buffer.kinds = dict(self.kinds)
+        for code in self.codes:
+            buffer.columns[code] = self[code][index]
+        buffer.size = len(buffer.columns[self.codes[0]]) if self.codes else 0
+        buffer.capacity = max(buffer.size, 1)
+        return buffer
+
+    def compact(self):
+        """
+        将各字段的数组复制为长度与记录条数一致的连续数组, 释放多余的容量
+
+        :return: self
+        """
+        for code, column in self.columns.items():
+            self.columns[code] = column[:self.size].copy()
+        self.capacity = max(self.size, 1)
+        return self
+
+    def _new_column(self, code, value):
+        """
+        根据字段的第一个值创建该字段的数组
+        """
+        shape = ()
+        if type(value) is float:
+            kind, dtype = 'float', np.float64
+        elif type(value) is int:
+            kind, dtype = 'int', np.int64
+        elif isinstance(value, (list, tuple, np.ndarray)):
+            try:
+                array = np.asarray(value)
+            except ValueError:  # 长度不一致的嵌套列表
+                array = np.empty(0, dtype=object)
+            if array.ndim >= 1 and array.dtype.kind in 'iuf':
+                kind, dtype, shape = 'array', array.dtype, array.shape
+            else:
+                kind, dtype = 'object', object
+        else:
+            kind, dtype = 'object', object
+        self.kinds[code] = kind
+        self.columns[code] = np.empty((self.capacity,) + shape, dtype=dtype)
+        return self.columns[code]
+
+    def _to_object(self, code):
+        """
+        将一列数据转为object数组, 已保存的值转换为对应的Python对象
+        """
+        old = self.columns[code]
+        column = np.empty(self.capacity, dtype=object)
+        if self.kinds[code] == 'array':
+            for i in range(self.size):
+                column[i] = old[i].tolist()
+        else:
+            column[:self.size] = old[:self.size].tolist()
+        self.kinds[code] = 'object'
+        self.columns[code] = column
+        return column
+
+    def _grow(self):
+        """
+        容量翻倍
+        """
+        self.capacity *= 2
+        for code, old in self.columns.items():
+            column = np.empty((self.capacity,) + old.shape[1:], dtype=old.dtype)
+            column[:self.size] = old[:self.size]
+            self.columns[code] = column
+
+
+def to_float(value):
+    """
+    将DayBuffer中object列的一个值转换为浮点数, 不能转换时为NaN ('Nan'也转换为NaN)
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
@@ -0,0 +1,181 @@
+# -*- coding:utf-8 -*-
+import csv
+import io
+import os
+from itertools import zip_longest
+import numpy as np
+
+
+def format_column(values):
+    """
+    按pandas.DataFrame.to_csv的规则格式化一列数据:
+    全部为数值 (且含有浮点数或空值) 时按浮点数输出, 空值 (None、NaN) 输出为空字符串
+
+    :param values:  一列数据 (list)
+    :return:        可直接交给csv.writer的list
+    """
+    types = set(map(type, values))
+    if types <= {int, float, type(None)} and types & {float, type(None)}:
+        return ['' if v is None or v != v else float(v) for v in values]
+    if float in types or type(None) in types:
+        return ['' if v is None or (type(v) is float and v != v) else v for v in values]
+    return values
+
+
+def format_cell(value):
+    """
+    按pandas.DataFrame.to_csv的规则格式化单个值 (单值DataFrame): 空值 (None、NaN) 输出为空字符串
+
+    :param value:   单个值
+    :return:        可直接交给csv.writer的值
+    """
+    if value is None or (isinstance(value, float) and value != value):
+        return ''
+    return value
+
+
+class CSVEncoder:
+    def __init__(self):
+        """
+        一天CSV文件的批量编码器.
+        文件头、观测要素表格 (按列添加) 和逐行数据先编码到内存中, 最后一次写入文件.
+        输出格式与逐列pd.concat后调用to_csv的结果一致.
+        """
+        self.buffer = io.StringIO()
+        self.writer = csv.writer(self.buffer, lineterminator=os.linesep)
+        self.names = []     # 观测要素表格的列名
+        self.columns = []   # 观测要素表格的各列数据
+
+    def write_header(self, header_info_value):
+        """
+        写入文件头描述信息 (一行)
+
+        :param header_info_value: 文件头描述信息字段对应值
+        """
+        self.writer.writerow([format_cell(v) for v in header_info_value])
+
+    def write_row(self, values):
+        """
+        直接写入一行数据, 每个值单独格式化 (与逐行构造DataFrame后调用to_csv的结果一致)
+
+        :param values: 一行数据
+        """
+        self.writer.writerow([format_cell(v) for v in values])
+
+    def write_rows(self, rows):
+        """
+        直接写入多行数据, 每个值单独格式化
+
+        :param rows: 多行数据
+        """
+        self.writer.writerows([format_cell(v) for v in row] for row in rows)
+
+    def write_text_row(self, values):
+        """
+        写入一行数据, 每个值转换为字符串 (与np.array(values).reshape(1, -1)构造DataFrame后调用to_csv的结果一致,
+        即空值输出为'nan'或'None')
+
+        :param values: 一行数据
+        """
+        self.writer.writerow([str(v) for v in values])
+
+    def write_matrix(self, name, values):
+        """
+        写入以字段代码开头的多行矩阵块: 第一行为字段代码和矩阵第一行, 其余各行第一列为空.
+        矩阵按列格式化 (与pd.concat([pd.DataFrame([name]), pd.DataFrame(values)], axis=1)调用to_csv的结果一致)
+
+        :param name:    字段代码
+        :param values:  二维数据 (二维numpy数组或list的list)
+        """
+        if isinstance(values, np.ndarray) and values.ndim == 2 and values.dtype.kind in 'iub':
+            rows = values.tolist()
+        elif isinstance(values, np.ndarray) and values.ndim == 2 and values.dtype.kind == 'f':
+            rows = values.tolist()
+            if np.isnan(values).any():
+                rows = [[format_cell(v) for v in row] for row in rows]
+        else:
+            columns = [format_column(list(c)) for c in zip_longest(*[list(v) for v in values])]
+            rows = [list(row) for row in zip(*columns)]
+        if not rows:
+            rows = [[]]
+        self.writer.writerow([name] + rows[0])
+        self.writer.writerows([''] + row for row in rows[1:])
+
+    def write_record_blocks(self, columns, codes, vector_codes=(), matrix_codes=()):
+        """
+        按记录写入多行数据块 (微雨雷达数据格式), 每条记录依次写入codes中的每个字段:
+        vector_codes中的字段写为一行 "字段代码,值1,值2,...", matrix_codes中的字段写为矩阵块 (见write_matrix),
+        其他字段写为一行 "字段代码,值"
+
+        :param columns:         字段代码: 一列数据 (长度为记录条数, 时间字段需预先转换为字符串)
+        :param codes:           字段代码 (写入顺序)
+        :param vector_codes:    一维数组字段代码
+        :param matrix_codes:    二维数组字段代码
+        """
+        columns = {code: columns[code] if code in matrix_codes or not isinstance(columns[code], np.ndarray)
+                   else columns[code].tolist() for code in codes}
+        size = len(columns[codes[0]]) if codes else 0
+        for i in range(size):
+            for code in codes:
+                if code in vector_codes:
+                    self.write_text_row([code] + list(columns[code][i]))
+                elif code in matrix_codes:
+                    self.write_matrix(code, columns[code][i])
+                else:
+                    self.write_text_row([code, columns[code][i]])
+
+    def add_column(self, name, values):
+        """
+        向观测要素表格添加一列
+
+        :param name:    列名
+        :param values:  一列数据 (list或一维numpy数组)
+        """
+        if isinstance(values, np.ndarray):
+            values = values.tolist()
+        self.names.append(name)
+        self.columns.append(list(values))
+
+    def add_columns(self, name, values, width):
+        """
+        向观测要素表格添加多列 (廓线、谱等数组字段), 第一列列名为字段代码, 其余列名为空
+
+        :param name:    字段代码
+        :param values:  二维数据 (二维numpy数组或list的list), 每行为一条记录
+        :param width:   列数
+        """
+        if isinstance(values, np.ndarray) and values.ndim == 2:
+            block = values.T.tolist()
+        else:
+            rows = [list(v) for v in values]
+            block = [list(col) for col in zip(*rows)] if rows else [[] for _ in range(width)]
+        self.names.append(name)
+        self.names.extend([''] * (width - 1))
+        self.columns.extend(block)
+
+    def write_table(self):
+        """
+        写入观测要素表格 (列名一行, 每条记录一行), 长度不足的列以空值补齐
+        """
+        self.writer.writerow(self.names)
+        size = max([len(c) for c in self.columns], default=0)
+        columns = [format_column(c + [None] * (size - len(c))) if len(c) < size else format_column(c)
+                   for c in self.columns]
+        self.writer.writerows(zip(*columns))
+        self.names = []
+        self.columns = []
+
+    def getvalue(self):
+        """
+        :return: 已编码的文本
+        """
+        return self.buffer.getvalue()
+
+    def save(self, save_path):
+        """
+        将已编码的文本一次写入文件
+
+        :param save_path: 文件的保存路径 (路径+文件名)
+        """
+        with open(save_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(self.buffer.getvalue())
@@ -0,0 +1,148 @@
+# -*- coding:utf-8 -*-
+from datetime import datetime, timedelta
+import json
+import os
+import time
+
+
+class CheckpointManifest:
+    def __init__(self, path=None, instrument_name=None, file_format=None):
+        """
+        文件导出的检查点清单.
+        记录每个已完成的观测日 (日期: 文件路径、记录条数、源数据水位线 (当天最后一条记录的时间)、完成时间),
+        中断后重新导出时可从最后一个完成的观测日之后继续.
+        清单以JSON格式保存, 每次记录后先写入临时文件再替换原文件, 保证清单文件始终完整.
+
+        :param path:            清单文件路径, 为空时只保存在内存中 (用于并行导出的工作进程)
+        :param instrument_name: 设备名
+        :param file_format:     文件格式 ('nc' / 'csv' / 'parquet' / 'zarr')
+        """
+        self.path = path
+        self.instrument_name = instrument_name
+        self.file_format = file_format
+        self.days = {}  # 'yyyy-mm-dd': {'path': 文件路径, 'count': 记录条数, 'watermark': 水位线, 'finished': 完成时间}
+        if path is not None and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.days = json.load(f).get('days', {})
+
+    @classmethod
+    def for_export(cls, base_dir, instrument_name, file_format):
+        """
+        获取 (设备名, 文件格式, 存储根目录) 对应的清单, 清单文件保存在 "base_dir/instrument_name/" 目录下
+
+        :param base_dir:        文件存储根目录
+        :param instrument_name: 设备名
+        :param file_format:     文件格式 ('nc' / 'csv' / 'parquet' / 'zarr')
+        :return:                CheckpointManifest
+        """
+        path = os.path.join(base_dir, instrument_name, f'checkpoint_{file_format}.json')
+        return cls(path, instrument_name, file_format)
+
+    def record_day(self, day, path, count, watermark):
+        """
+        记录一个已完成的观测日, 清单有文件路径时立即保存
+
+        :param day:         观测日 ('yyyy-mm-dd')
+        :param path:        生成的文件路径
+        :param count:       记录条数
+        :param watermark:   源数据水位线 (当天最后一条记录的时间), datetime类型
+        """
+        self.days[day] = {
+            'path': path,
+            'count': count,
+            'watermark': watermark.strftime("%Y-%m-%d %H:%M:%S"),
+            'finished': time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
+        }
+        self.save()
+
+    def record_one_day_data(self, path, one_day_data, time_code):
+        """
+        根据一天的观测数据记录已完成的观测日, 文件路径为空 (未生成文件) 时不记录
+
+        :param path:            生成的文件路径
+        :param one_day_data:    一天的观测数据 (DayBuffer列式缓存)
+        :param time_code:       时间字段代码
+        """
+        if path is None:
+            return
+        times = one_day_data[time_code]
+        self.record_day(times[0].strftime("%Y-%m-%d"), path, len(one_day_data), times[-1])
+
+    def update(self, days):
+        """
+        合并其他清单 (例如并行导出时工作进程返回的清单) 中已完成的观测日, 清单有文件路径时立即保存
+
+        :param days: 已完成的观测日 (CheckpointManifest.days)
+        """
+        self.days.update(days)
+        self.save()
+
+    def last_day(self):
+        """
+        :return: 最后一个完成的观测日0时的datetime, 没有完成的观测日时返回None
+        """
+        if not self.days:
+            return None
+        return datetime.strptime(max(self.days), "%Y-%m-%d")
+
+    def high_water_mark(self):
+        """
+        :return: 高水位线 (已导出的最后一条记录的时间), 没有完成的观测日时返回None
+        """
+        if not self.days:
+            return None
+        return max(datetime.strptime(day['watermark'], "%Y-%m-%d %H:%M:%S") for day in self.days.values())
+
+    def incremental_start(self, start=None):
+        """
+        获取增量导出的起始时间: 高水位线所在观测日的0时, 不早于start.
+        高水位线所在的观测日可能只导出了部分数据, 从该日0时开始查询即可用完整的一天数据重新生成 (覆盖) 该日的文件
+
+        :param start:   原起始时间 (包含), datetime类型, 可以为空
+        :return:        增量导出的起始时间, 没有完成的观测日时返回start
+        """
+        high_water_mark = self.high_water_mark()
+        if high_water_mark is None:
+            return start
+        incremental = datetime(high_water_mark.year, high_water_mark.month, high_water_mark.day)
+        if start is not None and start > incremental:
+            return start
+        return incremental
+
+    def resume_start(self, start=None):
+        """
+        获取继续导出的起始时间: 最后一个完成的观测日的下一天0时, 不早于start
+
+        :param start:   原起始时间 (包含), datetime类型, 可以为空
+        :return:        继续导出的起始时间, 没有完成的观测日时返回start
+        """
+        last_day = self.last_day()
+        if last_day is None:
+            return start
+        resume = last_day + timedelta(days=1)
+        if start is not None and start > resume:
+            return start
+        return resume
+
+    def save(self):
+        """
+        保存清单 (先写入临时文件再替换原文件)
+        """
+        if self.path is None:
+            return
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+        watermark = self.high_water_mark()
+        content = {
+            'instrument_name': self.instrument_name,
+            'format': self.file_format,
+            'high_water_mark': watermark.strftime("%Y-%m-%d %H:%M:%S") if watermark is not None else None,
+            'days': dict(sorted(self.days.items())),
+        }
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(content, f, ensure_ascii=False, indent=1)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
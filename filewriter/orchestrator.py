@@ -0,0 +1,217 @@
+# -*- coding:utf-8 -*-
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import asyncio
+import time
+from dbcontroller import MyMongodb
+from instruments import get_time_code
+from .buffer import DayBuffer
+from .manifest import CheckpointManifest
+from .writer import NCGenerator, CSVGenerator, split_days
+
+try:
+    from motor.motor_asyncio import AsyncIOMotorClient
+except ImportError:  # 未安装motor时在线程池中使用pymongo查询
+    AsyncIOMotorClient = None
+
+
+class AsyncExporter:
+    def __init__(self, base_dir, ip, username, pwd, db_name, port=27017, max_workers=None, max_fetches=4,
+                 nc_options=None, csv_options=None):
+        """
+        多设备文件导出的异步 (asyncio) 调度.
+        每个导出任务 (设备, 文件格式) 是一个协程, 按观测日查询数据库 (安装motor时使用异步驱动, 否则在线程池中
+        使用pymongo), 一天的数据查询完成后交给进程池生成文件, 同时开始查询下一天的数据.
+        多个设备的数据库读取和文件生成互相重叠: 例如VIS、AERM等数据量小的设备主要等待数据库,
+        RRD等设备主要占用CPU, 一起调度时总耗时接近耗时最长的设备.
+
+        :param base_dir:    文件存储根目录
+        :param ip:          MongoDB数据库服务器IP地址
+        :param username:    登录验证的用户名
+        :param pwd:         登录验证的密码
+        :param db_name:     数据库名称
+        :param port:        MongoDB数据库服务器端口，默认为27017
+        :param max_workers: 生成文件的工作进程数, 默认为空 (与CPU核数相同)
+        :param max_fetches: 同时进行的数据库查询数, 默认为4
+        :param nc_options:  创建NCGenerator的其他关键字参数 (例如storage_profiles、cf_time), 默认为空
+        :param csv_options: 创建CSVGenerator的其他关键字参数, 默认为空
+        """
+        self.base_dir = base_dir
+        self.ip = ip
+        self.port = port
+        self.db_name = db_name
+        self.username = username
+        self.pwd = pwd
+        self.max_workers = max_workers
+        self.max_fetches = max_fetches
+        self.nc_options = nc_options if nc_options is not None else {}
+        self.csv_options = csv_options if csv_options is not None else {}
+        self.jobs = []  # (文件格式, 设备名, 文件生成参数, 观测信息字段代码, 起始时间, 结束时间, 是否继续导出, 是否增量导出)
+
+    def add_nc(self, instrument_name, header_info_code, header_info_longname, header_info_unit, header_info_nc_type,
+               header_info_value, obs_info_code, obs_info_longname, obs_info_unit, obs_info_nc_type, start=None,
+               end=None, resume=False, incremental=False):
+        """
+        添加nc(netCDF4)文件导出任务, 参数与NCGenerator.generate_nc_file_parallel一致
+        """
+        generate_args = (header_info_code, header_info_longname, header_info_unit, header_info_nc_type,
+                         header_info_value, obs_info_code, obs_info_longname, obs_info_unit, obs_info_nc_type)
+        self.jobs.append(('nc', instrument_name, generate_args, obs_info_code, start, end, resume, incremental))
+
+    def add_csv(self, instrument_name, header_info_value, obs_info_code, start=None, end=None, resume=False,
+                incremental=False):
+        """
+        添加csv文件导出任务, 参数与CSVGenerator.generate_csv_file_parallel一致
+        """
+        generate_args = (header_info_value, obs_info_code)
+        self.jobs.append(('csv', instrument_name, generate_args, obs_info_code, start, end, resume, incremental))
+
+    def run(self):
+        """
+        执行所有导出任务, 全部完成后返回
+
+        :return: 各任务生成的文件路径列表
+        """
+        return asyncio.run(self.run_async())
+
+    async def run_async(self):
+        """
+        在当前事件循环中执行所有导出任务
+
+        :return: 各任务生成的文件路径列表
+        """
+        mongodb = MyMongodb(self.ip, self.port, self.username, self.pwd, self.db_name)
+        motor_client = None
+        if AsyncIOMotorClient is not None:
+            kwargs = {}
+            if self.username is not None:
+                kwargs.update(username=self.username, password=self.pwd, authSource=self.db_name)
+            motor_client = AsyncIOMotorClient(mongodb.link, **kwargs)
+        print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Start {len(self.jobs)} export jobs '
+              f'({"motor" if motor_client is not None else "pymongo in threads"})')
+        semaphore = asyncio.Semaphore(self.max_fetches)
+        loop = asyncio.get_running_loop()
+        fetch_executor = ThreadPoolExecutor(self.max_fetches)
+        write_executor = ProcessPoolExecutor(self.max_workers)
+        try:
+            tasks = [asyncio.ensure_future(self._export(mongodb, motor_client, semaphore, fetch_executor,
+                                                        write_executor, *job)) for job in self.jobs]
+            if not tasks:
+                return []
+            done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            # 一个任务失败时取消其他任务, 等待取消完成后抛出第一个失败任务的异常
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            for task in tasks:
+                if task in done and task.exception() is not None:
+                    raise task.exception()
+            return [task.result() for task in tasks]
+        finally:
+            # 在默认线程池中等待查询线程和工作进程退出, 不阻塞事件循环
+            await loop.run_in_executor(None, fetch_executor.shutdown)
+            await loop.run_in_executor(None, write_executor.shutdown)
+            if motor_client is not None:
+                motor_client.close()
+            mongodb.close_mongodb_client()
+
+    async def _export(self, mongodb, motor_client, semaphore, fetch_executor, write_executor, file_format,
+                      instrument_name, generate_args, obs_info_code, start, end, resume, incremental):
+        """
+        一个导出任务: 按观测日查询数据, 上一天的文件生成与下一天的查询同时进行
+        """
+        loop = asyncio.get_running_loop()
+        collection_name = instrument_name + '_VQ'
+        time_code = get_time_code(instrument_name)
+        manifest = CheckpointManifest.for_export(self.base_dir, instrument_name, file_format)
+        if incremental:
+            start = manifest.incremental_start(start)
+        async with semaphore:
+            days = await loop.run_in_executor(fetch_executor, mongodb.get_distinct_days, self.db_name,
+                                              collection_name, self.username, self.pwd, start, end)
+        if resume and not incremental:
+            days = [day for day in days if day.strftime("%Y-%m-%d") not in manifest.days]
+        print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Found {len(days)} days of '
+              f'{instrument_name}\'s data ({file_format})')
+        generator_args = (file_format, self.base_dir, self.ip, self.username, self.pwd, self.db_name, self.port,
+                          self.nc_options if file_format == 'nc' else self.csv_options)
+        paths = []
+        writing = None  # 正在生成的文件
+        for day_start, day_end in split_days(days, 1, start, end):
+            async with semaphore:
+                if motor_client is not None:
+                    one_day_data = await self._fetch_motor(motor_client, collection_name, obs_info_code, day_start,
+                                                           day_end)
+                else:
+                    one_day_data = await loop.run_in_executor(fetch_executor, self._fetch, mongodb, collection_name,
+                                                              obs_info_code, day_start, day_end)
+            if writing is not None:
+                paths.append(await writing)
+                writing = None
+            if len(one_day_data) == 0:
+                continue
+            writing = asyncio.ensure_future(self._write(loop, write_executor, generator_args, instrument_name,
+                                                        one_day_data, generate_args, manifest, time_code))
+        if writing is not None:
+            paths.append(await writing)
+        print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Finished {instrument_name}\'s '
+              f'{file_format} files')
+        return paths
+
+    def _fetch(self, mongodb, collection_name, obs_info_code, start, end):
+        """
+        在线程池中使用pymongo查询一天的数据
+        """
+        db_data = mongodb.get_collection_data(self.db_name, collection_name, self.username, self.pwd, obs_info_code,
+                                              start, end)
+        try:
+            one_day_data = DayBuffer(obs_info_code)
+            for data in db_data:
+                one_day_data.append(data)
+            return one_day_data
+        finally:
+            db_data.close()
+
+    async def _fetch_motor(self, motor_client, collection_name, obs_info_code, start, end):
+        """
+        使用motor异步查询一天的数据 (查询条件、投影和排序与MyMongodb.get_collection_data一致)
+        """
+        time_field = MyMongodb.get_time_field(collection_name)
+        cursor = motor_client[self.db_name][collection_name].find(
+            MyMongodb.get_time_range_query(time_field, start, end),
+            projection=MyMongodb.get_projection(obs_info_code)).sort(time_field)
+        one_day_data = DayBuffer(obs_info_code)
+        async for data in cursor:
+            one_day_data.append(data)
+        return one_day_data
+
+    @staticmethod
+    async def _write(loop, write_executor, generator_args, instrument_name, one_day_data, generate_args, manifest,
+                     time_code):
+        """
+        在进程池中生成一天的文件, 完成后记录到检查点清单
+        """
+        path = await loop.run_in_executor(write_executor, _write_one_day_task, generator_args, instrument_name,
+                                          one_day_data, generate_args)
+        manifest.record_one_day_data(path, one_day_data, time_code)
+        return path
+
+
+_generators = {}  # 工作进程中的生成器, 按生成器参数缓存 (每个进程每种参数只创建一次)
+
+
+def _write_one_day_task(generator_args, instrument_name, one_day_data, generate_args):
+    """
+    工作进程执行的任务: 生成一天的文件, 返回文件路径.
+    generator_args为 (文件格式, base_dir, ip, username, pwd, db_name, port, 生成器的其他关键字参数)
+    """
+    key = repr(generator_args)
+    generator = _generators.get(key)
+    if generator is None:
+        if generator_args[0] == 'nc':
+            generator = NCGenerator(*generator_args[1:-1], **generator_args[-1])
+        else:
+            generator = CSVGenerator(*generator_args[1:-1], **generator_args[-1])
+        _generators[key] = generator
+    if generator_args[0] == 'nc':
+        return generator.generate_one_day_nc_file(instrument_name, one_day_data, *generate_args)
+    return generator.generate_one_day_csv_file(instrument_name, one_day_data, *generate_args)
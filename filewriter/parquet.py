@@ -0,0 +1,251 @@
+# -*- coding:utf-8 -*-
+from dbcontroller import MyMongodb
+from instruments import get_instrument, get_time_code
+from .buffer import to_float
+from .manifest import CheckpointManifest
+from .spectrum import decode_prec_spec
+from .spool import SpoolCache
+from .writer import NCGenerator, finalize_header, open_export_days
+from datetime import timedelta
+import os
+import time
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # 未安装pyarrow时不能生成Parquet文件
+    pa = pq = None
+
+if pa is not None:
+    # nc数据类型: Parquet列的数据类型 (浮点数保存为float64, 与数据库中的值一致)
+    ARROW_TYPES = {
+        'f': pa.float64(), 'd': pa.float64(), 'i': pa.int64(), 'i8': pa.int64(),
+        'u1': pa.uint8(), 'u2': pa.uint16(), 'u4': pa.uint32(), 'str': pa.string(),
+        'array31_i': pa.uint16(), 'array32_i': pa.uint16(),
+        'array31_f': pa.float64(), 'array32_d': pa.float64(), 'array64': pa.float64(),
+    }
+
+
+class ParquetGenerator:
+    def __init__(self, base_dir, ip, username, pwd, db_name, port=27017, compression='zstd', row_group_size=None,
+                 prefetch=0, batch_size=None, raw_bson=False, check_query=False, spool_dir=None):
+        """
+        初始化设置.
+        每个观测日生成一个Parquet文件, 存储路径和文件名与nc文件一致 (后缀为.parquet):
+        每个观测要素为一列, 按nc数据类型保存为有类型的列 (时间为timestamp, 缺测值 (例如'Nan') 为null),
+        廓线、谱等数组保存为定长列表列 (二维数组为嵌套的定长列表, 形状与数据库中的数组一致);
+        文件头描述信息保存为文件的键值元数据 (字段代码: 值), 观测要素的描述和单位保存为列的元数据 (long_name, units)
+
+        :param base_dir:            Parquet文件存储根目录
+        :param ip:                  MongoDB数据库服务器IP地址
+        :param username:            登录验证的用户名
+        :param pwd:                 登录验证的密码
+        :param db_name:             数据库名称
+        :param port:                MongoDB数据库服务器端口，默认为27017
+        :param compression:         压缩算法 ('zstd' / 'snappy' / 'gzip' / 'none'等), 默认为'zstd'
+        :param row_group_size:      每个行组的最大记录条数, 默认为空 (一天的数据为一个行组)
+        :param prefetch:            后台预读取时队列中最多缓存的记录组数, 默认为0 (不预读取)
+        :param batch_size:          游标每批从服务器获取的记录条数, 默认为空 (使用服务器默认值)
+        :param raw_bson:            是否以原始BSON读取记录并直接解码为列式数据, 默认为False
+        :param check_query:         导出前是否打印查询的执行计划, 默认为False
+        :param spool_dir:           本地缓存目录, 默认为空 (不缓存)
+        """
+        if pa is None:
+            raise ImportError('ParquetGenerator requires pyarrow')
+        self.mongodb = MyMongodb(ip, port, username, pwd, db_name)
+        self.ip = ip
+        self.port = port
+        self.db_name = db_name
+        self.username = username
+        self.pwd = pwd
+        self.base_dir = base_dir
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.prefetch = prefetch
+        self.batch_size = batch_size
+        self.raw_bson = raw_bson
+        self.check_query = check_query
+        self.spool_dir = spool_dir
+        self.spool = SpoolCache(spool_dir) if spool_dir is not None else None
+
+    @staticmethod
+    def generate_filename(*args, **kwargs):
+        """
+        根据参数，生成Parquet文件的标准文件名 (参数与NCGenerator.generate_filename相同, 后缀为.parquet)
+
+        :return: 标准文件名
+        """
+        return NCGenerator.generate_filename(*args, **kwargs)[:-len('.nc')] + '.parquet'
+
+    def generate_parquet_file(self, instrument_name, header_info_code, header_info_longname, header_info_unit,
+                              header_info_nc_type, header_info_value, obs_info_code, obs_info_longname, obs_info_unit,
+                              obs_info_nc_type, is_sample=False, start=None, end=None, resume=False,
+                              incremental=False, manifest=None, sample_size=1, sample_random=False, check_query=None):
+        """
+        根据设备名、文件头信息、观测信息生成Parquet文件, 参数与NCGenerator.generate_nc_file相同
+
+        :param instrument_name:         设备名
+        :param header_info_code:        文件头描述信息字段代码
+        :param header_info_longname:    文件头描述信息字段中英文描述
+        :param header_info_unit:        文件头描述信息字段单位
+        :param header_info_nc_type:     文件头描述信息字段对应nc文件中保存的数据类型
+        :param header_info_value:       文件头描述信息字段对应值
+        :param obs_info_code:           观测信息字段代码
+        :param obs_info_longname:       观测信息字段中英文描述
+        :param obs_info_unit:           观测信息字段单位
+        :param obs_info_nc_type:        观测信息字段对应nc文件中保存的数据类型
+        :param is_sample:               是否属于样例文件生成模式， 默认为False
+        :param start:                   导出数据的起始时间 (包含), datetime类型，默认为空 (从第一条记录开始)
+        :param end:                     导出数据的结束时间 (不包含), datetime类型，默认为空 (到最后一条记录为止)
+        :param resume:                  是否从检查点清单中最后一个完成的观测日的下一天开始导出, 默认为False
+        :param incremental:             是否增量导出 (只查询检查点清单高水位线所在观测日及之后的数据,
+                                        高水位线所在观测日的文件重新生成), 默认为False
+        :param manifest:                检查点清单 (CheckpointManifest), 每生成一天的文件 记录一次,
+                                        默认为存储根目录下该设备Parquet文件的清单
+        :param sample_size:             样例模式生成的观测日数, 默认为1
+        :param sample_random:           样例模式是否随机抽取观测日, 默认为False (取最早的sample_size个观测日)
+        :param check_query:             导出前是否打印查询的执行计划, 默认为空 (按初始化时的设置),
+                                        样例模式只在第一个样例观测日检查
+        """
+        field_args = (header_info_code, header_info_longname, header_info_unit, header_info_nc_type,
+                      header_info_value, obs_info_code, obs_info_longname, obs_info_unit, obs_info_nc_type)
+        if is_sample:
+            # 样例模式: 先查询出样例观测日, 再逐日进行范围查询, 不遍历整个集合; 样例文件不记录到检查点清单
+            days = self.mongodb.get_sample_days(self.db_name, instrument_name + '_VQ', self.username, self.pwd,
+                                                sample_size, start, end, sample_random)
+            for i, day in enumerate(days):
+                day_end = day + timedelta(days=1)
+                self.generate_parquet_file(instrument_name, *field_args, start=max(day, start) if start else day,
+                                           end=min(day_end, end) if end else day_end, manifest=CheckpointManifest(),
+                                           check_query=check_query if i == 0 else False)
+            return
+        if manifest is None:
+            manifest = CheckpointManifest.for_export(self.base_dir, instrument_name, 'parquet')
+        time_code = get_time_code(instrument_name)
+        days = open_export_days(self, instrument_name, obs_info_code, start, end, manifest, resume, incremental,
+                                'parquet files', check_query=check_query)
+        for one_day_data in days:
+            path = self.generate_one_day_parquet_file(instrument_name, one_day_data, *field_args)
+            manifest.record_one_day_data(path, one_day_data, time_code)
+
+    def generate_one_day_parquet_file(self, instrument_name, one_day_data, header_info_code, header_info_longname,
+                                      header_info_unit, header_info_nc_type, header_info_value, obs_info_code,
+                                      obs_info_longname, obs_info_unit, obs_info_nc_type):
+        """
+        生成一天数据的Parquet文件.
+        该函数不修改实例状态和传入的参数, 可在多个线程或进程中同时调用.
+
+        :param instrument_name:         设备名
+        :param one_day_data:            一天的观测数据 (DayBuffer列式缓存)
+        :param header_info_code:        文件头描述信息字段代码
+        :param header_info_longname:    文件头描述信息字段中英文描述
+        :param header_info_unit:        文件头描述信息字段单位
+        :param header_info_nc_type:     文件头描述信息字段对应nc文件中保存的数据类型
+        :param header_info_value:       文件头描述信息字段对应值
+        :param obs_info_code:           观测信息字段代码
+        :param obs_info_longname:       观测信息字段中英文描述
+        :param obs_info_unit:           观测信息字段单位
+        :param obs_info_nc_type:        观测信息字段对应nc文件中保存的数据类型
+        :return:                        生成的文件路径 (路径+文件名), 设备名无效时返回None
+        """
+        spec = get_instrument(instrument_name)
+        if spec is None:
+            print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Invalid device name: {instrument_name}')
+            return
+        start_time = one_day_data[spec.time_code][0]  # 一天中记录开始时间
+        # 根据设备名、开始时间的年和月确定保存路径："./base/instrument_name/year/month"
+        path = self.base_dir + '/' + instrument_name + '/' + str(start_time.year) + '/' + str(start_time.month) + '/'
+        if not os.path.exists(path):
+            os.makedirs(path)
+        filename = self.generate_filename(*spec.filename_codes, start_time, 'FMT',
+                                          is_quality_control=spec.is_quality_control)
+        # 与nc文件相同的文件头规则, 数据记录起始和结束时间、文件生成时间 (在副本上修改, 不改变调用者传入的值)
+        header_info_value = finalize_header(spec, one_day_data, header_info_value, spec.header_overrides)
+        print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Generating {instrument_name}\'s '
+              f'parquet file: {header_info_value[-4]} ~ {header_info_value[-3]}')
+        # --------------------------------------------------头文件信息-------------------------------------------------- #
+        metadata = {code: str(value) for code, value in zip(header_info_code, header_info_value)}
+        # -------------------------------------------------观测要素信息------------------------------------------------- #
+        arrays, fields = [], []
+        for code, longname, unit, nc_type in zip(obs_info_code, obs_info_longname, obs_info_unit, obs_info_nc_type):
+            array = arrow_column(one_day_data, code, nc_type)
+            arrays.append(array)
+            fields.append(pa.field(code, array.type, metadata={'long_name': str(longname), 'units': str(unit)}))
+        table = pa.Table.from_arrays(arrays, schema=pa.schema(fields, metadata=metadata))
+        pq.write_table(table, path + filename, compression=self.compression, row_group_size=self.row_group_size)
+        print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] save {path + filename} success!')
+        return path + filename
+
+
+def arrow_column(one_day_data, code, nc_type):
+    """
+    将一天的一个观测要素转换为Parquet列 (pyarrow.Array).
+    时间字段 (代码以'Datetime'开头或为'GPS_DT') 转换为timestamp, 数组字段转换为定长列表,
+    数值字段按nc数据类型转换, 不能转换为数值的值 (例如'Nan') 保存为null;
+    nc数据类型未知时保存为float64 (不按DayBuffer中当天的字段类型确定, 每天的文件结构相同)
+
+    :param one_day_data:    一天的观测数据 (DayBuffer列式缓存)
+    :param code:            观测要素代码
+    :param nc_type:         nc数据类型
+    :return:                pyarrow.Array
+    """
+    column = one_day_data[code]
+    kind = one_day_data.kinds.get(code, 'object')
+    if code.startswith('Datetime') or code == 'GPS_DT':
+        seconds = one_day_data.datetime_seconds(code)
+        return pa.array(seconds.data, mask=np.ma.getmaskarray(seconds), type=pa.timestamp('s'))
+    if code == 'Prec_spec':
+        return _fixed_size_list(decode_prec_spec(column), None)
+    if nc_type.startswith('array'):
+        return _fixed_size_list(one_day_data.values(code), ARROW_TYPES.get(nc_type))
+    arrow_type = ARROW_TYPES.get(nc_type, pa.float64())
+    if arrow_type == pa.string():
+        return pa.array([v if isinstance(v, str) or v is None else str(v) for v in column.tolist()], pa.string())
+    if kind in ('float', 'int'):
+        values = column
+    else:
+        values = np.array([to_float(v) for v in column.tolist()], dtype=np.float64)
+    mask = np.isnan(values) if values.dtype.kind == 'f' else None
+    return pa.array(values, mask=mask).cast(arrow_type)
+
+
+def _fixed_size_list(values, arrow_type):
+    """
+    将 (记录条数, ...) 形状的数组转换为 (嵌套的) 定长列表列.
+    values不是数值数组时 (例如部分记录为'Nan'), 形状与第一个数值记录一致的记录保存为列表, 其他记录为null
+
+    :param values:      numpy数组
+    :param arrow_type:  元素的数据类型, 为空时由数组的数据类型确定
+    :return:            pyarrow.FixedSizeListArray
+    """
+    n = len(values)
+    mask = None
+    if values.dtype.kind not in 'iuf' or values.ndim < 2:
+        rows = [_numeric_row(v) for v in values.tolist()]
+        shape = next((row.shape for row in rows if row is not None), (0,))
+        mask = np.array([row is None or row.shape != shape for row in rows], dtype=bool)
+        values = np.zeros((n,) + shape, dtype=np.float64)
+        for i, row in enumerate(rows):
+            if not mask[i]:
+                values[i] = row
+    array = pa.array(values.reshape(-1))
+    if arrow_type is not None:
+        array = array.cast(arrow_type)
+    for size in reversed(values.shape[2:]):
+        array = pa.FixedSizeListArray.from_arrays(array, size)
+    width = values.shape[1] if values.ndim > 1 else 0
+    if mask is not None and mask.any():
+        return pa.FixedSizeListArray.from_arrays(array, width, mask=pa.array(mask))
+    return pa.FixedSizeListArray.from_arrays(array, width)
+
+
+def _numeric_row(value):
+    """
+    将一条记录的数组值转换为数值数组, 不能转换时返回None
+    """
+    try:
+        row = np.asarray(value, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+    return row if row.ndim >= 1 else None
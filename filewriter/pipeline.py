@@ -0,0 +1,117 @@
+# -*- coding:utf-8 -*-
+import queue
+import threading
+
+
+class DayPipeline:
+    _END = object()  # 数据读取结束的标记
+
+    def __init__(self, days, executor, task, task_args=(), queue_size=4):
+        """
+        按观测日生成文件的三级流水线: 读取分组 -> 转换 -> 写入.
+        读取线程迭代days (数据库查询并按观测日分组为DayBuffer), 放入有界队列;
+        转换线程将每天的数据整理为长度与记录条数一致的连续数组 (DayBuffer.compact), 提交到进程池执行写入任务,
+        已提交的任务放入第二个有界队列; 迭代时按观测日顺序返回写入结果.
+        两个队列都满时读取线程等待, 同时在内存中的观测日数最多约为2 * queue_size + 2.
+        任一阶段的异常在迭代时重新抛出.
+
+        :param days:        一天的观测数据 (DayBuffer) 的迭代器, 在读取线程中迭代
+        :param executor:    执行写入任务的进程池 (concurrent.futures.ProcessPoolExecutor)
+        :param task:        写入任务函数, task(*task_args, one_day_data)返回生成的文件路径, 需要可以pickle
+        :param task_args:   写入任务的其他参数, 默认为空
+        :param queue_size:  每个队列最多缓存的观测日数, 默认为4
+        """
+        self.days = days
+        self.executor = executor
+        self.task = task
+        self.task_args = tuple(task_args)
+        self.day_queue = queue.Queue(queue_size)      # 读取分组 -> 转换
+        self.write_queue = queue.Queue(queue_size)    # 转换 -> 写入 (已提交的任务)
+        self.stop_event = threading.Event()
+        self.threads = [threading.Thread(target=self._fetch, daemon=True),
+                        threading.Thread(target=self._convert, daemon=True)]
+        for thread in self.threads:
+            thread.start()
+
+    def __iter__(self):
+        """
+        按观测日顺序迭代写入结果
+
+        :return: (生成的文件路径, 一天的观测数据) 的迭代器
+        """
+        try:
+            while True:
+                item = self.write_queue.get()
+                if item is self._END:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                future, one_day_data = item
+                yield future.result(), one_day_data
+        finally:
+            self.close()
+
+    def _fetch(self):
+        """
+        读取线程: 迭代days, 将每天的数据放入队列
+        """
+        try:
+            for one_day_data in self.days:
+                if not self._put(self.day_queue, one_day_data):
+                    return
+        except Exception as e:
+            self._put(self.day_queue, e)
+        finally:
+            self._put(self.day_queue, self._END)
+
+    def _convert(self):
+        """
+        转换线程: 整理每天的数据并提交写入任务
+        """
+        try:
+            while not self.stop_event.is_set():
+                try:
+                    item = self.day_queue.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if item is self._END or isinstance(item, BaseException):
+                    self._put(self.write_queue, item)
+                    return
+                one_day_data = item.compact()
+                future = self.executor.submit(self.task, *self.task_args, one_day_data)
+                if not self._put(self.write_queue, (future, one_day_data)):
+                    future.cancel()
+                    return
+        except Exception as e:
+            self._put(self.write_queue, e)
+
+    def _put(self, q, item):
+        """
+        向队列中放入一项, 队列已满时等待, 已停止时放弃
+
+        :return: 是否放入成功
+        """
+        while not self.stop_event.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def close(self):
+        """
+        停止读取和转换线程, 取消尚未开始的写入任务
+        """
+        self.stop_event.set()
+        for thread in self.threads:
+            thread.join()
+        while True:
+            try:
+                item = self.write_queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, tuple):
+                item[0].cancel()
+        if hasattr(self.days, 'close'):
+            self.days.close()
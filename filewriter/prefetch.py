@@ -0,0 +1,80 @@
+# -*- coding:utf-8 -*-
+import queue
+import threading
+
+
+class CursorPrefetcher:
+    _END = object()  # 数据读取结束的标记
+
+    def __init__(self, cursor, maxsize=8, chunk_size=1000):
+        """
+        数据库游标的后台预读取.
+        生产者线程不断从游标中读取记录, 按chunk_size条一组放入有界队列 (最多maxsize组),
+        迭代 (消费) 时逐条返回记录, 使数据库的网络读取与文件的转换、写入同时进行.
+        生产者线程中的异常在迭代时重新抛出.
+
+        :param cursor:      数据库游标 (pymongo.cursor.Cursor或其他可迭代对象)
+        :param maxsize:     队列中最多缓存的记录组数, 默认为8
+        :param chunk_size:  每组记录条数, 默认为1000
+        """
+        self.cursor = cursor
+        self.chunk_size = chunk_size
+        self.queue = queue.Queue(maxsize)
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._produce, daemon=True)
+        self.thread.start()
+
+    def __iter__(self):
+        try:
+            while True:
+                item = self.queue.get()
+                if item is self._END:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield from item
+        finally:
+            # 迭代结束或中途退出 (包括消费者抛出异常) 时停止生产者线程
+            self.close()
+
+    def _produce(self):
+        """
+        生产者线程: 从游标中读取记录放入队列
+        """
+        try:
+            chunk = []
+            for data in self.cursor:
+                chunk.append(data)
+                if len(chunk) >= self.chunk_size:
+                    if not self._put(chunk):
+                        return
+                    chunk = []
+            if chunk:
+                self._put(chunk)
+        except Exception as e:
+            self._put(e)
+        finally:
+            self._put(self._END)
+
+    def _put(self, item):
+        """
+        向队列中放入一项, 队列已满时等待, 已停止时放弃
+
+        :return: 是否放入成功
+        """
+        while not self.stop_event.is_set():
+            try:
+                self.queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def close(self):
+        """
+        停止生产者线程并关闭游标
+        """
+        self.stop_event.set()
+        self.thread.join()
+        if hasattr(self.cursor, 'close'):
+            self.cursor.close()
@@ -0,0 +1,181 @@
+# -*- coding:utf-8 -*-
+import struct
+import bson
+import numpy as np
+
+# BSON数值类型: (numpy数据类型, 字节数)
+_NUMERIC_TYPES = {
+    0x01: ('<f8', 8),   # double
+    0x10: ('<i4', 4),   # int32
+    0x12: ('<i8', 8),   # int64
+}
+_ARRAY_TYPE = 0x04
+# 直接读取的数组的最小字节数, 较小的数组 (例如几十个元素的廓线) 交给C扩展解码更快
+_MIN_ARRAY_BYTES = 1024
+# 连续这么多条记录都没有可直接读取的数值数组时, 之后的记录整条交给C扩展解码
+_MAX_RECORDS_WITHOUT_ARRAYS = 100
+# 固定长度的BSON类型的值的字节数 (不包括字符串、文档、数组、二进制等带长度的类型)
+_FIXED_SIZES = {0x01: 8, 0x06: 0, 0x07: 12, 0x08: 1, 0x09: 8, 0x0A: 0, 0x10: 4, 0x11: 8, 0x12: 8, 0x13: 16,
+                0x7F: 0, 0xFF: 0}
+_LAYOUTS = {}   # (数值类型, 第一个元素路径上各层数组的字节数): 数组的字节布局, 无法解析时为None
+
+
+class RawBSONRecords:
+    def __init__(self, cursor):
+        """
+        原始BSON记录的列式解码.
+        对返回RawBSONDocument的游标进行迭代, 每条记录只解码一次:
+        元素类型一致且不小于1KB的数值数组 (廓线、谱等, 包括嵌套的二维数组) 按字节布局直接读取为numpy数组,
+        不再逐个元素创建Python对象; 其他字段一次性交给bson的C扩展解码.
+        数组中存在类型不一致的元素时, 该数组按普通方式解码为list, 解码结果与字典游标一致.
+
+        :param cursor:  数据库游标 (返回bson.raw_bson.RawBSONDocument, 见MyMongodb.get_collection_data的raw参数)
+        """
+        self.cursor = cursor
+        self.records_without_arrays = 0  # 连续没有可直接读取的数值数组的记录条数
+
+    def __iter__(self):
+        for document in self.cursor:
+            yield self.decode(document.raw)
+
+    def decode(self, raw):
+        """
+        解码一条原始BSON记录
+
+        :param raw: BSON字节串
+        :return:    字典, 数值数组字段的值为numpy数组, 其他字段的值与bson.decode一致
+        """
+        if self.records_without_arrays >= _MAX_RECORDS_WITHOUT_ARRAYS:
+            return bson.decode(raw)
+        u8 = np.frombuffer(raw, dtype=np.uint8)
+        data = {}
+        others = []     # 需要交给C扩展解码的元素
+        pos, end = 4, len(raw) - 1
+        while pos < end:
+            element_type = raw[pos]
+            key_end = raw.index(0, pos + 1)
+            value_pos = key_end + 1
+            value_end = value_pos + self._value_size(raw, element_type, value_pos)
+            value = None
+            if element_type == _ARRAY_TYPE and value_end - value_pos >= _MIN_ARRAY_BYTES:
+                value = self._decode_array(raw, u8, value_pos)
+            if value is None:
+                others.append(raw[pos:value_end])
+            else:
+                data[raw[pos + 1:key_end].decode('utf-8')] = value
+            pos = value_end
+        self.records_without_arrays = 0 if data else self.records_without_arrays + 1
+        if others:
+            content = b''.join(others)
+            decoded = bson.decode(struct.pack('<i', len(content) + 5) + content + b'\x00')
+            if data:
+                decoded.update(data)
+            return decoded
+        return data
+
+    def close(self):
+        """
+        关闭游标
+        """
+        self.cursor.close()
+
+    @staticmethod
+    def _value_size(raw, element_type, pos):
+        """
+        获取元素值的字节数
+        """
+        size = _FIXED_SIZES.get(element_type)
+        if size is not None:
+            return size
+        if element_type in (0x02, 0x0D, 0x0E):     # string / code / symbol
+            return 4 + struct.unpack_from('<i', raw, pos)[0]
+        if element_type in (0x03, 0x04, 0x0F):     # document / array / code with scope
+            return struct.unpack_from('<i', raw, pos)[0]
+        if element_type == 0x05:                    # binary
+            return 5 + struct.unpack_from('<i', raw, pos)[0]
+        if element_type == 0x0C:                    # DBPointer
+            return 16 + struct.unpack_from('<i', raw, pos)[0]
+        if element_type == 0x0B:                    # regex
+            return raw.index(0, raw.index(0, pos) + 1) + 1 - pos
+        raise bson.errors.InvalidBSON(f'unknown element type: {element_type:#x}')
+
+    @staticmethod
+    def _decode_array(raw, u8, pos):
+        """
+        将元素类型一致的数值数组 (可以嵌套) 直接读取为numpy数组, 不是这类数组时返回None.
+        数组的字节布局由数值类型和各层数组的字节数确定: 按第一个元素的路径计算出布局后,
+        再检查数组中除数值以外的字节 (类型、下标、长度) 与布局完全一致
+        """
+        lengths = []
+        p = pos
+        while True:
+            length = struct.unpack_from('<i', raw, p)[0]
+            lengths.append(length)
+            element_type = raw[p + 4]
+            if element_type == _ARRAY_TYPE and raw[p + 5:p + 7] == b'0\x00':
+                p += 7
+                continue
+            break
+        if element_type not in _NUMERIC_TYPES:
+            return None
+        key = (element_type, tuple(lengths))
+        layout = _LAYOUTS.get(key, False)
+        if layout is False:
+            layout = _LAYOUTS[key] = _array_layout(element_type, lengths)
+        if layout is None:
+            return None
+        template, skeleton, value_index, dtype, shape = layout
+        segment = u8[pos:pos + lengths[0]]
+        if not np.array_equal(segment[skeleton], template):
+            return None
+        values = segment[value_index].view(dtype).reshape(shape)
+        if dtype == '<i4':  # 与Python整数列表转换的numpy数组一致
+            return values.astype(np.int64)
+        return values.astype(dtype[1:], copy=False)
+
+
+def _array_layout(element_type, lengths):
+    """
+    计算数值数组的字节布局
+
+    :param element_type:    数值类型
+    :param lengths:         第一个元素路径上各层数组的字节数 (从外到内)
+    :return:                (非数值字节的期望值, 非数值字节的下标, 数值字节的下标, numpy数据类型, 数组形状),
+                            字节数与元素个数不符时返回None
+    """
+    dtype, width = _NUMERIC_TYPES[element_type]
+    # 从最内层开始, 由数组的字节数反推元素个数
+    shape = []
+    element_size = width
+    for length in reversed(lengths):
+        count, size = 0, 5
+        while size < length:
+            size += 2 + len(str(count)) + element_size
+            count += 1
+        if size != length or count == 0:
+            return None
+        shape.insert(0, count)
+        element_size = length
+    template = bytearray()
+    mask = bytearray()  # 1: 数值字节
+
+    def build(depth):
+        template.extend(struct.pack('<i', lengths[depth]))
+        mask.extend(b'\x00' * 4)
+        for i in range(shape[depth]):
+            header = bytes([_ARRAY_TYPE if depth + 1 < len(shape) else element_type]) + str(i).encode() + b'\x00'
+            template.extend(header)
+            mask.extend(b'\x00' * len(header))
+            if depth + 1 < len(shape):
+                build(depth + 1)
+            else:
+                template.extend(b'\x00' * width)
+                mask.extend(b'\x01' * width)
+        template.append(0)
+        mask.append(0)
+
+    build(0)
+    mask = np.frombuffer(bytes(mask), dtype=np.uint8).astype(bool)
+    skeleton = np.flatnonzero(~mask)
+    return (np.frombuffer(bytes(template), dtype=np.uint8)[skeleton], skeleton, np.flatnonzero(mask), dtype,
+            tuple(shape))
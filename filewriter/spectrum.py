@@ -0,0 +1,48 @@
+# -*- coding:utf-8 -*-
+import numpy as np
+
+# 雨滴谱 (RSD) 的粒子直径等级数和速度等级数
+PREC_SPEC_SHAPE = (22, 20)
+
+
+def decode_prec_spec(column, shape=PREC_SPEC_SHAPE):
+    """
+    将一天的雨滴谱 (Prec_spec) 一次性解码为uint16数组.
+    数据库中每条记录的谱为440个3位数字字符串, 部分记录中相邻两个值合并为一个"ddd ddd"字符串 (列表长度小于440).
+    每条记录的字符串总长度 (含分隔空格) 为值的个数乘4时, 整天的记录用空格连接为一个字符串, 每个值恰好占4个字节
+    ("ddd "), 直接按字节计算数值, 不再逐个值转换; 存在其他格式的值 (非3位数字、值的个数不正确等) 时,
+    逐条记录按空白拆分后转换为整数.
+
+    :param column:  一天的Prec_spec (DayBuffer中的一列, 每条记录为字符串列表, 也可以是数值数组)
+    :param shape:   每条记录的谱的形状, 默认为 (22, 20)
+    :return:        形状为 (记录条数, 直径等级数, 速度等级数) 的uint16数组, 值的个数不正确时抛出ValueError
+    """
+    n = len(column)
+    size = int(np.prod(shape))
+    if column.dtype != object:   # 已经是数值数组
+        return np.asarray(column).reshape((n,) + tuple(shape)).astype(np.uint16)
+    records = column.tolist()
+    try:
+        # 逐条记录检查长度, 避免值的个数不正确的记录与相邻记录互相补齐后错位
+        if all(sum(len(s) + 1 for s in v) == size * 4 for v in records):
+            text = ' '.join([' '.join(v) for v in records]) + ' '
+        else:
+            text = None
+    except TypeError:   # 记录中有非字符串的值
+        text = None
+    if text is not None:
+        chars = np.frombuffer(text.encode('utf-8'), dtype=np.uint8)
+        if len(chars) == n * size * 4:
+            chars = chars.reshape(-1, 4)
+            digits = chars[:, :3] - ord('0')
+            if (digits < 10).all() and (chars[:, 3] == ord(' ')).all():
+                digits = digits.astype(np.uint16)
+                values = digits[:, 0] * 100 + digits[:, 1] * 10 + digits[:, 2]
+                return values.reshape((n,) + tuple(shape))
+    values = np.empty((n, size), dtype=np.uint16)
+    for i, v in enumerate(records):
+        tokens = ' '.join(map(str, v)).split()
+        if len(tokens) != size:
+            raise ValueError(f'Prec_spec has {len(tokens)} values, expected {size}')
+        values[i] = [int(d) for d in tokens]
+    return values.reshape((n,) + tuple(shape))
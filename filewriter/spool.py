@@ -0,0 +1,207 @@
+# -*- coding:utf-8 -*-
+from datetime import timedelta
+import hashlib
+import json
+import math
+import os
+import pickle
+import time
+import numpy as np
+from .buffer import DayBuffer
+from .rawbson import RawBSONRecords
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # 未安装pyarrow时缓存文件使用pickle格式
+    pa = pq = None
+
+
+class SpoolCache:
+    def __init__(self, cache_dir):
+        """
+        数据库查询结果的本地缓存.
+        每个设备的每个观测日保存为一个列式文件 (安装pyarrow时为Parquet, 否则为pickle),
+        按 (集合, 字段投影, 观测日) 区分, 文件中记录查询时的数据指纹 (记录条数和最大的'_id'),
+        再次导出时指纹一致则直接从缓存读取, 不一致 (数据库中的数据有增删) 时重新查询并覆盖缓存.
+        Parquet文件中数值字段和数组字段保存为原生列, 能无损转换的object字段 (时间、字符串等) 也保存为原生列,
+        其他object字段 (例如数值和'Nan'混合) 逐个值pickle后保存, 保证读取后生成的文件与直接查询一致.
+
+        :param cache_dir: 缓存根目录
+        """
+        self.cache_dir = cache_dir
+
+    def get_path(self, collection_name, fields, day):
+        """
+        获取缓存文件路径: "cache_dir/集合名/字段投影的摘要/年/yyyy-mm-dd.parquet"
+
+        :param collection_name: MongoDB数据集合名称
+        :param fields:          查询的字段代码列表
+        :param day:             观测日0时的datetime
+        :return:                缓存文件路径
+        """
+        digest = hashlib.md5(json.dumps(list(fields)).encode('utf-8')).hexdigest()[:12]
+        extension = '.parquet' if pq is not None else '.pkl'
+        return os.path.join(self.cache_dir, collection_name, digest, str(day.year),
+                            day.strftime("%Y-%m-%d") + extension)
+
+    def iter_days(self, mongodb, database_name, collection_name, username, pwd, fields, start=None, end=None,
+                  batch_size=None, raw=False):
+        """
+        按观测日迭代时间范围内的数据, 缓存有效时从缓存读取, 否则查询数据库并写入缓存
+
+        :param mongodb:         MyMongodb
+        :param database_name:   MongoDB数据库名称
+        :param collection_name: MongoDB数据集合名称
+        :param username:        登录验证的用户名
+        :param pwd:             登录验证的密码
+        :param fields:          查询的字段代码列表
+        :param start:           起始时间 (包含), datetime类型, 可以为空
+        :param end:             结束时间 (不包含), datetime类型, 可以为空
+        :param batch_size:      游标每批从服务器获取的记录条数
+        :param raw:             是否以原始BSON读取记录
+        :return:                每个观测日的数据 (DayBuffer) 的迭代器
+        """
+        days = mongodb.get_distinct_days(database_name, collection_name, username, pwd, start, end)
+        for day in days:
+            day_start = max(day, start) if start is not None else day
+            day_end = min(day + timedelta(days=1), end) if end is not None else day + timedelta(days=1)
+            path = self.get_path(collection_name, fields, day)
+            fingerprint = mongodb.get_fingerprint(database_name, collection_name, username, pwd, day_start, day_end)
+            one_day_data = self.load(path, fingerprint, day_start, day_end)
+            if one_day_data is None:
+                db_data = mongodb.get_collection_data(database_name, collection_name, username, pwd, fields,
+                                                      day_start, day_end, batch_size, raw)
+                if raw:
+                    db_data = RawBSONRecords(db_data)
+                one_day_data = DayBuffer(fields)
+                for data in db_data:
+                    one_day_data.append(data)
+                db_data.close()
+                if len(one_day_data) == 0:
+                    continue
+                self.save(path, one_day_data, fingerprint, day_start, day_end)
+            else:
+                print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Loaded from spool cache: {path}')
+            yield one_day_data
+
+    def load(self, path, fingerprint, start=None, end=None):
+        """
+        读取缓存文件, 文件不存在或指纹、时间范围不一致时返回None
+
+        :param path:        缓存文件路径
+        :param fingerprint: 当前的数据指纹
+        :param start:       起始时间 (包含)
+        :param end:         结束时间 (不包含)
+        :return:            DayBuffer或None
+        """
+        if not os.path.exists(path):
+            return None
+        key = [fingerprint, str(start), str(end)]
+        if path.endswith('.pkl'):
+            with open(path, 'rb') as f:
+                content = pickle.load(f)
+            if content['key'] != key:
+                return None
+            return content['buffer']
+        table = pq.read_table(path)
+        meta = json.loads(table.schema.metadata[b'spool'])
+        if meta['key'] != key:
+            return None
+        columns = {}
+        for i, code in enumerate(meta['codes']):
+            column = table.column(i).combine_chunks()
+            encoding = meta['encodings'][i]
+            if encoding == 'array':
+                values = column.flatten().to_numpy(zero_copy_only=False)
+                columns[code] = values.astype(meta['dtypes'][i]).reshape([len(column)] + meta['shapes'][i])
+            elif encoding == 'number':
+                columns[code] = column.to_numpy(zero_copy_only=False).astype(meta['dtypes'][i])
+            else:
+                values = column.to_pylist()
+                if encoding == 'pickle':
+                    values = [pickle.loads(v) for v in values]
+                columns[code] = np.empty(len(values), dtype=object)
+                for j, value in enumerate(values):  # 逐个赋值, 列表值不展开为多维数组
+                    columns[code][j] = value
+        return DayBuffer.from_columns(meta['codes'], columns, meta['kinds'])
+
+    def save(self, path, one_day_data, fingerprint, start=None, end=None):
+        """
+        写入缓存文件 (先写入临时文件再替换原文件)
+
+        :param path:            缓存文件路径
+        :param one_day_data:    一天的观测数据 (DayBuffer列式缓存)
+        :param fingerprint:     数据指纹
+        :param start:           起始时间 (包含)
+        :param end:             结束时间 (不包含)
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        key = [fingerprint, str(start), str(end)]
+        tmp_path = path + '.tmp'
+        if path.endswith('.pkl'):
+            columns = {code: one_day_data[code] for code in one_day_data.codes}
+            buffer = DayBuffer.from_columns(one_day_data.codes, columns, one_day_data.kinds)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({'key': key, 'buffer': buffer}, f, pickle.HIGHEST_PROTOCOL)
+        else:
+            arrays, encodings, dtypes, shapes = [], [], [], []
+            for code in one_day_data.codes:
+                column = one_day_data[code]
+                kind = one_day_data.kinds.get(code, 'object')
+                dtypes.append(column.dtype.str if kind != 'object' else None)
+                shapes.append(list(column.shape[1:]))
+                if kind == 'array':
+                    width = int(np.prod(column.shape[1:]))
+                    arrays.append(pa.FixedSizeListArray.from_arrays(pa.array(column.reshape(-1)), width))
+                    encodings.append('array')
+                elif kind in ('float', 'int'):
+                    arrays.append(pa.array(column))
+                    encodings.append('number')
+                else:
+                    array = _native_array(column.tolist())
+                    if array is None:
+                        array = pa.array([pickle.dumps(v, pickle.HIGHEST_PROTOCOL) for v in column.tolist()],
+                                         pa.binary())
+                        encodings.append('pickle')
+                    else:
+                        encodings.append('native')
+                    arrays.append(array)
+            meta = {
+                'key': key,
+                'codes': one_day_data.codes,
+                'kinds': {code: one_day_data.kinds.get(code, 'object') for code in one_day_data.codes},
+                'encodings': encodings,
+                'dtypes': dtypes,
+                'shapes': shapes,
+            }
+            names = [f'c{i}' for i in range(len(arrays))]
+            table = pa.Table.from_arrays(arrays, names=names, metadata={'spool': json.dumps(meta)})
+            pq.write_table(table, tmp_path)
+        os.replace(tmp_path, path)
+
+
+def _native_array(values):
+    """
+    将object字段的值转换为Arrow原生数组, 转换后读取的值与原始值 (包括类型) 不完全一致时返回None
+    """
+    try:
+        array = pa.array(values)
+    except (pa.ArrowException, TypeError, ValueError, OverflowError):
+        return None
+    if pa.types.is_null(array.type) or not _same_values(array.to_pylist(), values):
+        return None
+    return array
+
+
+def _same_values(a, b):
+    """
+    判断两个值 (可以是嵌套列表) 的值和类型是否完全一致, NaN视为相等
+    """
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, list):
+        return len(a) == len(b) and all(_same_values(x, y) for x, y in zip(a, b))
+    if isinstance(a, float) and math.isnan(a):
+        return math.isnan(b)
+    return a == b
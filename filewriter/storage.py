@@ -0,0 +1,163 @@
+# -*- coding:utf-8 -*-
+import netCDF4 as nc
+import numpy as np
+
+# CF规范数值时间的单位、日历和缺测值 (时间不做时区转换, 与数据库中保存的时间一致)
+CF_TIME_UNITS = 'seconds since 1970-01-01 00:00:00'
+CF_TIME_CALENDAR = 'standard'
+CF_TIME_FILL_VALUE = nc.default_fillvals['i8']
+# 稀疏变量索引维度的分块长度 (非0元素个数)
+SPARSE_CHUNK = 65536
+
+
+class StorageProfile:
+    def __init__(self, complevel=4, shuffle=True, fletcher32=False, time_chunk=1440, chunks=None, sparse=None):
+        """
+        nc(netCDF4)文件观测要素变量的存储设置 (压缩和分块).
+        只作用于有维度的数值变量, 标量和字符串 (变长类型) 变量不压缩、不分块.
+
+        :param complevel:   deflate压缩级别 (0 ~ 9), 为0时不压缩
+        :param shuffle:     是否启用shuffle过滤器 (压缩前按字节重排, 提高数值数据的压缩率)
+        :param fletcher32:  是否启用fletcher32校验
+        :param time_chunk:  时间维度的分块长度 (记录条数), 超过当天记录条数时取记录条数
+        :param chunks:      其他维度的分块长度, 维度名: 分块长度, 未设置的维度按整个维度分块
+        :param sparse:      以稀疏格式保存的谱变量名 (例如RSD的'Prec_spec', RRD的'Spec_drop_dens'),
+                            只保存非0元素, 见write_array_variable; 默认为空 (全部按稠密数组保存)
+        """
+        self.complevel = complevel
+        self.shuffle = shuffle
+        self.fletcher32 = fletcher32
+        self.time_chunk = time_chunk
+        self.chunks = chunks if chunks is not None else {}
+        self.sparse = tuple(sparse) if sparse is not None else ()
+
+    def __repr__(self):
+        return (f'StorageProfile(complevel={self.complevel}, shuffle={self.shuffle}, '
+                f'fletcher32={self.fletcher32}, time_chunk={self.time_chunk}, chunks={self.chunks}, '
+                f'sparse={self.sparse})')
+
+    def variable_kwargs(self, group, datatype, dimensions):
+        """
+        获取创建变量时的压缩和分块参数
+
+        :param group:       变量所在的组 (netCDF4.Group)
+        :param datatype:    变量的数据类型
+        :param dimensions:  变量的维度名
+        :return:            createVariable的关键字参数 (dict)
+        """
+        if not dimensions or datatype in ('str', str):
+            return {}
+        kwargs = {}
+        if self.complevel > 0:
+            kwargs.update(zlib=True, complevel=self.complevel, shuffle=self.shuffle)
+        if self.fletcher32:
+            kwargs['fletcher32'] = True
+        sizes = [len(group.dimensions[dim]) for dim in dimensions]
+        if kwargs and all(sizes):
+            # 第一个维度为时间维度
+            chunksizes = [min(self.time_chunk, sizes[0])]
+            for dim, size in zip(dimensions[1:], sizes[1:]):
+                chunksizes.append(min(self.chunks.get(dim, size), size))
+            kwargs['chunksizes'] = chunksizes
+        return kwargs
+
+
+def create_variable(group, varname, datatype, dimensions=(), storage_profile=None, **kwargs):
+    """
+    按存储设置创建变量
+
+    :param group:           变量所在的组 (netCDF4.Group)
+    :param varname:         变量名
+    :param datatype:        变量的数据类型
+    :param dimensions:      变量的维度名
+    :param storage_profile: 存储设置 (StorageProfile), 为空时使用netCDF4的默认设置 (不压缩)
+    :param kwargs:          createVariable的其他关键字参数 (例如fill_value)
+    :return:                netCDF4.Variable
+    """
+    if storage_profile is not None:
+        kwargs.update(storage_profile.variable_kwargs(group, datatype, dimensions))
+    return group.createVariable(varname, datatype, dimensions, **kwargs)
+
+
+def write_array_variable(group, varname, datatype, dimensions, values, storage_profile=None):
+    """
+    创建并写入数组变量.
+    变量名在存储设置的sparse中时, 按CF规范的"按收集压缩" (compression by gathering) 以坐标 (COO) 格式保存,
+    只保存非0元素: 索引变量 (变量名+'_index', 维度同名) 保存非0元素在按行展开的数组中的下标 (从0开始),
+    compress属性为原数组的维度名; 数据变量以索引变量的维度为维度, 保存对应的值.
+    读取时由filereader.NCReader还原为稠密数组
+
+    :param group:           变量所在的组 (netCDF4.Group)
+    :param varname:         变量名
+    :param datatype:        变量的数据类型
+    :param dimensions:      变量 (稠密数组) 的维度名
+    :param values:          变量的值, 形状与维度一致
+    :param storage_profile: 存储设置 (StorageProfile)
+    :return:                netCDF4.Variable (稀疏格式时为数据变量)
+    """
+    if storage_profile is None or varname not in storage_profile.sparse:
+        var = create_variable(group, varname, datatype, dimensions, storage_profile)
+        var[:] = values
+        return var
+    values = np.asarray(values).reshape(-1)
+    index = np.flatnonzero(values)
+    index_name = varname + '_index'
+    group.createDimension(index_name, len(index))
+    kwargs = storage_profile.variable_kwargs(group, 'i8', (index_name,))
+    if 'chunksizes' in kwargs:
+        kwargs['chunksizes'] = [min(SPARSE_CHUNK, len(index))]
+    index_var = group.createVariable(index_name, 'i8', (index_name,), **kwargs)
+    index_var[:] = index
+    index_var.compress = ' '.join(dimensions)
+    var = group.createVariable(varname, datatype, (index_name,), **kwargs)
+    var[:] = values[index]
+    return var
+
+
+def create_time_variable(group, varname, dimensions, one_day_data, code, long_name, units, cf_time=False,
+                         storage_profile=None):
+    """
+    创建并写入时间变量.
+    默认保存为 "yyyy-mm-dd hh:mm:ss" 格式的字符串; cf_time为True时保存为CF规范的数值时间
+    (int64, 1970-01-01 00:00:00起的秒数, 带units和calendar属性, 非时间类型的值保存为缺测值)
+
+    :param group:           变量所在的组 (netCDF4.Group)
+    :param varname:         变量名
+    :param dimensions:      变量的维度名
+    :param one_day_data:    一天的观测数据 (DayBuffer列式缓存)
+    :param code:            时间字段代码
+    :param long_name:       变量的描述
+    :param units:           字符串格式时的单位
+    :param cf_time:         是否保存为CF规范的数值时间
+    :param storage_profile: 存储设置 (StorageProfile)
+    :return:                netCDF4.Variable
+    """
+    if cf_time:
+        var = create_variable(group, varname, 'i8', dimensions, storage_profile, fill_value=CF_TIME_FILL_VALUE)
+        var[:] = one_day_data.datetime_seconds(code)
+        var.long_name = long_name
+        var.units = CF_TIME_UNITS
+        var.calendar = CF_TIME_CALENDAR
+    else:
+        var = create_variable(group, varname, 'str', dimensions, storage_profile)
+        var[:] = one_day_data.datetime_strings(code)
+        var.long_name = long_name
+        var.units = units
+    return var
+
+
+# 各设备的默认存储设置: 时间维度按约1MB以内的分块划分, 廓线、谱维度整体作为一个分块
+STORAGE_PROFILES = {
+    'AWS': StorageProfile(),
+    'AERM': StorageProfile(),
+    'VIS': StorageProfile(),
+    'YCCL_L3': StorageProfile(),
+    'PRE': StorageProfile(),
+    'FSD': StorageProfile(chunks={'Dime_numb_part_ch': 20}),
+    'MRD': StorageProfile(chunks={'Dime_HGT_58': 58}),
+    'YCCL_L2': StorageProfile(time_chunk=240, chunks={'Dime_bs_prof': 450}),
+    'RSD': StorageProfile(time_chunk=360, chunks={'Dime_numb_part_diam_clas': 22, 'Dime_numb_part_velo_clas': 20}),
+    'RRD_Lraw': StorageProfile(time_chunk=60, chunks={'Dime_HGT_32': 32, 'Dime_part_diam_clas': 64}),
+    'RRD_Lave': StorageProfile(time_chunk=60, chunks={'Dime_HGT_31': 31, 'Dime_part_diam_clas': 64}),
+    'RRD_Lpro': StorageProfile(time_chunk=60, chunks={'Dime_HGT_31': 31, 'Dime_part_diam_clas': 64}),
+}
@@ -1,30 +1,63 @@
 # -*- coding:utf-8 -*-
 from dbcontroller import MyMongodb
+from instruments import get_instrument, get_time_code
+from .buffer import DayBuffer
+from .encoder import CSVEncoder
+from .manifest import CheckpointManifest
+from .pipeline import DayPipeline
+from .prefetch import CursorPrefetcher
+from .rawbson import RawBSONRecords
+from .spectrum import decode_prec_spec
+from .spool import SpoolCache
+from .storage import STORAGE_PROFILES, create_variable, create_time_variable, write_array_variable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import timedelta
 import os
 import time
-import pandas as pd
 import numpy as np
 import netCDF4 as nc
 
 
 class NCGenerator:
-    def __init__(self, base_dir, ip, username, pwd, db_name, port=27017):
+    def __init__(self, base_dir, ip, username, pwd, db_name, port=27017, storage_profiles=None, cf_time=False,
+                 prefetch=0, batch_size=None, raw_bson=False, check_query=False, spool_dir=None):
         """
         初始化设置
 
-        :param base_dir:    NC文件存储根目录
-        :param ip:          MongoDB数据库服务器IP地址
-        :param username:    登录验证的用户名
-        :param pwd:         登录验证的密码
-        :param db_name:     数据库名称
-        :param port:        MongoDB数据库服务器端口，默认为27017
+        :param base_dir:            NC文件存储根目录
+        :param ip:                  MongoDB数据库服务器IP地址
+        :param username:            登录验证的用户名
+        :param pwd:                 登录验证的密码
+        :param db_name:             数据库名称
+        :param port:                MongoDB数据库服务器端口，默认为27017
+        :param storage_profiles:    各设备观测要素变量的存储设置 (设备名: StorageProfile), 默认为STORAGE_PROFILES,
+                                    未设置的设备不压缩、不分块
+        :param cf_time:             是否将观测时间保存为CF规范的数值时间 (int64, 1970-01-01 00:00:00起的秒数,
+                                    带units和calendar属性), 默认为False (保存为"yyyy-mm-dd hh:mm:ss"格式的字符串)
+        :param prefetch:            后台预读取时队列中最多缓存的记录组数 (每组batch_size条, 默认1000条),
+                                    默认为0 (不预读取, 在主线程中迭代游标)
+        :param batch_size:          游标每批从服务器获取的记录条数, 默认为空 (使用服务器默认值)
+        :param raw_bson:            是否以原始BSON读取记录并直接解码为列式数据 (数值数组不创建Python对象,
+                                    适用于廓线、谱数据较多的设备), 默认为False
+        :param check_query:         导出前是否打印查询的执行计划 (出现全集合扫描或内存排序时警告), 默认为False
+        :param spool_dir:           本地缓存目录, 设置时每个观测日的查询结果缓存为列式文件, 数据未变化时
+                                    再次导出直接读取缓存, 默认为空 (不缓存)
         """
-        self.mongodb = MyMongodb(ip, port)
+        self.mongodb = MyMongodb(ip, port, username, pwd, db_name)
+        self.ip = ip
+        self.port = port
         self.db_name = db_name
         self.username = username
         self.pwd = pwd
-        self.one_day_date = []
         self.base_dir = base_dir
+        self.storage_profiles = dict(STORAGE_PROFILES) if storage_profiles is None else storage_profiles
+        self.cf_time = cf_time
+        self.prefetch = prefetch
+        self.batch_size = batch_size
+        self.raw_bson = raw_bson
+        self.check_query = check_query
+        self.spool_dir = spool_dir
+        self.spool = SpoolCache(spool_dir) if spool_dir is not None else None
 
     @staticmethod
     def generate_filename(class01, class03, class04, station_code, data_code, manufacturer_code, data_level,
@@ -59,13 +92,15 @@ class NCGenerator:
         filename += '.nc'
         return filename
 
-    def generate_one_day_nc_file(self, instrument_name, header_info_code, header_info_longname, header_info_unit,
-                                 header_info_nc_type, header_info_value, obs_info_code, obs_info_longname,
-                                 obs_info_unit, obs_info_nc_type):
+    def generate_one_day_nc_file(self, instrument_name, one_day_data, header_info_code, header_info_longname,
+                                 header_info_unit, header_info_nc_type, header_info_value, obs_info_code,
+                                 obs_info_longname, obs_info_unit, obs_info_nc_type):
         """
-        生成一天数据的nc(netCDF4)文件
+        生成一天数据的nc(netCDF4)文件.
+        该函数不修改实例状态和传入的参数 (header_info_value可以是tuple等不可变序列), 可在多个线程或进程中同时调用.
 
         :param instrument_name:         设备名
+        :param one_day_data:            一天的观测数据 (DayBuffer列式缓存)
         :param header_info_code:        文件头描述信息字段代码
         :param header_info_longname:    文件头描述信息字段中英文描述
         :param header_info_unit:        文件头描述信息字段单位
@@ -75,101 +110,32 @@ class NCGenerator:
         :param obs_info_longname:       观测信息字段中英文描述
         :param obs_info_unit:           观测信息字段单位
         :param obs_info_nc_type:        观测信息字段对应nc文件中保存的数据类型
+        :return:                        生成的文件路径 (路径+文件名), 设备名无效时返回None
         """
-        if instrument_name == 'MRD':
-            start_time = self.one_day_date[0]['Datetime_301']
-            end_time = self.one_day_date[-1]['Datetime_301']
-        else:
-            start_time = self.one_day_date[0]['Datetime']  # 一天中记录开始时间
-            end_time = self.one_day_date[-1]['Datetime']  # 一天中记录结束时间
+        spec = get_instrument(instrument_name)
+        if spec is None:
+            print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Invalid device name: {instrument_name}')
+            return
+        start_time = one_day_data[spec.time_code][0]  # 一天中记录开始时间
         # 根据设备名、开始时间的年和月确定保存路径："./base/instrument_name/year/month"
-        # print(start_time, end_time)
         path = self.base_dir + '/' + instrument_name + '/' + str(start_time.year) + '/' + str(start_time.month) + '/'
         if not os.path.exists(path):
             os.makedirs(path)
-        # 根据设备名确定每个nc文件的文件名
-        if instrument_name == 'AWS':  # 六要素自动站
-            filename = self.generate_filename('SURF', 'MOBS', 'SUOB', 'LSYW', 'AWS', 'HY', 'LX', start_time, 'FMT')
-        elif instrument_name == 'PRE':  # 雨量筒
-            filename = self.generate_filename('SURF', 'MOBS', 'SUOB', 'LSYW', 'PRE', 'HOBO', 'LX', start_time, 'FMT')
-        elif instrument_name == 'VIS':  # 能见度仪
-            filename = self.generate_filename('SURF', 'MOBS', 'SUOB', 'LSYW', 'VIS', 'VAIS', 'LX', start_time, 'FMT')
-        elif instrument_name == 'FSD':  # 雾滴谱资料
-            filename = self.generate_filename('SURF', 'MOBS', 'SUOB', 'LSYW', 'FSD', 'DMT', 'LX', start_time, 'FMT')
-        elif instrument_name == 'RSD':  # 雨滴谱资料
-            filename = self.generate_filename('SURF', 'MOBS', 'SUOB', 'LSYW', 'RSD', 'THIE', 'LX', start_time, 'FMT')
-        elif instrument_name == 'YCCL_L2':  # 云高仪二级数据, 无质控码
-            filename = self.generate_filename('UPAR', 'MOBS', 'SUOB', 'LSYW', 'YCCL', 'VAIS', 'L2', start_time, 'FMT',
-                                          is_quality_control=False)
-        elif instrument_name == 'YCCL_L3':  # 云高仪三级数据, 无质控码
-            filename = self.generate_filename('UPAR', 'MOBS', 'SUOB', 'LSYW', 'YCCL', 'VAIS', 'L3', start_time, 'FMT',
-                                          is_quality_control=False)
-        elif instrument_name == 'RRD_Lave':  # 微雨雷达探测资料平均数据
-            filename = self.generate_filename('RADA', 'MOBS', 'SUOB', 'LSYW', 'RRD', 'METE', 'Lave', start_time, 'FMT')
-        elif instrument_name == 'RRD_Lpro':  # 微雨雷达探测资料再处理数据
-            filename = self.generate_filename('RADA', 'MOBS', 'SUOB', 'LSYW', 'RRD', 'METE', 'Lpro', start_time, 'FMT')
-        elif instrument_name == 'RRD_Lraw':  # 微雨雷达探测资料原始数据
-            filename = self.generate_filename('RADA', 'MOBS', 'SUOB', 'LSYW', 'RRD', 'METE', 'Lraw', start_time, 'FMT')
-        elif instrument_name == 'MRD':  # 微波辐射计探测资料二级数据 (目前只有二级数据)
-            filename = self.generate_filename('UPAR', 'MOBS', 'SUOB', 'LSYW', 'MRD', 'RAD', 'L2', start_time, 'FMT')
-        elif instrument_name == 'AERM':  # 颗粒物仪
-            filename = self.generate_filename('SURF', 'MOBS', 'SUOB', 'LSYW', 'AERM', 'THER', 'LX', start_time, 'FMT')
-        else:
-            print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Invalid device name: {instrument_name}')
-            return
-        # 修改数据记录起始和结束时间、文件生成时间
-        header_info_value[-4] = start_time.strftime("%Y-%m-%d %H:%M:%S")
-        header_info_value[-3] = end_time.strftime("%Y-%m-%d %H:%M:%S")
-        header_info_value[-2] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
-        # 按instrument_name选择生成函数
-        if instrument_name in ['AWS', 'AERM', 'VIS', 'YCCL_L3']:  # 观测要素只有'Datetime'一个维度的设备数据
-            self.generate_one_day_one_dim_nc_file(header_info_code, header_info_longname, header_info_unit,
-                                                  header_info_nc_type, header_info_value, obs_info_code,
-                                                  obs_info_longname, obs_info_unit, obs_info_nc_type,
-                                                  path + filename, instrument_name)
-        # 以下为需要单独设置文件结构的设备
-        elif instrument_name == 'RSD':
-            self.generate_one_day_rsd_nc_file(header_info_code, header_info_longname, header_info_unit,
-                                              header_info_nc_type, header_info_value, obs_info_code, obs_info_longname,
-                                              obs_info_unit, obs_info_nc_type, path + filename)
-        elif instrument_name == 'MRD':
-            self.generate_one_day_mrd_nc_file(header_info_code, header_info_longname, header_info_unit,
-                                              header_info_nc_type, header_info_value, obs_info_code, obs_info_longname,
-                                              obs_info_unit, obs_info_nc_type, path + filename)
-        elif instrument_name == 'YCCL_L2':
-            self.generate_one_day_yccl_l2_nc_file(header_info_code, header_info_longname, header_info_unit,
-                                                  header_info_nc_type, header_info_value, obs_info_code,
-                                                  obs_info_longname, obs_info_unit, obs_info_nc_type, path + filename)
-        elif instrument_name == 'RRD_Lave':
-            self.generate_one_day_rrd_lave_nc_file(header_info_code, header_info_longname, header_info_unit,
-                                                   header_info_nc_type, header_info_value, obs_info_code,
-                                                   obs_info_longname, obs_info_unit, obs_info_nc_type, path + filename,
-                                                   'Lave')
-        elif instrument_name == 'RRD_Lraw':
-            self.generate_one_day_rrd_lraw_nc_file(header_info_code, header_info_longname, header_info_unit,
-                                                   header_info_nc_type, header_info_value, obs_info_code,
-                                                   obs_info_longname, obs_info_unit, obs_info_nc_type, path + filename)
-        elif instrument_name == 'RRD_Lpro':
-            self.generate_one_day_rrd_lave_nc_file(header_info_code, header_info_longname, header_info_unit,
-                                                   header_info_nc_type, header_info_value, obs_info_code,
-                                                   obs_info_longname, obs_info_unit, obs_info_nc_type, path + filename,
-                                                   'Lpro')
-        elif instrument_name == 'FSD':
-            self.generate_one_day_fsd_nc_file(header_info_code, header_info_longname, header_info_unit,
-                                              header_info_nc_type, header_info_value, obs_info_code, obs_info_longname,
-                                              obs_info_unit, obs_info_nc_type, path + filename)
-        elif instrument_name == 'PRE':
-            self.generate_one_day_pre_nc_file(header_info_code, header_info_longname, header_info_unit,
-                                              header_info_nc_type, header_info_value, obs_info_code, obs_info_longname,
-                                              obs_info_unit, obs_info_nc_type, path + filename)
-        else:
-            print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] '
-                  f'Have no custom generate function for this device: {instrument_name}')
-            return
-
-    def generate_one_day_pre_nc_file(self, header_info_code, header_info_longname, header_info_unit,
+        # 根据设备注册的文件名代码确定每个nc文件的文件名
+        filename = self.generate_filename(*spec.filename_codes, start_time, 'FMT',
+                                          is_quality_control=spec.is_quality_control)
+        # 设备的文件头规则, 数据记录起始和结束时间、文件生成时间 (在副本上修改, 不改变调用者传入的值)
+        header_info_value = finalize_header(spec, one_day_data, header_info_value, spec.header_overrides)
+        # 使用设备注册的生成函数
+        getattr(self, spec.nc_writer)(one_day_data, header_info_code, header_info_longname, header_info_unit,
+                                      header_info_nc_type, header_info_value, obs_info_code, obs_info_longname,
+                                      obs_info_unit, obs_info_nc_type, path + filename, *spec.nc_writer_args,
+                                      self.storage_profiles.get(instrument_name))
+        return path + filename
+
+    def generate_one_day_pre_nc_file(self, one_day_data, header_info_code, header_info_longname, header_info_unit,
                                      header_info_nc_type, header_info_value, obs_info_code, obs_info_longname,
-                                     obs_info_unit, obs_info_nc_type, save_path):
+                                     obs_info_unit, obs_info_nc_type, save_path, storage_profile=None):
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Generating PRE\'s '
               f'nc(netCDF4) file: {header_info_value[-4]} ~ {header_info_value[-3]}')
         nc_obj = nc.Dataset(save_path, 'w', 'NETCDF4')
@@ -206,90 +172,78 @@ class NCGenerator:
             var.units = header_info_unit[i]
         # --------------------------------------------------观测要素组-------------------------------------------------- #
         obs_group = nc_obj.createGroup('observational_information')
-        tem_list = []
-        pre_list = []
-        tem_max_pre_cum = []
-        for i in range(len(self.one_day_date)):
-            if self.one_day_date[i]['TEM'] != 'Nan':
-                tem_list.append(self.one_day_date[i])
-            if self.one_day_date[i]['PRE'] != 'Nan':
-                pre_list.append(self.one_day_date[i])
-            if self.one_day_date[i]['TEM_Max'] != 'Nan' or self.one_day_date[i]['PRE_Cum'] != 'Nan':
-                tem_max_pre_cum.append(self.one_day_date[i])
+        tem_list = one_day_data.subset(one_day_data.not_equal('TEM', 'Nan'))
+        pre_list = one_day_data.subset(one_day_data.not_equal('PRE', 'Nan'))
+        tem_max_pre_cum = one_day_data.subset(one_day_data.not_equal('TEM_Max', 'Nan') |
+                                              one_day_data.not_equal('PRE_Cum', 'Nan'))
         # 资料时间
-        obs_group.createDimension('Datetime', len(self.one_day_date))
-        var = obs_group.createVariable('Datetime', 'str', ('Datetime',))
-        var[:] = np.array([d['Datetime'].strftime("%Y-%m-%d %H:%M:%S") for d in self.one_day_date])
-        var.long_name = 'Datetime'
-        var.units = 'yyyy-mm-dd hh:mm:ss'
+        obs_group.createDimension('Datetime', len(one_day_data))
+        create_time_variable(obs_group, 'Datetime', ('Datetime',), one_day_data, 'Datetime', 'Datetime',
+                             'yyyy-mm-dd hh:mm:ss', self.cf_time, storage_profile)
 
         # 温度时间：
         if len(tem_list) != 0:
             obs_group.createDimension('Datetime_Temp', len(tem_list))
-            var = obs_group.createVariable('Datetime_Temp', 'str', ('Datetime_Temp',))
-            var[:] = np.array([d['Datetime'].strftime("%Y-%m-%d %H:%M:%S") for d in tem_list])
-            var.long_name = 'Datetime of temperature'
-            var.units = 'yyyy-mm-dd hh:mm:ss'
+            create_time_variable(obs_group, 'Datetime_Temp', ('Datetime_Temp',), tem_list, 'Datetime',
+                                 'Datetime of temperature', 'yyyy-mm-dd hh:mm:ss', self.cf_time, storage_profile)
 
-            var = obs_group.createVariable('Temp', 'f', ('Datetime_Temp',))
-            var[:] = np.array([float(d['TEM']) for d in tem_list])
+            var = create_variable(obs_group, 'Temp', 'f', ('Datetime_Temp',), storage_profile=storage_profile)
+            var[:] = tem_list['TEM'].astype(float)
             var.long_name = 'Temperature'
             var.units = '°C'
 
-            var = obs_group.createVariable('Q_Temp', 'u1', ('Datetime_Temp',))
-            val = np.array([str(d['Q_TEM']) for d in tem_list])
-            var[:] = np.array([str(d['Q_TEM']) for d in tem_list])
+            var = create_variable(obs_group, 'Q_Temp', 'u1', ('Datetime_Temp',), storage_profile=storage_profile)
+            var[:] = np.array([str(v) for v in tem_list['Q_TEM']])
             var.long_name = 'Quality control code of temperature'
             var.units = '-'
 
         # 降雨量时间
         if len(pre_list) != 0:
             obs_group.createDimension('Datetime_Prec', len(pre_list))
-            var = obs_group.createVariable('Datetime_Prec', 'str', ('Datetime_Prec',))
-            var[:] = np.array([d['Datetime'].strftime("%Y-%m-%d %H:%M:%S") for d in pre_list])
-            var.long_name = 'Datetime of precipitation'
-            var.units = 'yyyy-mm-dd hh:mm:ss'
+            create_time_variable(obs_group, 'Datetime_Prec', ('Datetime_Prec',), pre_list, 'Datetime',
+                                 'Datetime of precipitation', 'yyyy-mm-dd hh:mm:ss', self.cf_time, storage_profile)
 
-            var = obs_group.createVariable('Prec', 'f', ('Datetime_Prec',))
-            var[:] = np.array([float(d['PRE']) for d in pre_list])
+            var = create_variable(obs_group, 'Prec', 'f', ('Datetime_Prec',), storage_profile=storage_profile)
+            var[:] = pre_list['PRE'].astype(float)
             var.long_name = 'Precipitation'
             var.units = 'mm'
 
-            var = obs_group.createVariable('Q_Prec', 'u1', ('Datetime_Prec',))
-            var[:] = np.array([str(d['Q_PRE']) for d in pre_list])
+            var = create_variable(obs_group, 'Q_Prec', 'u1', ('Datetime_Prec',), storage_profile=storage_profile)
+            var[:] = np.array([str(v) for v in pre_list['Q_PRE']])
             var.long_name = 'Quality control code of precipitation'
             var.units = '-'
 
         # 整点时间
         if len(tem_max_pre_cum) != 0:
             obs_group.createDimension('Datetime_oclock', len(tem_max_pre_cum))
-            var = obs_group.createVariable('Datetime_oclock', 'str', ('Datetime_oclock',))
-            var[:] = np.array([d['Datetime'].strftime("%Y-%m-%d %H:%M:%S") for d in tem_max_pre_cum])
-            var.long_name = 'Date and o\'clock of temperature maximum and cumulative precipitation'
-            var.units = 'yyyy-mm-dd hh:mm:ss'
-            var = obs_group.createVariable('Temp_MAX', 'f', ('Datetime_oclock',))
-            var[:] = np.array([float(d['TEM_Max']) for d in tem_max_pre_cum])
+            create_time_variable(obs_group, 'Datetime_oclock', ('Datetime_oclock',), tem_max_pre_cum, 'Datetime',
+                                 'Date and o\'clock of temperature maximum and cumulative precipitation',
+                                 'yyyy-mm-dd hh:mm:ss', self.cf_time, storage_profile)
+            var = create_variable(obs_group, 'Temp_MAX', 'f', ('Datetime_oclock',), storage_profile=storage_profile)
+            var[:] = tem_max_pre_cum['TEM_Max'].astype(float)
             var.long_name = 'Temperature maximum'
             var.units = '°C'
-            var = obs_group.createVariable('Q_Temp_MAX', 'u1', ('Datetime_oclock',))
-            var[:] = np.array([str(d['Q_TEM_Max']) for d in tem_max_pre_cum])
+            var = create_variable(obs_group, 'Q_Temp_MAX', 'u1', ('Datetime_oclock',), storage_profile=storage_profile)
+            var[:] = np.array([str(v) for v in tem_max_pre_cum['Q_TEM_Max']])
             var.long_name = 'Quality control code of temperature maximum'
             var.units = '-'
 
-            var = obs_group.createVariable('Prec_cumu', 'f', ('Datetime_oclock',))
-            var[:] = np.array([float(d['PRE_Cum']) for d in tem_max_pre_cum])
+            var = create_variable(obs_group, 'Prec_cumu', 'f', ('Datetime_oclock',), storage_profile=storage_profile)
+            var[:] = tem_max_pre_cum['PRE_Cum'].astype(float)
             var.long_name = 'Cumulative precipitation'
             var.units = 'mm'
-            var = obs_group.createVariable('Q_Prec_cumu', 'u1', ('Datetime_oclock',))
-            var[:] = np.array([str(d['Q_PRE_Cum']) for d in tem_max_pre_cum])
+            var = create_variable(obs_group, 'Q_Prec_cumu', 'u1', ('Datetime_oclock',), storage_profile=storage_profile)
+            var[:] = np.array([str(v) for v in tem_max_pre_cum['Q_PRE_Cum']])
             var.long_name = 'Quality control code of cumulative precipitation'
             var.units = '-'
 
         nc_obj.close()
+        print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] save {save_path} success!')
+        return save_path
 
-    def generate_one_day_fsd_nc_file(self, header_info_code, header_info_longname, header_info_unit,
+    def generate_one_day_fsd_nc_file(self, one_day_data, header_info_code, header_info_longname, header_info_unit,
                                      header_info_nc_type, header_info_value, obs_info_code, obs_info_longname,
-                                     obs_info_unit, obs_info_nc_type, save_path):
+                                     obs_info_unit, obs_info_nc_type, save_path, storage_profile=None):
         """
         生成FSD(雾滴谱资料) nc文件的函数
 
@@ -348,32 +302,29 @@ class NCGenerator:
         obs_group = nc_obj.createGroup('observational_information')
         obs_group.createDimension('Dime_numb_part_ch', 20)
         # 单独设置时间维度
-        obs_group.createDimension(obs_info_code[0], len(self.one_day_date))
-        var = obs_group.createVariable(
-            obs_info_code[0], obs_info_nc_type[0], (obs_info_code[0],))
-        val = np.array([d[obs_info_code[0]].strftime("%Y-%m-%d %H:%M:%S") for d in self.one_day_date], dtype='object')
-        var[:] = val
-        var.long_name = obs_info_longname[0]
-        var.units = obs_info_unit[0]
-        for v in self.one_day_date:
-            if v['Volu_conc'] == 'NULL':
-                v['Volu_conc'] = 'Nan'
+        obs_group.createDimension(obs_info_code[0], len(one_day_data))
+        create_time_variable(obs_group, obs_info_code[0], (obs_info_code[0],), one_day_data, obs_info_code[0],
+                             obs_info_longname[0], obs_info_unit[0], self.cf_time, storage_profile)
         for i in range(1, len(obs_info_code)):
             if 'Numb_part_ch' not in obs_info_code[i]:
-                var = obs_group.createVariable(
-                    obs_info_code[i], obs_info_nc_type[i], (obs_info_code[0],))
+                var = create_variable(
+                    obs_group, obs_info_code[i], obs_info_nc_type[i], (obs_info_code[0],),
+                    storage_profile=storage_profile)
                 # if obs_info_nc_type[i] == 'f':
-                #     val = [float(d[obs_info_code[i]]) for d in self.one_day_date]
+                #     val = [float(d[obs_info_code[i]]) for d in one_day_data]
                 # elif obs_info_nc_type[i] == 'i':
-                #     val = [int(d[obs_info_code[i]]) for d in self.one_day_date]
+                #     val = [int(d[obs_info_code[i]]) for d in one_day_data]
                 # else:
-                #     val = [str(d[obs_info_code[i]]) for d in self.one_day_date]
-                val = [d[obs_info_code[i]] for d in self.one_day_date]
-                var[:] = np.array(val)
+                #     val = [str(d[obs_info_code[i]]) for d in one_day_data]
+                if obs_info_code[i] == 'Volu_conc':
+                    val = np.array(['Nan' if v == 'NULL' else v for v in one_day_data[obs_info_code[i]].tolist()])
+                else:
+                    val = one_day_data.values(obs_info_code[i])
+                var[:] = val
                 var.long_name = obs_info_longname[i]
                 var.units = obs_info_unit[i]
-        var = obs_group.createVariable(
-            'Numb_part_chan', 'f', (obs_info_code[0], 'Dime_numb_part_ch',))
+        var = create_variable(
+            obs_group, 'Numb_part_chan', 'f', (obs_info_code[0], 'Dime_numb_part_ch',), storage_profile=storage_profile)
         numb_part_chan_code = [
             'Numb_part_ch0',
             'Numb_part_ch1',
@@ -396,19 +347,16 @@ class NCGenerator:
             'Numb_part_ch18',
             'Numb_part_ch19'
         ]
-        numb_part_chan_list = []
-        for code in numb_part_chan_code:
-            val = [float(d[code]) for d in self.one_day_date]
-            numb_part_chan_list.append(val)
-        var[:] = np.transpose(numb_part_chan_list)
+        var[:] = np.column_stack([one_day_data[code].astype(float) for code in numb_part_chan_code])
         var.long_name = 'Particles number per channel'
         var.units = '-'
         nc_obj.close()
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] save {save_path} success!')
+        return save_path
 
-    def generate_one_day_rrd_lraw_nc_file(self, header_info_code, header_info_longname, header_info_unit,
+    def generate_one_day_rrd_lraw_nc_file(self, one_day_data, header_info_code, header_info_longname, header_info_unit,
                                           header_info_nc_type, header_info_value, obs_info_code, obs_info_longname,
-                                          obs_info_unit, obs_info_nc_type, save_path):
+                                          obs_info_unit, obs_info_nc_type, save_path, storage_profile=None):
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Generating RRD_Lraw\'s nc(netCDF4) '
               f'file: {header_info_value[-4]} ~ {header_info_value[-3]}')
         nc_obj = nc.Dataset(save_path, 'w', 'NETCDF4')
@@ -448,55 +396,46 @@ class NCGenerator:
         obs_group.createDimension('Dime_HGT_32', 32)
         obs_group.createDimension('Dime_part_diam_clas', 64)
         # 单独设置时间维度
-        obs_group.createDimension(obs_info_code[0], len(self.one_day_date))
-        var = obs_group.createVariable(
-            obs_info_code[0], obs_info_nc_type[0], (obs_info_code[0],))
-        val = np.array([d[obs_info_code[0]].strftime("%Y-%m-%d %H:%M:%S") for d in self.one_day_date], dtype='object')
-        var[:] = val
-        var.long_name = obs_info_longname[0]
-        var.units = obs_info_unit[0]
+        obs_group.createDimension(obs_info_code[0], len(one_day_data))
+        create_time_variable(obs_group, obs_info_code[0], (obs_info_code[0],), one_day_data, obs_info_code[0],
+                             obs_info_longname[0], obs_info_unit[0], self.cf_time, storage_profile)
 
         for i in range(1, len(obs_info_code)):
             if 'array32' not in obs_info_nc_type[i] and 'array64' not in obs_info_nc_type[i]:
-                var = obs_group.createVariable(
-                    obs_info_code[i], obs_info_nc_type[i], (obs_info_code[0],))
+                var = create_variable(
+                    obs_group, obs_info_code[i], obs_info_nc_type[i], (obs_info_code[0],),
+                    storage_profile=storage_profile)
                 if obs_info_nc_type[i] == 'f':
-                    val = [float(d[obs_info_code[i]]) for d in self.one_day_date]
+                    val = one_day_data[obs_info_code[i]].astype(float)
                 elif obs_info_nc_type[i] == 'i':
-                    val = [int(d[obs_info_code[i]]) for d in self.one_day_date]
+                    val = np.array([int(v) for v in one_day_data[obs_info_code[i]]])
                 else:
-                    val = [str(d[obs_info_code[i]]) for d in self.one_day_date]
-                var[:] = np.array(val)
+                    val = np.array([str(v) for v in one_day_data[obs_info_code[i]]])
+                var[:] = val
                 var.long_name = obs_info_longname[i]
                 var.units = obs_info_unit[i]
             else:
-                val = [j[obs_info_code[i]] for j in self.one_day_date]
+                val = one_day_data.values(obs_info_code[i])
                 if obs_info_nc_type[i] == 'array32_i':
-                    var = obs_group.createVariable(
-                        obs_info_code[i], 'u2', ('Datetime', 'Dime_HGT_32',))
-                    # var[:, :] = val
+                    datatype, dimensions = 'u2', ('Datetime', 'Dime_HGT_32',)
                 elif obs_info_nc_type[i] == 'array32_d':
-                    var = obs_group.createVariable(
-                        obs_info_code[i], 'd', ('Datetime', 'Dime_HGT_32',))
-                    # var[:, :] = val
+                    datatype, dimensions = 'd', ('Datetime', 'Dime_HGT_32',)
                 else:
-                    var = obs_group.createVariable(
-                        obs_info_code[i], 'd', ('Datetime', 'Dime_HGT_32', 'Dime_part_diam_clas'))
-                    for k in range(len(val)):
-                        val[k] = np.transpose(val[k])
-                var[:] = val
+                    datatype, dimensions = 'd', ('Datetime', 'Dime_HGT_32', 'Dime_part_diam_clas')
+                    val = np.transpose(val, (0, 2, 1))
+                var = write_array_variable(obs_group, obs_info_code[i], datatype, dimensions, val, storage_profile)
                 var.long_name = obs_info_longname[i]
                 var.units = obs_info_unit[i]
         nc_obj.close()
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] save {save_path} success!')
+        return save_path
 
-    def generate_one_day_rrd_lave_nc_file(self, header_info_code, header_info_longname, header_info_unit,
+    def generate_one_day_rrd_lave_nc_file(self, one_day_data, header_info_code, header_info_longname, header_info_unit,
                                           header_info_nc_type, header_info_value, obs_info_code, obs_info_longname,
-                                          obs_info_unit, obs_info_nc_type, save_path, instrument_name):
-
-        header_info_value[15] = instrument_name
-        print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Generating RRD_Lave\'s nc(netCDF4) '
-              f'file: {header_info_value[-4]} ~ {header_info_value[-3]}')
+                                          obs_info_unit, obs_info_nc_type, save_path, instrument_name,
+                                          storage_profile=None):
+        print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Generating RRD_{instrument_name}\'s '
+              f'nc(netCDF4) file: {header_info_value[-4]} ~ {header_info_value[-3]}')
         nc_obj = nc.Dataset(save_path, 'w', 'NETCDF4')
         # -------------------------------------------------头文件信息组------------------------------------------------- #
         # 头文件信息组中包含三个组 (站点信息组、 设备信息组以及数据参数组)
@@ -534,49 +473,43 @@ class NCGenerator:
         obs_group.createDimension('Dime_HGT_31', 31)
         obs_group.createDimension('Dime_part_diam_clas', 64)
         # 单独设置时间维度
-        obs_group.createDimension(obs_info_code[0], len(self.one_day_date))
-        var = obs_group.createVariable(
-            obs_info_code[0], obs_info_nc_type[0], (obs_info_code[0],))
-        val = np.array([d[obs_info_code[0]].strftime("%Y-%m-%d %H:%M:%S") for d in self.one_day_date], dtype='object')
-        var[:] = val
-        var.long_name = obs_info_longname[0]
-        var.units = obs_info_unit[0]
+        obs_group.createDimension(obs_info_code[0], len(one_day_data))
+        create_time_variable(obs_group, obs_info_code[0], (obs_info_code[0],), one_day_data, obs_info_code[0],
+                             obs_info_longname[0], obs_info_unit[0], self.cf_time, storage_profile)
 
         for i in range(1, len(obs_info_code)):
             if 'array31' not in obs_info_nc_type[i] and 'array64' not in obs_info_nc_type[i]:
-                var = obs_group.createVariable(
-                    obs_info_code[i], obs_info_nc_type[i], (obs_info_code[0],))
+                var = create_variable(
+                    obs_group, obs_info_code[i], obs_info_nc_type[i], (obs_info_code[0],),
+                    storage_profile=storage_profile)
                 if obs_info_nc_type[i] == 'f':
-                    val = [float(d[obs_info_code[i]]) for d in self.one_day_date]
+                    val = one_day_data[obs_info_code[i]].astype(float)
                 elif obs_info_nc_type[i] == 'i':
-                    val = [int(d[obs_info_code[i]]) for d in self.one_day_date]
+                    val = np.array([int(v) for v in one_day_data[obs_info_code[i]]])
                 else:
-                    val = [str(d[obs_info_code[i]]) for d in self.one_day_date]
-                var[:] = np.array(val)
+                    val = np.array([str(v) for v in one_day_data[obs_info_code[i]]])
+                var[:] = val
                 var.long_name = obs_info_longname[i]
                 var.units = obs_info_unit[i]
             else:
-                val = [j[obs_info_code[i]] for j in self.one_day_date]
+                val = one_day_data.values(obs_info_code[i])
                 if obs_info_nc_type[i] == 'array31_i':
-                    var = obs_group.createVariable(
-                        obs_info_code[i], 'u2', ('Datetime', 'Dime_HGT_31',))
+                    datatype, dimensions = 'u2', ('Datetime', 'Dime_HGT_31',)
                 elif obs_info_nc_type[i] == 'array31_f':
-                    var = obs_group.createVariable(
-                        obs_info_code[i], 'd', ('Datetime', 'Dime_HGT_31',))
+                    datatype, dimensions = 'd', ('Datetime', 'Dime_HGT_31',)
                 else:
-                    var = obs_group.createVariable(
-                        obs_info_code[i], 'd', ('Datetime', 'Dime_HGT_31', 'Dime_part_diam_clas'))
-                    for k in range(len(val)):
-                        val[k] = np.transpose(val[k])
-                var[:] = val
+                    datatype, dimensions = 'd', ('Datetime', 'Dime_HGT_31', 'Dime_part_diam_clas')
+                    val = np.transpose(val, (0, 2, 1))
+                var = write_array_variable(obs_group, obs_info_code[i], datatype, dimensions, val, storage_profile)
                 var.long_name = obs_info_longname[i]
                 var.units = obs_info_unit[i]
         nc_obj.close()
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] save {save_path} success!')
+        return save_path
 
-    def generate_one_day_yccl_l2_nc_file(self, header_info_code, header_info_longname, header_info_unit,
+    def generate_one_day_yccl_l2_nc_file(self, one_day_data, header_info_code, header_info_longname, header_info_unit,
                                          header_info_nc_type, header_info_value, obs_info_code, obs_info_longname,
-                                         obs_info_unit, obs_info_nc_type, save_path):
+                                         obs_info_unit, obs_info_nc_type, save_path, storage_profile=None):
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Generating YCCL_L2\'s nc(netCDF4) '
               f'file: {header_info_value[-4]} ~ {header_info_value[-3]}')
         nc_obj = nc.Dataset(save_path, 'w', 'NETCDF4')
@@ -615,40 +548,37 @@ class NCGenerator:
         obs_group = nc_obj.createGroup('observational_information')
         obs_group.createDimension('Dime_bs_prof', 450)
         # 单独设置时间维度
-        obs_group.createDimension(obs_info_code[0], len(self.one_day_date))
-        var = obs_group.createVariable(
-            obs_info_code[0], obs_info_nc_type[0], (obs_info_code[0],))
-        val = np.array([d[obs_info_code[0]].strftime("%Y-%m-%d %H:%M:%S") for d in self.one_day_date], dtype='object')
-        var[:] = val
-        var.long_name = obs_info_longname[0]
-        var.units = obs_info_unit[0]
+        obs_group.createDimension(obs_info_code[0], len(one_day_data))
+        create_time_variable(obs_group, obs_info_code[0], (obs_info_code[0],), one_day_data, obs_info_code[0],
+                             obs_info_longname[0], obs_info_unit[0], self.cf_time, storage_profile)
 
         for i in range(1, len(obs_info_code)):
             if obs_info_nc_type[i] != 'array':
-                var = obs_group.createVariable(
-                    obs_info_code[i], obs_info_nc_type[i], (obs_info_code[0],))
+                var = create_variable(
+                    obs_group, obs_info_code[i], obs_info_nc_type[i], (obs_info_code[0],),
+                    storage_profile=storage_profile)
                 if obs_info_nc_type[i] == 'f':
-                    val = [float(d[obs_info_code[i]]) for d in self.one_day_date]
+                    val = one_day_data[obs_info_code[i]].astype(float)
                 elif obs_info_nc_type[i] == 'i':
-                    val = [int(d[obs_info_code[i]]) for d in self.one_day_date]
+                    val = np.array([int(v) for v in one_day_data[obs_info_code[i]]])
                 else:
-                    val = [str(d[obs_info_code[i]]) for d in self.one_day_date]
-                var[:] = np.array(val)
+                    val = np.array([str(v) for v in one_day_data[obs_info_code[i]]])
+                var[:] = val
                 var.long_name = obs_info_longname[i]
                 var.units = obs_info_unit[i]
             else:
-                val = [j[obs_info_code[i]] for j in self.one_day_date]
-                var = obs_group.createVariable(
-                    obs_info_code[i], 'u4', ('Datetime', 'Dime_bs_prof',))
-                var[:] = val
+                var = create_variable(
+                    obs_group, obs_info_code[i], 'u4', ('Datetime', 'Dime_bs_prof',), storage_profile=storage_profile)
+                var[:] = one_day_data.values(obs_info_code[i])
                 var.long_name = obs_info_longname[i]
                 var.units = obs_info_unit[i]
         nc_obj.close()
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] save {save_path} success!')
+        return save_path
 
-    def generate_one_day_mrd_nc_file(self, header_info_code, header_info_longname, header_info_unit,
+    def generate_one_day_mrd_nc_file(self, one_day_data, header_info_code, header_info_longname, header_info_unit,
                                      header_info_nc_type, header_info_value, obs_info_code, obs_info_longname,
-                                     obs_info_unit, obs_info_nc_type, save_path):
+                                     obs_info_unit, obs_info_nc_type, save_path, storage_profile=None):
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Generating MRD\'s nc(netCDF4) '
               f'file: {header_info_value[-4]} ~ {header_info_value[-3]}')
         nc_obj = nc.Dataset(save_path, 'w', 'NETCDF4')
@@ -693,60 +623,43 @@ class NCGenerator:
         obs_group = nc_obj.createGroup('observational_information')
         obs_group.createDimension('Dime_HGT_58', 58)
         # 单独设置时间维度
-        obs_group.createDimension(obs_info_code[0], len(self.one_day_date))
-        var = obs_group.createVariable(
-            obs_info_code[0], obs_info_nc_type[0], (obs_info_code[0],))
-        date_val = []
-        for date in self.one_day_date:
-            if date[obs_info_code[0]] == 'Nan':
-                date_val.append(date[obs_info_code[0]])
-            else:
-                date_val.append(date[obs_info_code[0]].strftime("%Y-%m-%d %H:%M:%S"))
-        val = np.array(date_val)
-        # val = np.array([d[obs_info_code[0]].strftime("%Y-%m-%d %H:%M:%S") for d in self.one_day_date], dtype='object')
-        var[:] = val
-        var.long_name = obs_info_longname[0]
-        var.units = obs_info_unit[0]
+        obs_group.createDimension(obs_info_code[0], len(one_day_data))
+        create_time_variable(obs_group, obs_info_code[0], (obs_info_code[0],), one_day_data, obs_info_code[0],
+                             obs_info_longname[0], obs_info_unit[0], self.cf_time, storage_profile)
 
         for i in range(1, len(obs_info_code)):
-            if obs_info_nc_type[i] != 'array':
-                var = obs_group.createVariable(
-                    obs_info_code[i], obs_info_nc_type[i], (obs_info_code[0],))
+            if obs_info_code[i] == 'Datetime_31' or obs_info_code[i] == 'Datetime_201' or \
+                    obs_info_code[i] == 'Datetime_301' or obs_info_code[i] == 'Datetime_401' or \
+                    obs_info_code[i] == 'Datetime_402' or obs_info_code[i] == 'Datetime_403' or \
+                    obs_info_code[i] == 'Datetime_404' or obs_info_code[i] == 'GPS_DT':
+                create_time_variable(obs_group, obs_info_code[i], (obs_info_code[0],), one_day_data, obs_info_code[i],
+                                     obs_info_longname[i], obs_info_unit[i], self.cf_time, storage_profile)
+            elif obs_info_nc_type[i] != 'array':
+                var = create_variable(
+                    obs_group, obs_info_code[i], obs_info_nc_type[i], (obs_info_code[0],),
+                    storage_profile=storage_profile)
                 # if obs_info_nc_type[i] == 'f':
-                #     val = [float(d[obs_info_code[i]]) for d in self.one_day_date]
+                #     val = [float(d[obs_info_code[i]]) for d in one_day_data]
                 # elif obs_info_nc_type[i] == 'i':
-                #     val = [int(d[obs_info_code[i]]) for d in self.one_day_date]
+                #     val = [int(d[obs_info_code[i]]) for d in one_day_data]
                 # else:
-                #     val = [str(d[obs_info_code[i]]) for d in self.one_day_date]
-                if obs_info_code[i] == 'Datetime_31' or obs_info_code[i] == 'Datetime_201' or \
-                        obs_info_code[i] == 'Datetime_301' or obs_info_code[i] == 'Datetime_401' or \
-                        obs_info_code[i] == 'Datetime_402' or obs_info_code[i] == 'Datetime_403' or \
-                        obs_info_code[i] == 'Datetime_404' or obs_info_code[i] == 'GPS_DT':
-                    dt = []
-                    for d in self.one_day_date:
-                        if d[obs_info_code[i]] != 'Nan':
-                            dt.append(d[obs_info_code[i]].strftime("%Y-%m-%d %H:%M:%S"))
-                        else:
-                            dt.append('Nan')
-                    val = np.array(dt)
-                else:
-                    val = np.array([d[obs_info_code[i]] for d in self.one_day_date])
-                var[:] = val
+                #     val = [str(d[obs_info_code[i]]) for d in one_day_data]
+                var[:] = one_day_data.values(obs_info_code[i])
                 var.long_name = obs_info_longname[i]
                 var.units = obs_info_unit[i]
             else:
-                val = [j[obs_info_code[i]] for j in self.one_day_date]
-                var = obs_group.createVariable(
-                    obs_info_code[i], 'd', ('Datetime', 'Dime_HGT_58',))
-                var[:] = val
+                var = create_variable(
+                    obs_group, obs_info_code[i], 'd', ('Datetime', 'Dime_HGT_58',), storage_profile=storage_profile)
+                var[:] = one_day_data.values(obs_info_code[i])
                 var.long_name = obs_info_longname[i]
                 var.units = obs_info_unit[i]
         nc_obj.close()
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] save {save_path} success!')
+        return save_path
 
-    def generate_one_day_rsd_nc_file(self, header_info_code, header_info_longname, header_info_unit,
+    def generate_one_day_rsd_nc_file(self, one_day_data, header_info_code, header_info_longname, header_info_unit,
                                      header_info_nc_type, header_info_value, obs_info_code, obs_info_longname,
-                                     obs_info_unit, obs_info_nc_type, save_path):
+                                     obs_info_unit, obs_info_nc_type, save_path, storage_profile=None):
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Generating RSD\'s nc(netCDF4) '
               f'file: {header_info_value[-4]} ~ {header_info_value[-3]}')
         nc_obj = nc.Dataset(save_path, 'w', 'NETCDF4')
@@ -792,59 +705,43 @@ class NCGenerator:
         obs_group.createDimension('Dime_numb_part_diam_clas', 22)
         obs_group.createDimension('Dime_numb_part_velo_clas', 20)
         # 单独设置时间维度
-        obs_group.createDimension(obs_info_code[0], len(self.one_day_date))
-        var = obs_group.createVariable(
-            obs_info_code[0], obs_info_nc_type[0], (obs_info_code[0],))
-        val = np.array([d[obs_info_code[0]].strftime("%Y-%m-%d %H:%M:%S") for d in self.one_day_date], dtype='object')
-        var[:] = val
-        var.long_name = obs_info_longname[0]
-        var.units = obs_info_unit[0]
+        obs_group.createDimension(obs_info_code[0], len(one_day_data))
+        create_time_variable(obs_group, obs_info_code[0], (obs_info_code[0],), one_day_data, obs_info_code[0],
+                             obs_info_longname[0], obs_info_unit[0], self.cf_time, storage_profile)
         for i in range(1, len(obs_info_code)):
             if obs_info_nc_type[i] != 'array':
-                var = obs_group.createVariable(
-                    obs_info_code[i], obs_info_nc_type[i], (obs_info_code[0],))
+                var = create_variable(
+                    obs_group, obs_info_code[i], obs_info_nc_type[i], (obs_info_code[0],),
+                    storage_profile=storage_profile)
                 # if obs_info_nc_type[i] == 'f':
-                #     val = [float(d[obs_info_code[i]]) for d in self.one_day_date]
+                #     val = [float(d[obs_info_code[i]]) for d in one_day_data]
                 # elif obs_info_nc_type[i] == 'i':
-                #     val = [int(d[obs_info_code[i]]) for d in self.one_day_date]
+                #     val = [int(d[obs_info_code[i]]) for d in one_day_data]
                 # else:
-                #     val = [str(d[obs_info_code[i]]) for d in self.one_day_date]
+                #     val = [str(d[obs_info_code[i]]) for d in one_day_data]
                 # print(obs_info_code[i], obs_info_nc_type[i])
                 if obs_info_code[i] == 'Syno_4678_1MIN' or obs_info_code[i] == 'Syno_4678_5MIN':
-                    val = [str(d[obs_info_code[i]]).replace(' ', '') for d in self.one_day_date]
+                    val = np.array([str(v).replace(' ', '') for v in one_day_data[obs_info_code[i]]])
                 else:
-                    val = [d[obs_info_code[i]] for d in self.one_day_date]
-                var[:] = np.array(val)
+                    val = one_day_data.values(obs_info_code[i])
+                var[:] = val
                 var.long_name = obs_info_longname[i]
                 var.units = obs_info_unit[i]
             else:
-                val = [j[obs_info_code[i]] for j in self.one_day_date]
-                var = obs_group.createVariable(
-                    obs_info_code[i], 'u2', ('Datetime', 'Dime_numb_part_diam_clas', 'Dime_numb_part_velo_clas',))
-                val = np.array(val, dtype='object')
-                values = []
-                for v in val:
-                    if len(v) != 440:
-                        tmp = []
-                        for d in v:
-                            if len(d) != 3:
-                                tmp.append(d[:3])
-                                tmp.append(d[4:])
-                            else:
-                                tmp.append(d)
-                        values.append(np.array(tmp).reshape(22, 20))
-                    else:
-                        values.append(np.array(v).reshape(22, 20))
-                val = np.array(values)
-                var[:, :] = np.array(val, dtype='object')
+                var = write_array_variable(
+                    obs_group, obs_info_code[i], 'u2', ('Datetime', 'Dime_numb_part_diam_clas',
+                                                        'Dime_numb_part_velo_clas',),
+                    decode_prec_spec(one_day_data[obs_info_code[i]]), storage_profile)
                 var.long_name = obs_info_longname[i]
                 var.units = obs_info_unit[i]
         nc_obj.close()
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] save {save_path} success!')
+        return save_path
 
-    def generate_one_day_one_dim_nc_file(self, header_info_code, header_info_longname, header_info_unit,
+    def generate_one_day_one_dim_nc_file(self, one_day_data, header_info_code, header_info_longname, header_info_unit,
                                          header_info_nc_type, header_info_value, obs_info_code, obs_info_longname,
-                                         obs_info_unit, obs_info_nc_type, save_path, instrument_name):
+                                         obs_info_unit, obs_info_nc_type, save_path, instrument_name,
+                                         storage_profile=None):
         """
         数据维度
 
@@ -861,13 +758,6 @@ class NCGenerator:
         :param instrument_name:
         :return:
         """
-        if instrument_name == 'AERM':
-            my_datetime = np.array([d[obs_info_code[0]] for d in self.one_day_date])
-            for i in range(1, len(my_datetime)):
-                tmp = (my_datetime[i] - my_datetime[i - 1]).seconds
-                if tmp <= 10:
-                    header_info_value[18] = 6
-                    break
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Generating {instrument_name}\'s '
               f'nc(netCDF4) file: {header_info_value[-4]} ~ {header_info_value[-3]}')
         nc_obj = nc.Dataset(save_path, 'w', 'NETCDF4')
@@ -907,35 +797,32 @@ class NCGenerator:
         # --------------------------------------------------观测要素组-------------------------------------------------- #
         obs_group = nc_obj.createGroup('observational_information')
         # 单独设置时间维度
-        obs_group.createDimension(obs_info_code[0], len(self.one_day_date))
-        var = obs_group.createVariable(
-            obs_info_code[0], obs_info_nc_type[0], (obs_info_code[0],))
-        val = np.array([d[obs_info_code[0]].strftime("%Y-%m-%d %H:%M:%S") for d in self.one_day_date], dtype='object')
-        var[:] = val
-        var.long_name = obs_info_longname[0]
-        var.units = obs_info_unit[0]
+        obs_group.createDimension(obs_info_code[0], len(one_day_data))
+        create_time_variable(obs_group, obs_info_code[0], (obs_info_code[0],), one_day_data, obs_info_code[0],
+                             obs_info_longname[0], obs_info_unit[0], self.cf_time, storage_profile)
         # 其他数据
         for i in range(1, len(obs_info_code)):
-            var = obs_group.createVariable(
-                obs_info_code[i], obs_info_nc_type[i], (obs_info_code[0],))
+            var = create_variable(
+                obs_group, obs_info_code[i], obs_info_nc_type[i], (obs_info_code[0],), storage_profile=storage_profile)
             # if obs_info_nc_type[i] == 'f':
-            #     val = [float(d[obs_info_code[i]]) for d in self.one_day_date]
+            #     val = [float(d[obs_info_code[i]]) for d in one_day_data]
             # elif obs_info_nc_type[i] == 'u4' or obs_info_code[i] == 'u1':
-            #     val = [int(d[obs_info_code[i]]) for d in self.one_day_date]
+            #     val = [int(d[obs_info_code[i]]) for d in one_day_data]
             # else:
-            #     val = [str(d[obs_info_code[i]]) for d in self.one_day_date]
+            #     val = [str(d[obs_info_code[i]]) for d in one_day_data]
             # print(obs_info_code[i], obs_info_nc_type[i])
-            val = [d[obs_info_code[i]] for d in self.one_day_date]
-            var[:] = np.array(val)
+            var[:] = one_day_data.values(obs_info_code[i])
             var.long_name = obs_info_longname[i]
             var.units = obs_info_unit[i]
 
         nc_obj.close()
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] save {save_path} success!')
+        return save_path
 
     def generate_nc_file(self, instrument_name, header_info_code, header_info_longname, header_info_unit,
                          header_info_nc_type, header_info_value, obs_info_code, obs_info_longname, obs_info_unit,
-                         obs_info_nc_type, is_sample=False):
+                         obs_info_nc_type, is_sample=False, start=None, end=None, resume=False, incremental=False,
+                         manifest=None, sample_size=3, sample_random=False, check_query=None):
         """
         根据设备名、文件头信息、观测信息生成nc(netCDF4)文件.
         该函数is_sample参数能够控制nc文件的生成模式 (样例模式和生成模式).
@@ -952,64 +839,160 @@ class NCGenerator:
         :param obs_info_unit:           观测信息字段单位
         :param obs_info_nc_type:        观测信息字段对应nc文件中保存的数据类型
         :param is_sample:               是否属于样例文件生成模式， 默认为False
+        :param start:                   导出数据的起始时间 (包含), datetime类型，默认为空 (从第一条记录开始)
+        :param end:                     导出数据的结束时间 (不包含), datetime类型，默认为空 (到最后一条记录为止)
+        :param resume:                  是否从检查点清单中最后一个完成的观测日的下一天开始导出, 默认为False
+        :param incremental:             是否增量导出 (只查询检查点清单高水位线所在观测日及之后的数据,
+                                        高水位线所在观测日的文件重新生成), 默认为False
+        :param manifest:                检查点清单 (CheckpointManifest), 每生成一天的文件 记录一次,
+                                        默认为存储根目录下该设备nc文件的清单
+        :param sample_size:             样例模式生成的观测日数, 默认为3
+        :param sample_random:           样例模式是否随机抽取观测日, 默认为False (取最早的sample_size个观测日)
+        :param check_query:             导出前是否打印查询的执行计划, 默认为空 (按初始化时的设置),
+                                        样例模式只在第一个样例观测日检查
         """
         # 以下设备数据的MongoDB集合后缀为 "_VQ1"
         if instrument_name in ['']:
-            db_data = self.mongodb.get_collection_data(self.db_name, instrument_name + '_VQ1', self.username, self.pwd)
+            collection_name = instrument_name + '_VQ1'
         else:
-            db_data = self.mongodb.get_collection_data(self.db_name, instrument_name + '_VQ', self.username, self.pwd)
-        date_flag = ''  # 每条记录的时间标识，初始为空
-        one_day_data_list = []  # 保存一天数据的 list
-
-        sample_size = 3
-        count = 0
-
-        print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Loading {instrument_name}\'s data...')
-        for data in db_data:  # 对数据库返回来的数据进行迭代
-            filtered_data = {}  # 过滤出需要的字段
-            for c in obs_info_code:
-                filtered_data[c] = data[c]
-            if instrument_name == 'MRD':
-                now_data_date = filtered_data['Datetime_301'].strftime("%Y-%m-%d")
-            else:
-                now_data_date = filtered_data['Datetime'].strftime("%Y-%m-%d")  # 每读完一条更新当前时间信息
-            if date_flag == '':  # 第一条数据是更新 date_flag
-                print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Found start time: {now_data_date}')
-                date_flag = now_data_date
-            if date_flag != now_data_date:  # 获取一天数据完成
-                self.one_day_date = one_day_data_list
-                self.generate_one_day_nc_file(instrument_name, header_info_code, header_info_longname,
-                                              header_info_unit, header_info_nc_type, header_info_value,
-                                              obs_info_code, obs_info_longname, obs_info_unit, obs_info_nc_type)
-                count += 1
-                # 生成样例文件只生成一个文件即可
-                if is_sample:
-                    if count >= sample_size:
-                        db_data.close()
-                        return
-                one_day_data_list.clear()  # 一天数据生成后清空
-                date_flag = now_data_date  # 更新当前时间
-                print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Found start time: {now_data_date}')
-                one_day_data_list.append(filtered_data)  # 添加新一天的第一条数据
-            else:  # 未获取完一天数据
-                one_day_data_list.append(filtered_data)
-        # 保存数据库中最后一天的数据
-        if len(one_day_data_list) != 0:
-            self.one_day_date = one_day_data_list
-            self.generate_one_day_nc_file(instrument_name, header_info_code, header_info_longname,
-                                          header_info_unit, header_info_nc_type, header_info_value,
-                                          obs_info_code, obs_info_longname, obs_info_unit, obs_info_nc_type)
-        db_data.close()
+            collection_name = instrument_name + '_VQ'
+        if is_sample:
+            # 样例模式: 先查询出样例观测日, 再逐日进行范围查询, 不遍历整个集合; 样例文件不记录到检查点清单
+            days = self.mongodb.get_sample_days(self.db_name, collection_name, self.username, self.pwd, sample_size,
+                                                start, end, sample_random)
+            for i, day in enumerate(days):
+                day_end = day + timedelta(days=1)
+                self.generate_nc_file(instrument_name, header_info_code, header_info_longname, header_info_unit,
+                                      header_info_nc_type, header_info_value, obs_info_code, obs_info_longname,
+                                      obs_info_unit, obs_info_nc_type, start=max(day, start) if start else day,
+                                      end=min(day_end, end) if end else day_end, manifest=CheckpointManifest(),
+                                      check_query=check_query if i == 0 else False)
+            return
+        if manifest is None:
+            manifest = CheckpointManifest.for_export(self.base_dir, instrument_name, 'nc')
+        time_code = get_time_code(instrument_name)
+        for one_day_data in open_export_days(self, instrument_name, obs_info_code, start, end, manifest, resume,
+                                             incremental, 'nc files', collection_name, check_query):
+            path = self.generate_one_day_nc_file(instrument_name, one_day_data, header_info_code, header_info_longname,
+                                                 header_info_unit, header_info_nc_type, header_info_value,
+                                                 obs_info_code, obs_info_longname, obs_info_unit, obs_info_nc_type)
+            manifest.record_one_day_data(path, one_day_data, time_code)
+
+    def generate_nc_file_parallel(self, instrument_name, header_info_code, header_info_longname, header_info_unit,
+                                  header_info_nc_type, header_info_value, obs_info_code, obs_info_longname,
+                                  obs_info_unit, obs_info_nc_type, start=None, end=None, max_workers=None,
+                                  days_per_task=1, resume=False, incremental=False):
+        """
+        并行生成nc(netCDF4)文件.
+        先通过聚合查询获取存在观测记录的日期, 再按天 (或按days_per_task天) 划分时间范围,
+        由多个工作进程分别进行范围查询和文件写入.
+
+        :param instrument_name:         设备名
+        :param header_info_code:        文件头描述信息字段代码
+        :param header_info_longname:    文件头描述信息字段中英文描述
+        :param header_info_unit:        文件头描述信息字段单位
+        :param header_info_nc_type:     文件头描述信息字段对应nc文件中保存的数据类型
+        :param header_info_value:       文件头描述信息字段对应值
+        :param obs_info_code:           观测信息字段代码
+        :param obs_info_longname:       观测信息字段中英文描述
+        :param obs_info_unit:           观测信息字段单位
+        :param obs_info_nc_type:        观测信息字段对应nc文件中保存的数据类型
+        :param start:                   导出数据的起始时间 (包含), datetime类型，默认为空 (从第一条记录开始)
+        :param end:                     导出数据的结束时间 (不包含), datetime类型，默认为空 (到最后一条记录为止)
+        :param max_workers:             工作进程数, 默认为空 (与CPU核数相同)
+        :param days_per_task:           每个任务包含的观测日数, 默认为1 (按天划分), 为7时即按周划分
+        :param resume:                  是否跳过检查点清单中已完成的观测日, 默认为False
+        :param incremental:             是否增量导出 (只导出检查点清单高水位线所在观测日及之后的数据), 默认为False
+        """
+        # 检查点清单只由主进程保存, 工作进程返回各自完成的观测日
+        manifest = CheckpointManifest.for_export(self.base_dir, instrument_name, 'nc')
+        if incremental:
+            start = manifest.incremental_start(start)
+        if self.check_query:
+            self.mongodb.check_query_plan(self.db_name, instrument_name + '_VQ', self.username, self.pwd,
+                                          obs_info_code, start, end)
+        days = self.mongodb.get_distinct_days(self.db_name, instrument_name + '_VQ', self.username, self.pwd,
+                                              start, end)
+        print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Found {len(days)} days of '
+              f'{instrument_name}\'s data')
+        if resume and not incremental:
+            days = [day for day in days if day.strftime("%Y-%m-%d") not in manifest.days]
+            print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] {len(days)} days left to generate')
+        generator_args = (self.base_dir, self.ip, self.username, self.pwd, self.db_name, self.port,
+                          self.storage_profiles, self.cf_time, self.prefetch, self.batch_size, self.raw_bson,
+                          False, self.spool_dir)  # 执行计划已由主进程检查
+        generate_args = (instrument_name, header_info_code, header_info_longname, header_info_unit,
+                         header_info_nc_type, header_info_value, obs_info_code, obs_info_longname, obs_info_unit,
+                         obs_info_nc_type)
+        with ProcessPoolExecutor(max_workers) as executor:
+            futures = [executor.submit(_generate_nc_file_task, generator_args, generate_args, task_start, task_end)
+                       for task_start, task_end in split_days(days, days_per_task, start, end)]
+            record_task_results(futures, manifest)
+
+    def generate_nc_file_pipeline(self, instrument_name, header_info_code, header_info_longname, header_info_unit,
+                                  header_info_nc_type, header_info_value, obs_info_code, obs_info_longname,
+                                  obs_info_unit, obs_info_nc_type, start=None, end=None, max_workers=None,
+                                  queue_size=None, resume=False, incremental=False):
+        """
+        以流水线方式生成nc(netCDF4)文件.
+        与generate_nc_file一样只进行一次范围查询, 读取分组、转换和写入分为三级 (见DayPipeline):
+        主进程的读取线程迭代游标并按观测日分组, 转换线程整理每天的数据后交给进程池,
+        多个工作进程同时写入不同观测日的文件 (netCDF4/HDF5写入时不释放GIL, 在线程中无法并行).
+        工作进程不查询数据库, 适用于单个设备数据量大、文件写入耗时长于查询的情况.
+
+        :param instrument_name:         设备名
+        :param header_info_code:        文件头描述信息字段代码
+        :param header_info_longname:    文件头描述信息字段中英文描述
+        :param header_info_unit:        文件头描述信息字段单位
+        :param header_info_nc_type:     文件头描述信息字段对应nc文件中保存的数据类型
+        :param header_info_value:       文件头描述信息字段对应值
+        :param obs_info_code:           观测信息字段代码
+        :param obs_info_longname:       观测信息字段中英文描述
+        :param obs_info_unit:           观测信息字段单位
+        :param obs_info_nc_type:        观测信息字段对应nc文件中保存的数据类型
+        :param start:                   导出数据的起始时间 (包含), datetime类型，默认为空 (从第一条记录开始)
+        :param end:                     导出数据的结束时间 (不包含), datetime类型，默认为空 (到最后一条记录为止)
+        :param max_workers:             写入文件的工作进程数, 默认为空 (与CPU核数相同)
+        :param queue_size:              流水线每级队列最多缓存的观测日数, 默认为空 (与工作进程数相同)
+        :param resume:                  是否从检查点清单中最后完成的观测日之后继续导出, 默认为False
+        :param incremental:             是否增量导出 (只导出检查点清单高水位线所在观测日及之后的数据), 默认为False
+        """
+        manifest = CheckpointManifest.for_export(self.base_dir, instrument_name, 'nc')
+        time_code = get_time_code(instrument_name)
+        # 流水线的读取线程已与文件写入同时进行, 不需要后台预读取
+        days = open_export_days(self, instrument_name, obs_info_code, start, end, manifest, resume, incremental,
+                                'nc files', prefetch=False)
+        max_workers = max_workers or os.cpu_count() or 1
+        generator_args = (self.base_dir, self.ip, self.username, self.pwd, self.db_name, self.port,
+                          self.storage_profiles, self.cf_time)
+        generate_args = (instrument_name, header_info_code, header_info_longname, header_info_unit,
+                         header_info_nc_type, header_info_value, obs_info_code, obs_info_longname, obs_info_unit,
+                         obs_info_nc_type)
+        print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Writing {instrument_name}\'s nc files '
+              f'with {max_workers} processes')
+        with ProcessPoolExecutor(max_workers) as executor:
+            pipeline = DayPipeline(days, executor, _write_one_day_nc_task, (generator_args, generate_args),
+                                   queue_size or max_workers)
+            for path, one_day_data in pipeline:
+                manifest.record_one_day_data(path, one_day_data, time_code)
 
 
 class CSVGenerator:
-    def __init__(self, base_dir, ip, username, pwd, db_name):
-        self.mongodb = MyMongodb(ip)    # 连接MongoDB
+    def __init__(self, base_dir, ip, username, pwd, db_name, port=27017, prefetch=0, batch_size=None,
+                 raw_bson=False, check_query=False, spool_dir=None):
+        self.mongodb = MyMongodb(ip, port, username, pwd, db_name)  # 连接MongoDB (共用进程内的连接池)
+        self.ip = ip                    # MongoDB数据库服务器IP地址
+        self.port = port                # MongoDB数据库服务器端口
         self.db_name = db_name          # 数据库名称
         self.username = username        # 用户名
         self.pwd = pwd                  # 密码
-        self.one_day_date = []          # 一天的数据
         self.base_dir = base_dir        # CSV文件存储根目录
+        self.prefetch = prefetch        # 后台预读取队列中最多缓存的记录组数, 为0时不预读取
+        self.batch_size = batch_size    # 游标每批从服务器获取的记录条数, 为空时使用服务器默认值
+        self.raw_bson = raw_bson        # 是否以原始BSON读取记录并直接解码为列式数据
+        self.check_query = check_query  # 导出前是否打印查询的执行计划
+        self.spool_dir = spool_dir      # 本地缓存目录, 为空时不缓存
+        self.spool = SpoolCache(spool_dir) if spool_dir is not None else None
 
     @staticmethod
     def generate_filename(class01, class03, class04, station_code, data_code, manufacturer_code, data_level,
@@ -1044,7 +1027,9 @@ class CSVGenerator:
         filename += '.csv'
         return filename
 
-    def generate_csv_file(self, instrument_name, header_info_value, obs_info_code, is_sample=False):
+    def generate_csv_file(self, instrument_name, header_info_value, obs_info_code, is_sample=False, start=None,
+                          end=None, resume=False, incremental=False, manifest=None, sample_size=1, sample_random=False,
+                          check_query=None):
         """
         根据设备名、文件头信息、观测信息生成csv文件.
         该函数is_sample参数能够控制nc文件的生成模式 (样例模式和生成模式).
@@ -1054,477 +1039,493 @@ class CSVGenerator:
         :param header_info_value:       文件头描述信息字段对应值
         :param obs_info_code:           观测信息字段代码
         :param is_sample:               是否属于样例文件生成模式， 默认为False
+        :param start:                   导出数据的起始时间 (包含), datetime类型，默认为空 (从第一条记录开始)
+        :param end:                     导出数据的结束时间 (不包含), datetime类型，默认为空 (到最后一条记录为止)
+        :param resume:                  是否从检查点清单中最后一个完成的观测日的下一天开始导出, 默认为False
+        :param incremental:             是否增量导出 (只查询检查点清单高水位线所在观测日及之后的数据,
+                                        高水位线所在观测日的文件重新生成), 默认为False
+        :param manifest:                检查点清单 (CheckpointManifest), 每生成一天的文件 记录一次,
+                                        默认为存储根目录下该设备csv文件的清单
+        :param sample_size:             样例模式生成的观测日数, 默认为1
+        :param sample_random:           样例模式是否随机抽取观测日, 默认为False (取最早的sample_size个观测日)
+        :param check_query:             导出前是否打印查询的执行计划, 默认为空 (按初始化时的设置),
+                                        样例模式只在第一个样例观测日检查
         """
+        if is_sample:
+            # 样例模式: 先查询出样例观测日, 再逐日进行范围查询, 不遍历整个集合; 样例文件不记录到检查点清单
+            days = self.mongodb.get_sample_days(self.db_name, instrument_name + '_VQ', self.username, self.pwd,
+                                                sample_size, start, end, sample_random)
+            for i, day in enumerate(days):
+                day_end = day + timedelta(days=1)
+                self.generate_csv_file(instrument_name, header_info_value, obs_info_code,
+                                       start=max(day, start) if start else day,
+                                       end=min(day_end, end) if end else day_end, manifest=CheckpointManifest(),
+                                       check_query=check_query if i == 0 else False)
+            return
+        if manifest is None:
+            manifest = CheckpointManifest.for_export(self.base_dir, instrument_name, 'csv')
+        time_code = get_time_code(instrument_name)
+        for one_day_data in open_export_days(self, instrument_name, obs_info_code, start, end, manifest, resume,
+                                             incremental, 'csv files', check_query=check_query):
+            path = self.generate_one_day_csv_file(instrument_name, one_day_data, header_info_value, obs_info_code)
+            manifest.record_one_day_data(path, one_day_data, time_code)
+
+    def generate_csv_file_parallel(self, instrument_name, header_info_value, obs_info_code, start=None, end=None,
+                                   max_workers=None, days_per_task=1, resume=False, incremental=False):
+        """
+        并行生成csv文件.
+        先通过聚合查询获取存在观测记录的日期, 再按天 (或按days_per_task天) 划分时间范围,
+        由多个工作进程分别进行范围查询和文件写入.
 
-        db_data = self.mongodb.get_collection_data(self.db_name, instrument_name + '_VQ', self.username, self.pwd)
-        date_flag = ''  # 每条记录的时间标识，初始为空
-        one_day_data_list = []  # 保存一天数据的 list
-        print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Loading {instrument_name}\'s data...')
-        for data in db_data:  # 对数据库返回来的数据进行迭代
-            filtered_data = {}  # 过滤出需要的字段
-            for c in obs_info_code:
-                filtered_data[c] = data[c]
-            if instrument_name == 'MRD':
-                now_data_date = filtered_data['Datetime_301'].strftime("%Y-%m-%d")
-            else:
-                now_data_date = filtered_data['Datetime'].strftime("%Y-%m-%d")
-            # now_data_date = filtered_data['Datetime'].strftime("%Y-%m-%d")  # 每读完一条更新当前时间信息
-            if date_flag == '':  # 第一条数据是更新 date_flag
-                print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Found start time: {now_data_date}')
-                date_flag = now_data_date
-            if date_flag != now_data_date:  # 获取一天数据完成
-                self.one_day_date = one_day_data_list
-                self.generate_one_day_csv_file(instrument_name, header_info_value, obs_info_code)
-                # 生成样例文件只生成一个文件即可
-                if is_sample:
-                    db_data.close()
-                    return
-                one_day_data_list.clear()  # 一天数据生成后清空
-                date_flag = now_data_date  # 更新当前时间
-                print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Found start time: {now_data_date}')
-                one_day_data_list.append(filtered_data)  # 添加新一天的第一条数据
-            else:  # 未获取完一天数据
-                one_day_data_list.append(filtered_data)
-        # 保存数据库中最后一天的数据
-        if len(one_day_data_list) != 0:
-            self.one_day_date = one_day_data_list
-            self.generate_one_day_csv_file(instrument_name, header_info_value, obs_info_code)
-        db_data.close()
-
-    def generate_one_day_csv_file(self, instrument_name, header_info_value, obs_info_code):
+        :param instrument_name:         设备名
+        :param header_info_value:       文件头描述信息字段对应值
+        :param obs_info_code:           观测信息字段代码
+        :param start:                   导出数据的起始时间 (包含), datetime类型，默认为空 (从第一条记录开始)
+        :param end:                     导出数据的结束时间 (不包含), datetime类型，默认为空 (到最后一条记录为止)
+        :param max_workers:             工作进程数, 默认为空 (与CPU核数相同)
+        :param days_per_task:           每个任务包含的观测日数, 默认为1 (按天划分), 为7时即按周划分
+        :param resume:                  是否跳过检查点清单中已完成的观测日, 默认为False
+        :param incremental:             是否增量导出 (只导出检查点清单高水位线所在观测日及之后的数据), 默认为False
+        """
+        # 检查点清单只由主进程保存, 工作进程返回各自完成的观测日
+        manifest = CheckpointManifest.for_export(self.base_dir, instrument_name, 'csv')
+        if incremental:
+            start = manifest.incremental_start(start)
+        if self.check_query:
+            self.mongodb.check_query_plan(self.db_name, instrument_name + '_VQ', self.username, self.pwd,
+                                          obs_info_code, start, end)
+        days = self.mongodb.get_distinct_days(self.db_name, instrument_name + '_VQ', self.username, self.pwd,
+                                              start, end)
+        print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Found {len(days)} days of '
+              f'{instrument_name}\'s data')
+        if resume and not incremental:
+            days = [day for day in days if day.strftime("%Y-%m-%d") not in manifest.days]
+            print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] {len(days)} days left to generate')
+        generator_args = (self.base_dir, self.ip, self.username, self.pwd, self.db_name, self.port, self.prefetch,
+                          self.batch_size, self.raw_bson, False, self.spool_dir)  # 执行计划已由主进程检查
+        generate_args = (instrument_name, header_info_value, obs_info_code)
+        with ProcessPoolExecutor(max_workers) as executor:
+            futures = [executor.submit(_generate_csv_file_task, generator_args, generate_args, task_start, task_end)
+                       for task_start, task_end in split_days(days, days_per_task, start, end)]
+            record_task_results(futures, manifest)
+
+    def generate_one_day_csv_file(self, instrument_name, one_day_data, header_info_value, obs_info_code):
         """
-        生成一天数据的nc(netCDF4)文件
+        生成一天数据的csv文件.
+        该函数不修改实例状态和传入的参数 (header_info_value可以是tuple等不可变序列), 可在多个线程或进程中同时调用.
 
         :param instrument_name:         设备名
+        :param one_day_data:            一天的观测数据 (DayBuffer列式缓存)
         :param header_info_value:       文件头描述信息字段对应值
         :param obs_info_code:           观测信息字段代码
+        :return:                        生成的文件路径 (路径+文件名), 设备名无效时返回None
         """
-        if instrument_name == 'MRD':
-            start_time = self.one_day_date[0]['Datetime_301']
-            end_time = self.one_day_date[-1]['Datetime_301']
-        else:
-            start_time = self.one_day_date[0]['Datetime']  # 一天中记录开始时间
-            end_time = self.one_day_date[-1]['Datetime']  # 一天中记录结束时间
-        # start_time = self.one_day_date[0]['Datetime']  # 一天中记录开始时间
-        # end_time = self.one_day_date[-1]['Datetime']  # 一天中记录结束时间
+        spec = get_instrument(instrument_name)
+        if spec is None:
+            print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Invalid device name: {instrument_name}')
+            return
+        start_time = one_day_data[spec.time_code][0]  # 一天中记录开始时间
         # 根据设备名、开始时间的年和月确定保存路径："./base/instrument_name/year/month"
         path = self.base_dir + '/' + instrument_name + '/' + str(start_time.year) + '/' + str(
             start_time.month) + '/'
-        # 根据设备名确定每个nc文件的文件名
-        if instrument_name == 'AWS':        # 六要素自动站
-            filename = self.generate_filename('SURF', 'MOBS', 'SUOB', 'LSYW', 'AWS', 'HY', 'LX',
-                                              start_time)
-        elif instrument_name == 'PRE':      # 雨量筒
-            filename = self.generate_filename('SURF', 'MOBS', 'SUOB', 'LSYW', 'PRE', 'HOBO', 'LX',
-                                              start_time)
-        elif instrument_name == 'VIS':      # 能见度仪
-            filename = self.generate_filename('SURF', 'MOBS', 'SUOB', 'LSYW', 'VIS', 'VAIS', 'LX',
-                                              start_time)
-        elif instrument_name == 'FSD':      # 雾滴谱资料
-            filename = self.generate_filename('SURF', 'MOBS', 'SUOB', 'LSYW', 'FSD', 'DMT', 'LX',
-                                              start_time)
-        elif instrument_name == 'RSD':      # 雨滴谱资料
-            filename = self.generate_filename('SURF', 'MOBS', 'SUOB', 'LSYW', 'RSD', 'THIE', 'LX',
-                                              start_time)
-        elif instrument_name == 'YCCL_L2':  # 云高仪二级数据
-            filename = self.generate_filename('UPAR', 'MOBS', 'SUOB', 'LSYW', 'YCCL', 'VAIS', 'L2',
-                                              start_time, is_quality_control=False)
-        elif instrument_name == 'YCCL_L3':  # 云高仪三级数据
-            filename = self.generate_filename('UPAR', 'MOBS', 'SUOB', 'LSYW', 'YCCL', 'VAIS', 'L3',
-                                              start_time, is_quality_control=False)
-        elif instrument_name == 'RRD_Lave':     # 微雨雷达探测资料平均数据
-            header_info_value[22] = 'Lave'
-            filename = self.generate_filename('RADA', 'MOBS', 'SUOB', 'LSYW', 'RRD', 'METE', 'Lave',
-                                              start_time)
-        elif instrument_name == 'RRD_Lpro':     # 微雨雷达探测资料再处理数据
-            header_info_value[22] = 'Lpro'
-            filename = self.generate_filename('RADA', 'MOBS', 'SUOB', 'LSYW', 'RRD', 'METE', 'Lpro',
-                                              start_time)
-        elif instrument_name == 'RRD_Lraw':     # 微雨雷达探测资料原始数据
-            filename = self.generate_filename('RADA', 'MOBS', 'SUOB', 'LSYW', 'RRD', 'METE', 'Lraw',
-                                              start_time)
-        elif instrument_name == 'MRD':          # 微波辐射计探测资料二级数据 (目前只有二级数据)
-            filename = self.generate_filename('UPAR', 'MOBS', 'SUOB', 'LSYW', 'MRD', 'RAD', 'L2',
-                                              start_time)
-        elif instrument_name == 'AERM':         # 颗粒物仪
-            filename = self.generate_filename('SURF', 'MOBS', 'SUOB', 'LSYW', 'AERM', 'THER', 'LX',
-                                              start_time)
-        else:
-            print(
-                f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Invalid device name: {instrument_name}')
-            return
+        # 根据设备注册的文件名代码确定每个csv文件的文件名
+        filename = self.generate_filename(*spec.filename_codes, start_time,
+                                          is_quality_control=spec.is_quality_control)
         if not os.path.exists(path):
             os.makedirs(path)
-        # 修改数据记录起始和结束时间、文件生成时间
-        header_info_value[-4] = start_time.strftime("%Y-%m-%d %H:%M:%S")
-        header_info_value[-3] = end_time.strftime("%Y-%m-%d %H:%M:%S")
-        header_info_value[-2] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
-        # 按instrument_name选择生成函数
-        if instrument_name in ['AWS', 'AERM', 'VIS', 'YCCL_L3']:  # 观测要素只有'Datetime'一个维度的设备数据
-            self.generate_one_day_one_dim_csv_file(header_info_value, obs_info_code,
-                                                   path + filename, instrument_name)
-        elif instrument_name == 'RSD':
-            self.generate_one_day_rsd_csv_file(header_info_value, obs_info_code, path + filename)
-        elif instrument_name == 'MRD':
-            self.generate_one_day_mrd_csv_file(header_info_value, obs_info_code, path + filename)
-        elif instrument_name == 'YCCL_L2':
-            self.generate_one_day_yccl_l2_csv_file(header_info_value, obs_info_code, path + filename)
-        elif instrument_name == 'RRD_Lraw':
-            self.generate_one_day_rrd_lraw_csv_file(header_info_value, obs_info_code, path + filename)
-        elif instrument_name == 'RRD_Lave':
-            self.generate_one_day_rrd_lave_csv_file(header_info_value, obs_info_code, instrument_name,
-                                                    path + filename)
-        elif instrument_name == 'RRD_Lpro':
-            self.generate_one_day_rrd_lave_csv_file(header_info_value, obs_info_code, instrument_name,
-                                                    path + filename)
-        elif instrument_name == 'FSD':
-            self.generate_one_day_fsd_csv_file(header_info_value, obs_info_code, path + filename)
-        elif instrument_name == 'PRE':
-            self.generate_one_day_pre_csv_file(header_info_value, path + filename)
-        else:
-            print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] '
-                  f'Have no custom generate function for this device: {instrument_name}')
-
-    def generate_one_day_one_dim_csv_file(self, header_info_value, obs_info_code, save_path,
+        # 设备的文件头规则, 数据记录起始和结束时间、文件生成时间 (在副本上修改, 不改变调用者传入的值)
+        header_info_value = finalize_header(spec, one_day_data, header_info_value, spec.csv_header_overrides)
+        # 使用设备注册的生成函数
+        getattr(self, spec.csv_writer)(one_day_data, header_info_value, obs_info_code, path + filename,
+                                       *spec.csv_writer_args)
+        return path + filename
+
+    def generate_one_day_one_dim_csv_file(self, one_day_data, header_info_value, obs_info_code, save_path,
                                           instrument_name):
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Generating {instrument_name}\'s '
               f'csv file: {header_info_value[-4]} ~ {header_info_value[-3]}')
-        if instrument_name == 'AERM':
-            my_datetime = np.array([d[obs_info_code[0]] for d in self.one_day_date])
-            for i in range(1, len(my_datetime)):
-                tmp = (my_datetime[i] - my_datetime[i - 1]).seconds
-                if tmp <= 10:
-                    header_info_value[18] = 6
-                    break
         # --------------------------------------------------头文件信息-------------------------------------------------- #
-        header_dataframe = pd.DataFrame([header_info_value[0]])
-        for i in range(1, len(header_info_value)):
-            val = pd.DataFrame([header_info_value[i]])
-            header_dataframe = pd.concat([header_dataframe, val], axis=1)
-        header_dataframe.to_csv(save_path, header=False, index=False, mode='w')
+        encoder = CSVEncoder()
+        encoder.write_header(header_info_value)
 
         # -------------------------------------------------观测要素信息------------------------------------------------- #
-        val = np.array([d[obs_info_code[0]].strftime("%Y-%m-%d %H:%M:%S") for d in self.one_day_date], dtype='object')
-        obs_dataframe = pd.DataFrame(val, columns=[obs_info_code[0]])
+        encoder.add_column(obs_info_code[0], one_day_data.datetime_strings(obs_info_code[0]))
         for i in range(1, len(obs_info_code)):
-            val = pd.DataFrame([d[obs_info_code[i]] for d in self.one_day_date], columns=[obs_info_code[i]])
-            obs_dataframe = pd.concat([obs_dataframe, val], axis=1)
-        obs_dataframe.to_csv(save_path, index=False, mode='a')
+            encoder.add_column(obs_info_code[i], one_day_data[obs_info_code[i]])
+        encoder.write_table()
+        encoder.save(save_path)
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] save {save_path} success!')
+        return save_path
 
-    def generate_one_day_mrd_csv_file(self, header_info_value, obs_info_code, save_path):
+    def generate_one_day_mrd_csv_file(self, one_day_data, header_info_value, obs_info_code, save_path):
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Generating MRD\'s '
               f'csv file: {header_info_value[-4]} ~ {header_info_value[-3]}')
         # --------------------------------------------------头文件信息-------------------------------------------------- #
-        header_dataframe = pd.DataFrame([header_info_value[0]])
-        for i in range(1, len(header_info_value)):
-            val = pd.DataFrame([header_info_value[i]])
-            header_dataframe = pd.concat([header_dataframe, val], axis=1)
-        header_dataframe.to_csv(save_path, header=False, index=False, mode='w')
+        encoder = CSVEncoder()
+        encoder.write_header(header_info_value)
         # -------------------------------------------------观测要素信息------------------------------------------------- #
-        # val = np.array([d[obs_info_code[0]].strftime("%Y-%m-%d %H:%M:%S") for d in self.one_day_date], dtype='object')
-        date_val = []
-        for date in self.one_day_date:
-            if date[obs_info_code[0]] == 'Nan':
-                date_val.append(date[obs_info_code[0]])
-            else:
-                date_val.append(date[obs_info_code[0]].strftime("%Y-%m-%d %H:%M:%S"))
-        val = np.array(date_val)
-        obs_dataframe = pd.DataFrame(val, columns=[obs_info_code[0]])
+        encoder.add_column(obs_info_code[0], one_day_data.datetime_strings(obs_info_code[0]))
         for i in range(1, len(obs_info_code)):
             if obs_info_code[i] in ['Temp_prof', 'VAP_prof', 'LWC_prof', 'RH_prof']:
-                col_names = [obs_info_code[i]]
-                for _ in range(57):
-                    col_names.append('')
-                val = [d[obs_info_code[i]] for d in self.one_day_date]
-                data_list = [val[0]]
-                for j in range(1, len(val)):
-                    data_list.append(val[j])
-                data_dataframe = pd.DataFrame(data_list, columns=col_names)
-                obs_dataframe = pd.concat([obs_dataframe, data_dataframe], axis=1)
+                encoder.add_columns(obs_info_code[i], one_day_data[obs_info_code[i]], 58)
             elif obs_info_code[i] == 'Datetime_31' or obs_info_code[i] == 'Datetime_201' or \
                     obs_info_code[i] == 'Datetime_301' or obs_info_code[i] == 'Datetime_401' or \
                     obs_info_code[i] == 'Datetime_402' or obs_info_code[i] == 'Datetime_403' or \
                     obs_info_code[i] == 'Datetime_404' or obs_info_code[i] == 'GPS_DT':
-                dt = []
-                for d in self.one_day_date:
-                    if d[obs_info_code[i]] != 'Nan':
-                        dt.append(d[obs_info_code[i]].strftime("%Y-%m-%d %H:%M:%S"))
-                    else:
-                        dt.append('Nan')
-                # val = np.array(dt)
-                data_dataframe = pd.DataFrame(dt, columns=[obs_info_code[i]])
-                obs_dataframe = pd.concat([obs_dataframe, data_dataframe], axis=1)
+                encoder.add_column(obs_info_code[i], one_day_data.datetime_strings(obs_info_code[i]))
             else:
-                val = pd.DataFrame([d[obs_info_code[i]] for d in self.one_day_date], columns=[obs_info_code[i]])
-                obs_dataframe = pd.concat([obs_dataframe, val], axis=1)
-
-        obs_dataframe.to_csv(save_path, index=False, mode='a')
+                encoder.add_column(obs_info_code[i], one_day_data[obs_info_code[i]])
+        encoder.write_table()
+        encoder.save(save_path)
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] save {save_path} success!')
+        return save_path
 
-    def generate_one_day_rsd_csv_file(self, header_info_value, obs_info_code, save_path):
+    def generate_one_day_rsd_csv_file(self, one_day_data, header_info_value, obs_info_code, save_path):
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Generating RSD\'s '
               f'csv file: {header_info_value[-4]} ~ {header_info_value[-3]}')
         # --------------------------------------------------头文件信息-------------------------------------------------- #
-        header_dataframe = pd.DataFrame([header_info_value[0]])
-        for i in range(1, len(header_info_value)):
-            val = pd.DataFrame([header_info_value[i]])
-            header_dataframe = pd.concat([header_dataframe, val], axis=1)
-        header_dataframe.to_csv(save_path, header=False, index=False, mode='w')
-
+        encoder = CSVEncoder()
+        encoder.write_header(header_info_value)
         # -------------------------------------------------观测要素信息------------------------------------------------- #
-        val = np.array([d[obs_info_code[0]].strftime("%Y-%m-%d %H:%M:%S") for d in self.one_day_date],
-                       dtype='object')
-        prec_list = [d['Prec_spec'] for d in self.one_day_date]
-        values = []
-        for v in prec_list:
-            if len(v) != 440:
-                tmp = []
-                for d in v:
-                    if len(d) != 3:
-                        tmp.append(int(d[:3]))
-                        tmp.append(int(d[4:]))
-                    else:
-                        tmp.append(int(d))
-                values.append(np.array(tmp).reshape(1, 440))
+        # 逐条记录编码为一行, 整天的数据编码完成后一次写入文件
+        val = one_day_data.datetime_strings(obs_info_code[0])
+        columns = {code: one_day_data[code].tolist() for code in obs_info_code if code != 'Prec_spec'}
+        # 雨滴谱整天一次性解码, 每条记录展开为440列
+        columns['Prec_spec'] = decode_prec_spec(one_day_data['Prec_spec']).reshape(len(one_day_data), -1).tolist()
+        col_names = []
+        for code in obs_info_code:
+            if code == 'Prec_spec':
+                col_names += ['Prec_spec'] + [''] * 439
             else:
-                values.append(np.array([int(d) for d in v]).reshape(1, 440))
-        col_names = ['Prec_spec']
-        for _ in range(439):
-            col_names.append('')
+                col_names.append(code)
+        encoder.write_row(col_names)
         for i in range(len(val)):
-            one_day_dataframe = pd.DataFrame()
+            row = []
             for code in obs_info_code:
                 if code == 'Datetime':
-                    one_day_dataframe = pd.concat(
-                        [one_day_dataframe, pd.DataFrame([val[i]], columns=['Datetime'])], axis=1)
+                    row.append(val[i])
                 elif code == 'Prec_spec':
-                    one_day_dataframe = pd.concat(
-                        [one_day_dataframe, pd.DataFrame(values[i], columns=col_names)], axis=1)
+                    row.extend(columns['Prec_spec'][i])
                 elif code == 'Syno_4678_5MIN' or code == 'Syno_4678_1MIN':
-                    value = self.one_day_date[i][code]
+                    value = columns[code][i]
                     if value != 'Nan':
                         value = value.replace(' ', '')
-                    one_day_dataframe = pd.concat(
-                        [one_day_dataframe, pd.DataFrame([value], columns=[code])], axis=1)
+                    row.append(value)
                 else:
-                    one_day_dataframe = pd.concat(
-                        [one_day_dataframe, pd.DataFrame([self.one_day_date[i][code]], columns=[code])], axis=1)
-            if i == 0:
-                one_day_dataframe.to_csv(save_path, index=False, mode='a')
-            else:
-                one_day_dataframe.to_csv(save_path, index=False, header=False, mode='a')
+                    row.append(columns[code][i])
+            encoder.write_row(row)
+        encoder.save(save_path)
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] save {save_path} success!')
+        return save_path
 
-    def generate_one_day_yccl_l2_csv_file(self, header_info_value, obs_info_code, save_path):
+    def generate_one_day_yccl_l2_csv_file(self, one_day_data, header_info_value, obs_info_code, save_path):
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Generating YCCL_L2\'s '
               f'csv file: {header_info_value[-4]} ~ {header_info_value[-3]}')
         # --------------------------------------------------头文件信息-------------------------------------------------- #
-        header_dataframe = pd.DataFrame([header_info_value[0]])
-        for i in range(1, len(header_info_value)):
-            val = pd.DataFrame([header_info_value[i]])
-            header_dataframe = pd.concat([header_dataframe, val], axis=1)
-        header_dataframe.to_csv(save_path, header=False, index=False, mode='w')
+        encoder = CSVEncoder()
+        encoder.write_header(header_info_value)
         # -------------------------------------------------观测要素信息------------------------------------------------- #
-        date_list = np.array([d[obs_info_code[0]].strftime("%Y-%m-%d %H:%M:%S") for d in self.one_day_date],
-                             dtype='object')
-        obs_dataframe = pd.DataFrame(date_list, columns=[obs_info_code[0]])
+        encoder.add_column(obs_info_code[0], one_day_data.datetime_strings(obs_info_code[0]))
         for i in range(1, len(obs_info_code)):
             if obs_info_code[i] == 'BS_prof':
-                col_names = [obs_info_code[i]]
-                for _ in range(449):
-                    col_names.append('')
-                val = [d[obs_info_code[i]] for d in self.one_day_date]
-                data_list = [val[0]]
-                for j in range(1, len(val)):
-                    data_list.append(val[j])
-                    # data_list = np.transpose(data_list)
-                data_dataframe = pd.DataFrame(data_list, columns=col_names)
-                obs_dataframe = pd.concat([obs_dataframe, data_dataframe], axis=1)
+                encoder.add_columns(obs_info_code[i], one_day_data[obs_info_code[i]], 450)
             else:
-                val = pd.DataFrame([d[obs_info_code[i]] for d in self.one_day_date], columns=[obs_info_code[i]])
-                obs_dataframe = pd.concat([obs_dataframe, val], axis=1)
-        obs_dataframe.to_csv(save_path, index=False, mode='a')
+                encoder.add_column(obs_info_code[i], one_day_data[obs_info_code[i]])
+        encoder.write_table()
+        encoder.save(save_path)
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] save {save_path} success!')
+        return save_path
 
-    def generate_one_day_rrd_lraw_csv_file(self, header_info_value, obs_info_code, save_path, one_day_data=None):
+    def generate_one_day_rrd_lraw_csv_file(self, one_day_data, header_info_value, obs_info_code, save_path):
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Generating RRD_Lraw\'s '
               f'csv file: {header_info_value[-4]} ~ {header_info_value[-3]}')
-        if one_day_data is None:
-            one_day_data = self.one_day_date
         # --------------------------------------------------头文件信息-------------------------------------------------- #
-        header_dataframe = pd.DataFrame([header_info_value[0]])
-        for i in range(1, len(header_info_value)):
-            val = pd.DataFrame([header_info_value[i]])
-            header_dataframe = pd.concat([header_dataframe, val], axis=1)
-        header_dataframe.to_csv(save_path, header=False, index=False, mode='w')
+        encoder = CSVEncoder()
+        encoder.write_header(header_info_value)
         # -------------------------------------------------观测要素信息------------------------------------------------- #
-        date_list = np.array([d[obs_info_code[0]].strftime("%Y-%m-%d %H:%M:%S") for d in one_day_data],
-                             dtype='object')
-        for i in range(len(date_list)):
-            for code in obs_info_code:
-                if code == 'Datetime':
-                    pd.DataFrame(np.array([code, date_list[i]]).reshape(1, -1)).to_csv(
-                        save_path, mode='a', index=False, header=False)
-                elif code == 'HGT' or code == 'Transfer_function':
-                    val = [d[code] for d in one_day_data][i]
-                    val.insert(0, code)
-                    pd.DataFrame(np.array(val).reshape(1, -1)).to_csv(
-                        save_path, mode='a', index=False, header=False)
-                elif code == 'Spectral_reflectivities':
-                    val = [d[code] for d in one_day_data][i]
-                    spec = pd.concat([pd.DataFrame([code]), pd.DataFrame(val)], axis=1)
-                    spec.to_csv(save_path, mode='a', index=False, header=False)
-                else:
-                    val = [d[code] for d in one_day_data][i]
-                    pd.DataFrame(np.array([code, val]).reshape(1, -1)).to_csv(
-                        save_path, mode='a', index=False, header=False)
+        # 每条记录编码为一个多行数据块, 整天的数据编码完成后一次写入文件
+        columns = {code: one_day_data[code] for code in obs_info_code}
+        columns[obs_info_code[0]] = one_day_data.datetime_strings(obs_info_code[0])
+        encoder.write_record_blocks(columns, obs_info_code,
+                                    vector_codes=['HGT', 'Transfer_function'],
+                                    matrix_codes=['Spectral_reflectivities'])
+        encoder.save(save_path)
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] save {save_path} success!')
+        return save_path
 
-    def generate_one_day_rrd_lave_csv_file(self, header_info_value, obs_info_code, instrument_name,
-                                           save_path):
+    def generate_one_day_rrd_lave_csv_file(self, one_day_data, header_info_value, obs_info_code, save_path,
+                                           instrument_name):
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Generating {instrument_name}\'s '
               f'csv file: {header_info_value[-4]} ~ {header_info_value[-3]}')
         # --------------------------------------------------头文件信息-------------------------------------------------- #
-        header_dataframe = pd.DataFrame([header_info_value[0]])
-        for i in range(1, len(header_info_value)):
-            val = pd.DataFrame([header_info_value[i]])
-            header_dataframe = pd.concat([header_dataframe, val], axis=1)
-        header_dataframe.to_csv(save_path, header=False, index=False, mode='w')
+        encoder = CSVEncoder()
+        encoder.write_header(header_info_value)
         # -------------------------------------------------观测要素信息------------------------------------------------- #
-        date_list = np.array([d[obs_info_code[0]].strftime("%Y-%m-%d %H:%M:%S") for d in self.one_day_date],
-                             dtype='object')
-        for i in range(len(date_list)):
-            for code in obs_info_code:
-                if code == 'Datetime':
-                    pd.DataFrame(np.array([code, date_list[i]]).reshape(1, -1)).to_csv(
-                        save_path, mode='a', index=False, header=False)
-                elif code == 'HGT' or code == 'Transfer_function' or code == 'Path_Inte_Atte' or code == 'Z_Atte' or \
-                        code == 'LWC' or code == 'W' or code == 'Z_Atte_corr' or code == 'Rain_rate':
-                    val = [d[code] for d in self.one_day_date][i]
-                    val.insert(0, code)
-                    pd.DataFrame(np.array(val).reshape(1, -1)).to_csv(
-                        save_path, mode='a', index=False, header=False)
-                elif code == 'Spectral_reflectivities' or code == 'Drop_size' or code == 'Spec_drop_dens':
-                    val = [d[code] for d in self.one_day_date][i]
-                    spec = pd.concat([pd.DataFrame([code]), pd.DataFrame(val)], axis=1)
-                    spec.to_csv(save_path, mode='a', index=False, header=False)
-                else:
-                    val = [d[code] for d in self.one_day_date][i]
-                    pd.DataFrame(np.array([code, val]).reshape(1, -1)).to_csv(
-                        save_path, mode='a', index=False, header=False)
+        # 每条记录编码为一个多行数据块, 整天的数据编码完成后一次写入文件
+        columns = {code: one_day_data[code] for code in obs_info_code}
+        columns[obs_info_code[0]] = one_day_data.datetime_strings(obs_info_code[0])
+        encoder.write_record_blocks(columns, obs_info_code,
+                                    vector_codes=['HGT', 'Transfer_function', 'Path_Inte_Atte', 'Z_Atte', 'LWC', 'W',
+                                                  'Z_Atte_corr', 'Rain_rate'],
+                                    matrix_codes=['Spectral_reflectivities', 'Drop_size', 'Spec_drop_dens'])
+        encoder.save(save_path)
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] save {save_path} success!')
+        return save_path
 
-    def generate_one_day_fsd_csv_file(self, header_info_value, obs_info_code, save_path):
+    def generate_one_day_fsd_csv_file(self, one_day_data, header_info_value, obs_info_code, save_path):
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Generating FSD\'s '
               f'csv file: {header_info_value[-4]} ~ {header_info_value[-3]}')
         # --------------------------------------------------头文件信息-------------------------------------------------- #
-        header_dataframe = pd.DataFrame([header_info_value[0]])
-        for i in range(1, len(header_info_value)):
-            val = pd.DataFrame([header_info_value[i]])
-            header_dataframe = pd.concat([header_dataframe, val], axis=1)
-        header_dataframe.to_csv(save_path, header=False, index=False, mode='w')
+        encoder = CSVEncoder()
+        encoder.write_header(header_info_value)
         # -------------------------------------------------观测要素信息------------------------------------------------- #
-        val = np.array([d[obs_info_code[0]].strftime("%Y-%m-%d %H:%M:%S") for d in self.one_day_date],
-                       dtype='object')
-        obs_dataframe = pd.DataFrame(val, columns=[obs_info_code[0]])
+        encoder.add_column(obs_info_code[0], one_day_data.datetime_strings(obs_info_code[0]))
         for i in range(1, len(obs_info_code)):
             if 'Numb_part_ch' in obs_info_code[i]:
                 if obs_info_code[i] == 'Numb_part_ch0':
-                    val = pd.DataFrame([d[obs_info_code[i]] for d in self.one_day_date], columns=['Numb_part_chan'])
+                    encoder.add_column('Numb_part_chan', one_day_data[obs_info_code[i]])
                 else:
-                    val = pd.DataFrame([d[obs_info_code[i]] for d in self.one_day_date], columns=[''])
+                    encoder.add_column('', one_day_data[obs_info_code[i]])
             else:
-                val = pd.DataFrame([d[obs_info_code[i]] for d in self.one_day_date], columns=[obs_info_code[i]])
-            obs_dataframe = pd.concat([obs_dataframe, val], axis=1)
-        obs_dataframe.to_csv(save_path, index=False, mode='a')
+                encoder.add_column(obs_info_code[i], one_day_data[obs_info_code[i]])
+        encoder.write_table()
+        encoder.save(save_path)
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] save {save_path} success!')
+        return save_path
 
-    def generate_one_day_pre_csv_file(self, header_info_value, save_path):
+    def generate_one_day_pre_csv_file(self, one_day_data, header_info_value, obs_info_code, save_path):
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Generating PRE\'s '
               f'csv file: {header_info_value[-4]} ~ {header_info_value[-3]}')
         # --------------------------------------------------头文件信息-------------------------------------------------- #
-        header_dataframe = pd.DataFrame([header_info_value[0]])
-        for i in range(1, len(header_info_value)):
-            val = pd.DataFrame([header_info_value[i]])
-            header_dataframe = pd.concat([header_dataframe, val], axis=1)
-        header_dataframe.to_csv(save_path, header=False, index=False, mode='w')
+        encoder = CSVEncoder()
+        encoder.write_header(header_info_value)
         # -------------------------------------------------观测要素信息------------------------------------------------- #
-        tem_list = []
-        pre_list = []
-        tem_max_pre_cum = []
-        for i in range(len(self.one_day_date)):
-            if self.one_day_date[i]['TEM'] != 'Nan':
-                tem_list.append(self.one_day_date[i])
-            if self.one_day_date[i]['PRE'] != 'Nan':
-                pre_list.append(self.one_day_date[i])
-            if self.one_day_date[i]['TEM_Max'] != 'Nan' or self.one_day_date[i]['PRE_Cum'] != 'Nan':
-                tem_max_pre_cum.append(self.one_day_date[i])
+        tem_list = one_day_data.subset(one_day_data.not_equal('TEM', 'Nan'))
+        pre_list = one_day_data.subset(one_day_data.not_equal('PRE', 'Nan'))
+        tem_max_pre_cum = one_day_data.subset(one_day_data.not_equal('TEM_Max', 'Nan') |
+                                              one_day_data.not_equal('PRE_Cum', 'Nan'))
 
         # 资料时间
-        # obs_dataframe = pd.DataFrame(
-        #     [d['Datetime'].strftime("%Y-%m-%d %H:%M:%S") for d in self.one_day_date],
-        #     columns=['Datetime'])
+        # encoder.add_column('Datetime', one_day_data.datetime_strings('Datetime'))
 
-        # 温度时间：
-        val = pd.DataFrame(
-            [d['Datetime'].strftime("%Y-%m-%d %H:%M:%S") for d in tem_list], columns=['Datetime_Temp'])
-        obs_dataframe = pd.concat([val], axis=1)
-        # 温度
-        val = pd.DataFrame([float(d['TEM']) for d in tem_list], columns=['Temp'])
-        obs_dataframe = pd.concat([obs_dataframe, val], axis=1)
-        # 温度质控码
-        val = pd.DataFrame([int(d['Q_TEM']) for d in tem_list], columns=['Q_Temp'])
-        obs_dataframe = pd.concat([obs_dataframe, val], axis=1)
+        # 温度时间、温度、温度质控码
+        encoder.add_column('Datetime_Temp', tem_list.datetime_strings('Datetime'))
+        encoder.add_column('Temp', tem_list['TEM'].astype(float))
+        encoder.add_column('Q_Temp', [int(v) for v in tem_list['Q_TEM']])
 
-        # 降雨量时间
+        # 降雨量时间、降雨量、降雨量质控码
         if len(pre_list) != 0:
-            val = pd.DataFrame(
-                [d['Datetime'].strftime("%Y-%m-%d %H:%M:%S") for d in pre_list], columns=['Datetime_Prec'])
-            obs_dataframe = pd.concat([obs_dataframe, val], axis=1)
-            # 降雨量
-            val = pd.DataFrame([float(d['PRE']) for d in pre_list], columns=['Prec'])
-            obs_dataframe = pd.concat([obs_dataframe, val], axis=1)
-            # 降雨量质控码
-            val = pd.DataFrame([int(d['Q_PRE']) for d in pre_list], columns=['Q_Prec'])
-            obs_dataframe = pd.concat([obs_dataframe, val], axis=1)
+            encoder.add_column('Datetime_Prec', pre_list.datetime_strings('Datetime'))
+            encoder.add_column('Prec', pre_list['PRE'].astype(float))
+            encoder.add_column('Q_Prec', [int(v) for v in pre_list['Q_PRE']])
         else:
-            val = pd.DataFrame([''], columns=['Datetime_Prec'])
-            obs_dataframe = pd.concat([obs_dataframe, val], axis=1)
-            val = pd.DataFrame([''], columns=['Prec'])
-            obs_dataframe = pd.concat([obs_dataframe, val], axis=1)
-            val = pd.DataFrame([''], columns=['Q_Prec'])
-            obs_dataframe = pd.concat([obs_dataframe, val], axis=1)
+            for code in ['Datetime_Prec', 'Prec', 'Q_Prec']:
+                encoder.add_column(code, [''])
 
-        # 整点时间
+        # 整点时间、最大温度、累计降雨量、最大温度质控码、累计降雨量质控码
         if len(tem_max_pre_cum) != 0:
-            val = pd.DataFrame(
-                [d['Datetime'].strftime("%Y-%m-%d %H:%M:%S") for d in tem_max_pre_cum],
-                columns=['Datetime_oclock'])
-            obs_dataframe = pd.concat([obs_dataframe, val], axis=1)
-            # 最大温度
-            val = pd.DataFrame([float(d['TEM_Max']) for d in tem_max_pre_cum], columns=['Temp_MAX'])
-            obs_dataframe = pd.concat([obs_dataframe, val], axis=1)
-            # 累计降雨量
-            val = pd.DataFrame([float(d['PRE_Cum']) for d in tem_max_pre_cum], columns=['Prec_cumu'])
-            obs_dataframe = pd.concat([obs_dataframe, val], axis=1)
-            # 最大温度质控码
-            val = pd.DataFrame([int(d['Q_TEM_Max']) for d in tem_max_pre_cum], columns=['Q_Temp_MAX'])
-            obs_dataframe = pd.concat([obs_dataframe, val], axis=1)
-            # 累计降雨量质控码
-            val = pd.DataFrame([int(d['Q_PRE_Cum']) for d in tem_max_pre_cum], columns=['Q_Prec_cumu'])
-            obs_dataframe = pd.concat([obs_dataframe, val], axis=1)
+            encoder.add_column('Datetime_oclock', tem_max_pre_cum.datetime_strings('Datetime'))
+            encoder.add_column('Temp_MAX', tem_max_pre_cum['TEM_Max'].astype(float))
+            encoder.add_column('Prec_cumu', tem_max_pre_cum['PRE_Cum'].astype(float))
+            encoder.add_column('Q_Temp_MAX', [int(v) for v in tem_max_pre_cum['Q_TEM_Max']])
+            encoder.add_column('Q_Prec_cumu', [int(v) for v in tem_max_pre_cum['Q_PRE_Cum']])
         else:
-            val = pd.DataFrame([''], columns=['Datetime_oclock'])
-            obs_dataframe = pd.concat([obs_dataframe, val], axis=1)
-            val = pd.DataFrame([''], columns=['Temp_MAX'])
-            obs_dataframe = pd.concat([obs_dataframe, val], axis=1)
-            val = pd.DataFrame([''], columns=['Prec_cumu'])
-            obs_dataframe = pd.concat([obs_dataframe, val], axis=1)
-            val = pd.DataFrame([''], columns=['Q_Temp_MAX'])
-            obs_dataframe = pd.concat([obs_dataframe, val], axis=1)
-            val = pd.DataFrame([''], columns=['Q_Prec_cumu'])
-            obs_dataframe = pd.concat([obs_dataframe, val], axis=1)
-
-        obs_dataframe.to_csv(save_path, index=False, mode='a')
+            for code in ['Datetime_oclock', 'Temp_MAX', 'Prec_cumu', 'Q_Temp_MAX', 'Q_Prec_cumu']:
+                encoder.add_column(code, [''])
+
+        encoder.write_table()
+        encoder.save(save_path)
         print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] save {save_path} success!')
+        return save_path
+
+
+def finalize_header(spec, one_day_data, header_info_value, overrides=None):
+    """
+    生成一天的文件前整理文件头值, nc、csv、Parquet和Zarr的生成函数共用.
+    依次替换设备注册的文件头值, AERM为6秒数据 (相邻记录间隔不超过10秒) 时时间分辨率改为6,
+    最后修改数据记录起始和结束时间、文件生成时间
+
+    :param spec:                设备 (InstrumentSpec)
+    :param one_day_data:        一天的观测数据 (DayBuffer列式缓存)
+    :param header_info_value:   文件头描述信息字段对应值 (不修改传入的值)
+    :param overrides:           替换的文件头值 {下标: 值}, 例如spec.header_overrides或spec.csv_header_overrides
+    :return:                    整理后的文件头值 (list)
+    """
+    header_info_value = list(header_info_value)
+    for index, value in (overrides or {}).items():
+        header_info_value[index] = value
+    times = one_day_data[spec.time_code]
+    if spec.name == 'AERM':
+        for i in range(1, len(times)):
+            if (times[i] - times[i - 1]).seconds <= 10:
+                header_info_value[18] = 6
+                break
+    header_info_value[-4] = times[0].strftime("%Y-%m-%d %H:%M:%S")
+    header_info_value[-3] = times[-1].strftime("%Y-%m-%d %H:%M:%S")
+    header_info_value[-2] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+    return header_info_value
+
+
+def split_days(days, days_per_task=1, start=None, end=None):
+    """
+    将观测日列表按days_per_task天划分为多个时间范围 [task_start, task_end).
+    只有连续的观测日划分到同一个时间范围, 列表中不存在的日期 (例如断点续传时跳过的已完成观测日) 不会被任何时间范围覆盖
+
+    :param days:            每个观测日0时的datetime列表 (升序)
+    :param days_per_task:   每个时间范围包含的观测日数
+    :param start:           总起始时间 (包含), 不为空时第一个时间范围不早于该时间
+    :param end:             总结束时间 (不包含), 不为空时最后一个时间范围不晚于该时间
+    :return:                (task_start, task_end) 列表
+    """
+    tasks = []
+    task_days = []
+    for day in days:
+        if task_days and (len(task_days) == days_per_task or day != task_days[-1] + timedelta(days=1)):
+            tasks.append((task_days[0], task_days[-1] + timedelta(days=1)))
+            task_days = []
+        task_days.append(day)
+    if task_days:
+        tasks.append((task_days[0], task_days[-1] + timedelta(days=1)))
+    if tasks and start is not None and tasks[0][0] < start:
+        tasks[0] = (start, tasks[0][1])
+    if tasks and end is not None and tasks[-1][1] > end:
+        tasks[-1] = (tasks[-1][0], end)
+    return tasks
+
+
+def record_task_results(futures, manifest):
+    """
+    按完成顺序将各任务完成的观测日记录到检查点清单.
+    所有任务结束后才抛出第一个失败任务的异常, 其他任务已生成的文件都记录到清单中, 断点续传时不再重新生成
+
+    :param futures:     任务的Future列表, 结果为任务完成的观测日 (见CheckpointManifest.update)
+    :param manifest:    检查点清单 (CheckpointManifest)
+    """
+    error = None
+    for future in as_completed(futures):
+        try:
+            manifest.update(future.result())
+        except Exception as e:
+            if error is None:
+                error = e
+    if error is not None:
+        raise error
+
+
+def open_export_days(exporter, instrument_name, obs_info_code, start=None, end=None, manifest=None, resume=False,
+                     incremental=False, description='files', collection_name=None, check_query=None, prefetch=True):
+    """
+    打开导出的数据源, 返回按观测日分组的观测数据, NCGenerator、CSVGenerator、ParquetGenerator和ZarrGenerator共用.
+    增量导出或断点续传时先由检查点清单确定起始时间, 需要时打印查询的执行计划;
+    设置了本地缓存时按观测日从缓存读取, 否则进行一次范围查询 (原始BSON解码、后台预读取按exporter的设置)
+    并按观测日分组, 迭代结束或中断时关闭游标
+
+    :param exporter:        生成器, 使用其数据库连接和mongodb、spool、batch_size、raw_bson、prefetch等设置
+    :param instrument_name: 设备名
+    :param obs_info_code:   观测信息字段代码
+    :param start:           导出数据的起始时间 (包含), datetime类型，默认为空 (从第一条记录开始)
+    :param end:             导出数据的结束时间 (不包含), datetime类型，默认为空 (到最后一条记录为止)
+    :param manifest:        检查点清单 (CheckpointManifest), resume或incremental为True时使用
+    :param resume:          是否从检查点清单中最后一个完成的观测日的下一天开始导出, 默认为False
+    :param incremental:     是否增量导出 (从检查点清单高水位线所在观测日开始), 默认为False
+    :param description:     打印时导出内容的描述, 例如'nc files'
+    :param collection_name: 数据库集合名称, 默认为空 (设备名+'_VQ')
+    :param check_query:     是否打印查询的执行计划, 默认为空 (按exporter.check_query)
+    :param prefetch:        是否按exporter.prefetch在后台线程中预读取游标, 默认为True
+    :return:                一天的观测数据 (DayBuffer) 的迭代器
+    """
+    if collection_name is None:
+        collection_name = instrument_name + '_VQ'
+    if incremental:
+        start = manifest.incremental_start(start)
+        print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Incremental export of '
+              f'{instrument_name}\'s {description} from: {start}')
+    elif resume:
+        start = manifest.resume_start(start)
+        print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Resume {instrument_name}\'s {description} '
+              f'from: {start}')
+    if exporter.check_query if check_query is None else check_query:
+        exporter.mongodb.check_query_plan(exporter.db_name, collection_name, exporter.username, exporter.pwd,
+                                          obs_info_code, start, end)
+    if exporter.spool is not None:  # 按观测日从本地缓存读取, 缓存无效时查询数据库并写入缓存
+        return exporter.spool.iter_days(exporter.mongodb, exporter.db_name, collection_name, exporter.username,
+                                        exporter.pwd, obs_info_code, start, end, exporter.batch_size,
+                                        exporter.raw_bson)
+    db_data = exporter.mongodb.get_collection_data(exporter.db_name, collection_name, exporter.username, exporter.pwd,
+                                                   obs_info_code, start, end, exporter.batch_size, exporter.raw_bson)
+    if exporter.raw_bson:  # 原始BSON记录直接解码为列式数据
+        db_data = RawBSONRecords(db_data)
+    if prefetch and exporter.prefetch:  # 在后台线程中预读取游标, 与文件写入同时进行
+        db_data = CursorPrefetcher(db_data, exporter.prefetch, exporter.batch_size or 1000)
+    print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Loading {instrument_name}\'s data...')
+    return group_days(db_data, obs_info_code, get_time_code(instrument_name))
+
+
+def group_days(db_data, obs_info_code, time_code):
+    """
+    将按时间排序的记录按观测日分组, 迭代结束后关闭游标
+
+    :param db_data:         数据库游标 (或其他按时间排序的记录的可迭代对象)
+    :param obs_info_code:   观测信息字段代码
+    :param time_code:       时间字段代码
+    :return:                一天的观测数据 (DayBuffer) 的迭代器
+    """
+    try:
+        date_flag = ''
+        one_day_data = DayBuffer(obs_info_code)
+        for data in db_data:
+            now_data_date = data[time_code].strftime("%Y-%m-%d")
+            if date_flag != now_data_date:
+                if len(one_day_data) != 0:
+                    yield one_day_data
+                    one_day_data = DayBuffer(obs_info_code)
+                print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Found start time: {now_data_date}')
+            date_flag = now_data_date
+            one_day_data.append(data)
+        if len(one_day_data) != 0:
+            yield one_day_data
+    finally:
+        db_data.close()
+
+
+_nc_generators = {}  # 流水线写入时工作进程中的生成器, 按生成器参数缓存 (每个进程每种参数只创建一次)
+
+
+def _write_one_day_nc_task(generator_args, generate_args, one_day_data):
+    """
+    流水线写入时工作进程执行的任务: 生成一天的nc文件, 返回文件路径.
+    generator_args为 (base_dir, ip, username, pwd, db_name, port, storage_profiles, cf_time)
+    """
+    key = repr(generator_args)
+    generator = _nc_generators.get(key)
+    if generator is None:
+        generator = _nc_generators[key] = NCGenerator(*generator_args, check_query=False)
+    return generator.generate_one_day_nc_file(generate_args[0], one_day_data, *generate_args[1:])
+
+
+def _generate_nc_file_task(generator_args, generate_args, start, end):
+    """
+    并行生成nc文件时工作进程执行的任务: 每个进程建立自己的数据库连接, 生成[start, end)时间范围内的文件,
+    返回完成的观测日 (CheckpointManifest.days)
+    """
+    generator = NCGenerator(*generator_args)
+    manifest = CheckpointManifest()
+    try:
+        generator.generate_nc_file(*generate_args, start=start, end=end, manifest=manifest)
+        return manifest.days
+    finally:
+        generator.mongodb.close_mongodb_client()
+
+
+def _generate_csv_file_task(generator_args, generate_args, start, end):
+    """
+    并行生成csv文件时工作进程执行的任务: 每个进程建立自己的数据库连接, 生成[start, end)时间范围内的文件,
+    返回完成的观测日 (CheckpointManifest.days)
+    """
+    generator = CSVGenerator(*generator_args)
+    manifest = CheckpointManifest()
+    try:
+        generator.generate_csv_file(*generate_args, start=start, end=end, manifest=manifest)
+        return manifest.days
+    finally:
+        generator.mongodb.close_mongodb_client()
@@ -0,0 +1,274 @@
+# -*- coding:utf-8 -*-
+from dbcontroller import MyMongodb
+from instruments import get_instrument, get_time_code
+from .buffer import to_float
+from .manifest import CheckpointManifest
+from .spectrum import decode_prec_spec
+from .spool import SpoolCache
+from .storage import STORAGE_PROFILES, CF_TIME_UNITS, CF_TIME_CALENDAR, CF_TIME_FILL_VALUE
+from .writer import finalize_header, open_export_days
+import os
+import time
+import numpy as np
+import netCDF4 as nc
+
+try:
+    import zarr
+    import numcodecs
+except ImportError:  # 未安装zarr时不能生成Zarr存储
+    zarr = numcodecs = None
+
+# nc数据类型: Zarr数组的数据类型 (与nc文件一致)
+ZARR_DTYPES = {
+    'f': 'f4', 'd': 'f8', 'i': 'i4', 'i8': 'i8', 'u1': 'u1', 'u2': 'u2', 'u4': 'u4', 'str': object,
+    'array31_i': 'u2', 'array32_i': 'u2', 'array31_f': 'f8', 'array32_d': 'f8', 'array64': 'f8',
+}
+
+# 数组观测要素各维度的维度名 (与nc文件一致), 按维度长度确定
+DIMENSION_NAMES = {
+    22: 'Dime_numb_part_diam_clas', 20: 'Dime_numb_part_velo_clas', 58: 'Dime_HGT_58', 450: 'Dime_bs_prof',
+    31: 'Dime_HGT_31', 32: 'Dime_HGT_32', 64: 'Dime_part_diam_clas',
+}
+
+
+class ZarrGenerator:
+    def __init__(self, base_dir, ip, username, pwd, db_name, port=27017, storage_profiles=None, threads=None,
+                 prefetch=0, batch_size=None, raw_bson=False, check_query=False, spool_dir=None):
+        """
+        初始化设置.
+        每个设备的数据保存在一个本地目录Zarr存储中 ("base_dir/instrument_name/instrument_name.zarr"),
+        每个观测要素为一个沿时间维度分块的数组, 每生成一天的数据追加到数组末尾, 长时间序列的切片只需读取对应的分块.
+        时间字段保存为CF规范的数值时间 (int64, 带units和calendar属性), 廓线、谱等数组的维度与nc文件一致
+        (RRD的谱数组转置为 (时间, 高度, 粒子直径)); 各数组的_ARRAY_DIMENSIONS属性为维度名, 可通过xarray.open_zarr读取.
+        文件头描述信息与nc文件相同, 保存为存储根组的属性
+
+        :param base_dir:            Zarr存储根目录
+        :param ip:                  MongoDB数据库服务器IP地址
+        :param username:            登录验证的用户名
+        :param pwd:                 登录验证的密码
+        :param db_name:             数据库名称
+        :param port:                MongoDB数据库服务器端口，默认为27017
+        :param storage_profiles:    各设备的存储设置 (设备名: StorageProfile), 默认为STORAGE_PROFILES;
+                                    time_chunk和chunks为数组的分块长度, complevel和shuffle为Blosc (zstd) 压缩的设置
+        :param threads:             Blosc压缩使用的线程数, 默认为空 (使用numcodecs的默认设置)
+        :param prefetch:            后台预读取时队列中最多缓存的记录组数, 默认为0 (不预读取)
+        :param batch_size:          游标每批从服务器获取的记录条数, 默认为空 (使用服务器默认值)
+        :param raw_bson:            是否以原始BSON读取记录并直接解码为列式数据, 默认为False
+        :param check_query:         导出前是否打印查询的执行计划, 默认为False
+        :param spool_dir:           本地缓存目录, 默认为空 (不缓存)
+        """
+        if zarr is None:
+            raise ImportError('ZarrGenerator requires zarr')
+        self.mongodb = MyMongodb(ip, port, username, pwd, db_name)
+        self.ip = ip
+        self.port = port
+        self.db_name = db_name
+        self.username = username
+        self.pwd = pwd
+        self.base_dir = base_dir
+        self.storage_profiles = dict(STORAGE_PROFILES) if storage_profiles is None else storage_profiles
+        self.threads = threads
+        self.prefetch = prefetch
+        self.batch_size = batch_size
+        self.raw_bson = raw_bson
+        self.check_query = check_query
+        self.spool_dir = spool_dir
+        self.spool = SpoolCache(spool_dir) if spool_dir is not None else None
+        if threads is not None:
+            numcodecs.blosc.use_threads = True
+            numcodecs.blosc.set_nthreads(threads)
+
+    def get_store_path(self, instrument_name):
+        """
+        获取设备的Zarr存储路径: "base_dir/instrument_name/instrument_name.zarr"
+
+        :param instrument_name: 设备名
+        :return:                存储路径
+        """
+        return os.path.join(self.base_dir, instrument_name, instrument_name + '.zarr')
+
+    def generate_zarr_store(self, instrument_name, header_info_code, header_info_longname, header_info_unit,
+                            header_info_nc_type, header_info_value, obs_info_code, obs_info_longname, obs_info_unit,
+                            obs_info_nc_type, start=None, end=None, resume=False, incremental=False, manifest=None):
+        """
+        按观测日将数据追加到设备的Zarr存储, 参数与NCGenerator.generate_nc_file相同.
+        观测日需要按时间顺序追加; 追加的观测日已在存储中时, 先删除存储中该观测日起始时间及之后的记录再追加,
+        因此重新导出 (例如增量导出时高水位线所在的观测日) 不会产生重复记录
+
+        :param instrument_name:         设备名
+        :param header_info_code:        文件头描述信息字段代码
+        :param header_info_longname:    文件头描述信息字段中英文描述
+        :param header_info_unit:        文件头描述信息字段单位
+        :param header_info_nc_type:     文件头描述信息字段对应nc文件中保存的数据类型
+        :param header_info_value:       文件头描述信息字段对应值
+        :param obs_info_code:           观测信息字段代码
+        :param obs_info_longname:       观测信息字段中英文描述
+        :param obs_info_unit:           观测信息字段单位
+        :param obs_info_nc_type:        观测信息字段对应nc文件中保存的数据类型
+        :param start:                   导出数据的起始时间 (包含), datetime类型，默认为空 (从第一条记录开始)
+        :param end:                     导出数据的结束时间 (不包含), datetime类型，默认为空 (到最后一条记录为止)
+        :param resume:                  是否从检查点清单中最后一个完成的观测日的下一天开始导出, 默认为False
+        :param incremental:             是否增量导出 (只查询检查点清单高水位线所在观测日及之后的数据,
+                                        高水位线所在观测日的记录重新写入), 默认为False
+        :param manifest:                检查点清单 (CheckpointManifest), 每追加一天的数据记录一次,
+                                        默认为存储根目录下该设备Zarr存储的清单
+        """
+        field_args = (header_info_code, header_info_longname, header_info_unit, header_info_nc_type,
+                      header_info_value, obs_info_code, obs_info_longname, obs_info_unit, obs_info_nc_type)
+        if manifest is None:
+            manifest = CheckpointManifest.for_export(self.base_dir, instrument_name, 'zarr')
+        time_code = get_time_code(instrument_name)
+        days = open_export_days(self, instrument_name, obs_info_code, start, end, manifest, resume, incremental,
+                                'zarr store')
+        for one_day_data in days:
+            path = self.append_one_day_zarr(instrument_name, one_day_data, *field_args)
+            manifest.record_one_day_data(path, one_day_data, time_code)
+
+    def append_one_day_zarr(self, instrument_name, one_day_data, header_info_code, header_info_longname,
+                            header_info_unit, header_info_nc_type, header_info_value, obs_info_code,
+                            obs_info_longname, obs_info_unit, obs_info_nc_type):
+        """
+        将一天的数据追加到设备的Zarr存储, 存储或数组不存在时创建.
+        存储中已有该观测日起始时间及之后的记录时, 先将所有数组截断到该观测日之前再追加
+
+        :param instrument_name:         设备名
+        :param one_day_data:            一天的观测数据 (DayBuffer列式缓存)
+        :param header_info_code:        文件头描述信息字段代码
+        :param header_info_longname:    文件头描述信息字段中英文描述
+        :param header_info_unit:        文件头描述信息字段单位
+        :param header_info_nc_type:     文件头描述信息字段对应nc文件中保存的数据类型
+        :param header_info_value:       文件头描述信息字段对应值
+        :param obs_info_code:           观测信息字段代码
+        :param obs_info_longname:       观测信息字段中英文描述
+        :param obs_info_unit:           观测信息字段单位
+        :param obs_info_nc_type:        观测信息字段对应nc文件中保存的数据类型
+        :return:                        Zarr存储路径, 设备名无效时返回None
+        """
+        spec = get_instrument(instrument_name)
+        if spec is None:
+            print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Invalid device name: {instrument_name}')
+            return
+        start_time = one_day_data[spec.time_code][0]  # 一天中记录开始时间
+        end_time = one_day_data[spec.time_code][-1]  # 一天中记录结束时间
+        store_path = self.get_store_path(instrument_name)
+        print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] Appending {instrument_name}\'s '
+              f'zarr store: {start_time} ~ {end_time}')
+        storage_profile = self.storage_profiles.get(instrument_name)
+        root = zarr.open_group(store_path, mode='a')
+        # -------------------------------------------------观测要素信息------------------------------------------------- #
+        # 截断存储中该观测日起始时间及之后的记录
+        size = min((root[code].shape[0] for code in obs_info_code if code in root), default=0)
+        if spec.time_code in root and size:
+            times = root[spec.time_code][:size]
+            size = int(np.searchsorted(times, one_day_data.datetime_seconds(spec.time_code)[0]))
+        for code, longname, unit, nc_type in zip(obs_info_code, obs_info_longname, obs_info_unit, obs_info_nc_type):
+            values, dimensions, fill_value = zarr_values(one_day_data, code, nc_type, spec.name)
+            if code not in root:
+                array = create_zarr_array(root, code, values, (obs_info_code[0],) + dimensions, fill_value,
+                                          storage_profile)
+                array.attrs['long_name'] = longname
+                array.attrs['units'] = unit
+                if is_time_code(code):
+                    array.attrs.update(units=CF_TIME_UNITS, calendar=CF_TIME_CALENDAR)
+            else:
+                array = root[code]
+                if values.dtype != array.dtype:  # 数组的数据类型由第一次追加确定, 之后追加的值转换为该类型
+                    values = cast_zarr_values(values, array.dtype, array.fill_value)
+            if array.shape[0] != size:
+                array.resize((size,) + array.shape[1:])
+            array.append(values)
+        # --------------------------------------------------头文件信息-------------------------------------------------- #
+        # 记录起始时间为存储中第一条记录的时间, 结束时间为最后追加的记录的时间
+        header_info_value = finalize_header(spec, one_day_data, header_info_value, spec.header_overrides)
+        header_info_value[-4] = (root.attrs.get(header_info_code[-4]) if size else None) or header_info_value[-4]
+        root.attrs.update(dict(zip(header_info_code, header_info_value)))
+        zarr.consolidate_metadata(store_path)  # 合并各数组的元数据, 读取时只需读取一个元数据文件
+        print(f'[{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}] save {store_path} success!')
+        return store_path
+
+
+def zarr_values(one_day_data, code, nc_type, instrument_name):
+    """
+    将一天的一个观测要素转换为追加到Zarr数组的numpy数组.
+    时间字段 (代码以'Datetime'开头或为'GPS_DT') 转换为CF规范的数值时间, 数值字段按nc数据类型转换,
+    不能转换为数值的值 (例如'Nan') 为缺测值; nc数据类型未知时保存为float64 (不按DayBuffer中当天的字段类型确定)
+
+    :param one_day_data:    一天的观测数据 (DayBuffer列式缓存)
+    :param code:            观测要素代码
+    :param nc_type:         nc数据类型
+    :param instrument_name: 设备名
+    :return:                (numpy数组, 时间维度之外的维度名, 缺测值)
+    """
+    column = one_day_data[code]
+    if is_time_code(code):
+        return one_day_data.datetime_seconds(code).filled(CF_TIME_FILL_VALUE), (), CF_TIME_FILL_VALUE
+    if code == 'Prec_spec':
+        values = decode_prec_spec(column)
+    elif nc_type.startswith('array'):
+        values = one_day_data.values(code)
+        if nc_type in ZARR_DTYPES:
+            values = values.astype(ZARR_DTYPES[nc_type])
+        if values.ndim == 3 and instrument_name.startswith('RRD'):  # 与nc文件一致: (时间, 高度, 粒子直径)
+            values = np.transpose(values, (0, 2, 1))
+    else:
+        dtype = np.dtype(ZARR_DTYPES.get(nc_type, 'f8'))
+        if dtype == object:
+            return np.array([str(v) for v in column.tolist()], dtype=object), (), ''
+        fill_value = np.nan if dtype.kind == 'f' else nc.default_fillvals[dtype.str[1:]]
+        return cast_zarr_values(column, dtype, fill_value), (), fill_value
+    dimensions = tuple(DIMENSION_NAMES.get(size, f'Dime_{code}_{k}') for k, size in enumerate(values.shape[1:]))
+    return values, dimensions, 0
+
+
+def cast_zarr_values(values, dtype, fill_value):
+    """
+    将一个观测要素的值转换为Zarr数组的数据类型, 不能转换为数值的值 (例如'Nan') 为缺测值
+
+    :param values:      numpy数组
+    :param dtype:       Zarr数组的数据类型
+    :param fill_value:  缺测值
+    :return:            numpy数组
+    """
+    dtype = np.dtype(dtype)
+    if dtype == object:
+        return np.array([str(v) for v in values.tolist()], dtype=object)
+    if values.dtype.kind not in 'fiu':
+        values = np.vectorize(to_float, otypes=[np.float64])(values) if values.size else values.astype(np.float64)
+    if dtype.kind != 'f' and values.dtype.kind == 'f':
+        values = np.where(np.isnan(values), fill_value, values)
+    return values.astype(dtype)
+
+
+def is_time_code(code):
+    """
+    是否为时间字段 (代码以'Datetime'开头或为'GPS_DT')
+    """
+    return code.startswith('Datetime') or code == 'GPS_DT'
+
+
+def create_zarr_array(root, code, values, dimensions, fill_value, storage_profile=None):
+    """
+    按存储设置创建沿时间维度追加的Zarr数组 (初始长度为0)
+
+    :param root:            Zarr存储的根组 (zarr.Group)
+    :param code:            观测要素代码
+    :param values:          第一次追加的值, 用于确定数据类型和非时间维度的形状
+    :param dimensions:      维度名 (第一个维度为时间维度)
+    :param fill_value:      缺测值
+    :param storage_profile: 存储设置 (StorageProfile), 为空时不压缩、时间维度按1440条记录分块
+    :return:                zarr.Array
+    """
+    time_chunk = storage_profile.time_chunk if storage_profile is not None else 1440
+    chunks = [time_chunk]
+    for dim, size in zip(dimensions[1:], values.shape[1:]):
+        chunks.append(min(storage_profile.chunks.get(dim, size), size) if storage_profile is not None else size)
+    compressor = None
+    if storage_profile is not None and storage_profile.complevel > 0:
+        shuffle = numcodecs.Blosc.SHUFFLE if storage_profile.shuffle else numcodecs.Blosc.NOSHUFFLE
+        compressor = numcodecs.Blosc(cname='zstd', clevel=storage_profile.complevel, shuffle=shuffle)
+    kwargs = {'object_codec': numcodecs.VLenUTF8()} if values.dtype == object else {}
+    array = root.create_dataset(code, shape=(0,) + values.shape[1:], chunks=chunks, dtype=values.dtype,
+                                compressor=compressor, fill_value=fill_value, **kwargs)
+    array.attrs['_ARRAY_DIMENSIONS'] = list(dimensions)
+    return array
+
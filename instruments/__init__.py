@@ -0,0 +1,3 @@
+# -*- coding:utf-8 -*-
+from .registry import *
+from .specs import *
@@ -0,0 +1,138 @@
+# -*- coding:utf-8 -*-
+
+INSTRUMENTS = {}        # 设备名: InstrumentSpec
+_FILENAME_INDEX = {}    # (资料代码, 数据级别): InstrumentSpec, 用于由文件名查找设备
+
+
+class InstrumentSpec:
+    def __init__(self, name, filename_codes, header_fields, obs_fields, nc_writer, csv_writer, csv_reader,
+                 nc_writer_args=(), csv_writer_args=(), csv_reader_args=(), is_quality_control=True,
+                 time_code='Datetime', header_overrides=None, csv_header_overrides=None, csv_array_shapes=None):
+        """
+        设备的声明式描述.
+        集中记录一个设备的文件名代码、文件头和观测要素字段、文件生成函数和读取函数,
+        NCGenerator、CSVGenerator和CSVReader都从注册表中查找设备, 新增设备时只需要注册一个InstrumentSpec.
+        创建时将字段表编译为生成函数使用的各个字段列表, 生成和读取文件时不再逐个设备、逐个字段比较字符串.
+
+        :param name:                    设备名 (数据库集合名为设备名+'_VQ')
+        :param filename_codes:          文件名中的 (一级类别, 三级类别, 四级类别, 台站代码, 资料代码, 厂商代码, 数据级别),
+                                        见NCGenerator.generate_filename
+        :param header_fields:           文件头描述信息字段表, 每行为 (代码, 中英文描述, 单位, nc数据类型, 值)
+        :param obs_fields:              观测信息字段表, 每行为 (代码, 中英文描述, 单位, nc数据类型)
+        :param nc_writer:               NCGenerator中生成一天nc文件的函数名
+        :param csv_writer:              CSVGenerator中生成一天csv文件的函数名
+        :param csv_reader:              CSVReader中读取csv文件的函数名
+        :param nc_writer_args:          nc文件生成函数在保存路径之后的其他参数, 默认为空
+        :param csv_writer_args:         csv文件生成函数在保存路径之后的其他参数, 默认为空
+        :param csv_reader_args:         csv文件读取函数的参数, 默认为空
+        :param is_quality_control:      文件名中是否有质控标识, 默认为True
+        :param time_code:               用于排序、按日分组的时间字段代码, 默认为'Datetime'
+        :param header_overrides:        生成nc文件 (以及Parquet文件、Zarr存储) 时替换的文件头值 {下标: 值}, 默认为空
+        :param csv_header_overrides:    生成csv文件时替换的文件头值 {下标: 值}, 默认为空
+        :param csv_array_shapes:        csv文件中由多列组成的观测要素 {列名: 读取后的数组形状 (为空时不改变形状)},
+                                        默认为nc数据类型为'array'的观测要素
+        """
+        self.name = name
+        self.filename_codes = tuple(filename_codes)
+        self.nc_writer = nc_writer
+        self.csv_writer = csv_writer
+        self.csv_reader = csv_reader
+        self.nc_writer_args = tuple(nc_writer_args)
+        self.csv_writer_args = tuple(csv_writer_args)
+        self.csv_reader_args = tuple(csv_reader_args)
+        self.is_quality_control = is_quality_control
+        self.time_code = time_code
+        self.header_overrides = dict(header_overrides) if header_overrides is not None else {}
+        self.csv_header_overrides = dict(csv_header_overrides) if csv_header_overrides is not None else {}
+        # 字段表编译为与生成函数参数对应的字段列表
+        self.header_code = [row[0] for row in header_fields]
+        self.header_longname = [row[1] for row in header_fields]
+        self.header_units = [row[2] for row in header_fields]
+        self.header_nc_type = [row[3] for row in header_fields]
+        self.header_value = [row[4] for row in header_fields]
+        self.obs_code = [row[0] for row in obs_fields]
+        self.obs_longname = [row[1] for row in obs_fields]
+        self.obs_units = [row[2] for row in obs_fields]
+        self.obs_nc_type = [row[3] for row in obs_fields]
+        # 值为以空格分隔的列表的文件头字段, 读取时拆分为列表
+        self.header_array_codes = frozenset(code for code, nc_type in zip(self.header_code, self.header_nc_type)
+                                            if nc_type == 'array')
+        if csv_array_shapes is None:
+            csv_array_shapes = {code: None for code, nc_type in zip(self.obs_code, self.obs_nc_type)
+                                if nc_type == 'array'}
+        self.csv_array_shapes = csv_array_shapes
+
+    @property
+    def collection_name(self):
+        """
+        数据库集合名称
+        """
+        return self.name + '_VQ'
+
+    @property
+    def data_code(self):
+        """
+        文件名中的 (资料代码, 数据级别)
+        """
+        return self.filename_codes[4], self.filename_codes[6]
+
+    @property
+    def nc_args(self):
+        """
+        generate_nc_file等函数的字段参数:
+        (header_info_code, header_info_longname, header_info_unit, header_info_nc_type, header_info_value,
+        obs_info_code, obs_info_longname, obs_info_unit, obs_info_nc_type)
+        """
+        return (self.header_code, self.header_longname, self.header_units, self.header_nc_type, self.header_value,
+                self.obs_code, self.obs_longname, self.obs_units, self.obs_nc_type)
+
+    @property
+    def csv_args(self):
+        """
+        generate_csv_file等函数的字段参数: (header_info_value, obs_info_code)
+        """
+        return self.header_value, self.obs_code
+
+
+def register_instrument(spec):
+    """
+    注册设备, 同名设备已存在时替换
+
+    :param spec:    InstrumentSpec
+    :return:        spec
+    """
+    INSTRUMENTS[spec.name] = spec
+    _FILENAME_INDEX[spec.data_code] = spec
+    return spec
+
+
+def get_instrument(instrument_name):
+    """
+    按设备名查找设备
+
+    :param instrument_name: 设备名
+    :return:                InstrumentSpec, 设备未注册时返回None
+    """
+    return INSTRUMENTS.get(instrument_name)
+
+
+def find_instrument(data_code, data_level):
+    """
+    按文件名中的资料代码和数据级别查找设备
+
+    :param data_code:   资料代码, 例如'AWS'、'RRD'
+    :param data_level:  数据级别, 例如'LX'、'Lave'
+    :return:            InstrumentSpec, 没有对应的设备时返回None
+    """
+    return _FILENAME_INDEX.get((data_code, data_level))
+
+
+def get_time_code(instrument_name):
+    """
+    获取设备用于排序、按日分组的时间字段代码
+
+    :param instrument_name: 设备名
+    :return:                时间字段代码, 设备未注册时为'Datetime'
+    """
+    spec = INSTRUMENTS.get(instrument_name)
+    return spec.time_code if spec is not None else 'Datetime'
@@ -0,0 +1,602 @@
+# -*- coding:utf-8 -*-
+# 各设备的字段表和注册信息.
+# 文件头字段表每行为 (代码, 中英文描述, 单位, nc数据类型, 值), 观测要素字段表每行为 (代码, 中英文描述, 单位, nc数据类型)
+from .registry import InstrumentSpec, register_instrument
+
+# --------------------------------六要素自动站AWS-------------------------------- #
+AWS_HEADER_FIELDS = [
+    ('Station_name', 'Station name', '-', 'str', 'Lushan cloud and fog experiment station'),
+    ('Country', 'Country', '-', 'str', 'China'),
+    ('Province', 'Province', '-', 'str', 'Jiangxi'),
+    ('City', 'City', '-', 'str', 'Jiujiang'),
+    ('County', 'County', '-', 'str', 'Lushan scenic area'),
+    ('Station_ID', 'Station identity', '-', 'str', 'LSYWZ'),
+    ('LAT', 'Latitude', '°', 'f', '29.57'),
+    ('LON', 'Longitude', '°', 'f', '115.97'),
+    ('ALT', 'Altitude', 'm', 'u2', '1080'),
+    ('Station_type', 'Station type', '-', 'u1', '1'),
+    ('Station_level', 'Station level', '-', 'str', '015'),
+    ('Admi_code_CHN', 'Administrative area code of China', '-', 'str', '360400'),
+    ('Mete_data_code', 'Meteorological data code', '-', 'str', 'AWS (Atuomatic weather station)'),
+    ('Manufacturer_model', 'Manufacturer and model', '-', 'str', 'Huayun GH-BPR'),
+    ('Software_version', 'Software version', '-', 'str', 'Central monitoring system'),
+    ('Pres_sens_HGT', 'Pressure sensor height', 'm', 'f', '1.5'),
+    ('Temp_RH_sens_HGT', 'Temperature and relative humidity sensors height', 'm', 'f', '1.8'),
+    ('Wind_sens_HGT', 'Wind sensor height', 'm', 'f', '2.0'),
+    ('Data_level', 'Data level', '-', 'str', 'LX'),
+    ('Timezone', 'Timezone', '-', 'str', 'UTC+8'),
+    ('Time_resolution', 'Time resolution', 's', 'u1', '60'),
+    ('Obse_begi_DT', 'Observing beginning datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Obse_end_DT', 'Observing ending datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Data_crea_DT', 'Data creating datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Dataset_version', 'Dataset version', '-', 'str', '1.0'),
+]
+AWS_OBS_FIELDS = [
+    ('Datetime', 'Datetime', 'yyyy-mm-dd hh:mm:ss', 'str'),
+    ('Pres', 'Pressure', 'hPa', 'f'),
+    ('Temp', 'Ambient temperature', '°C', 'f'),
+    ('RH', 'Relative humidity', '%', 'f'),
+    ('Wind_Dire_AVG_1MIN', 'Average wind direction in 1 minute', '°', 'f'),
+    ('Wind_Spee_AVG_1MIN', 'Average speed direction in 1 minute', 'm s-1', 'f'),
+    ('Prec_1MIN', 'Precipitation in 1 minute', 'mm', 'f'),
+    ('Volt', 'Voltage', 'V', 'f'),
+    ('Q_Pres', 'Quality control code of pressure', '-', 'u1'),
+    ('Q_Temp', 'Quality control code of ambient temperature', '-', 'u1'),
+    ('Q_RH', 'Quality control code of relative humidity', '-', 'u1'),
+    ('Q_Wind_Dire_AVG_1MIN', 'Quality control code of average wind direction in 1 minute', '-', 'u1'),
+    ('Q_Wind_Spee_AVG_1MIN', 'Quality control code of average speed direction in 1 minute', '-', 'u1'),
+    ('Q_Prec_1MIN', 'Quality control code of precipitation in 1 minute', '-', 'u1'),
+    ('Q_Volt', 'Quality control code of voltage', '-', 'u1'),
+]
+
+# --------------------------------颗粒物仪-------------------------------- #
+AERM_HEADER_FIELDS = [
+    ('Station_name', 'Station name', '-', 'str', 'Lushan cloud and fog experiment station'),
+    ('Country', 'Country', '-', 'str', 'China'),
+    ('Province', 'Province', '-', 'str', 'Jiangxi'),
+    ('City', 'City', '-', 'str', 'Jiujiang'),
+    ('County', 'County', '-', 'str', 'Lushan scenic area'),
+    ('Station_ID', 'Station identity', '-', 'str', 'LSYWZ'),
+    ('LAT', 'Latitude', '°', 'f', '29.57'),
+    ('LON', 'Longitude', '°', 'f', '115.97'),
+    ('ALT', 'Altitude', 'm', 'u2', '1080'),
+    ('Station_type', 'Station type', '-', 'str', '1'),
+    ('Station_level', 'Station level', '-', 'str', '015'),
+    ('Admi_code_CHN', 'Administrative area code of China', '-', 'str', '360400'),
+    ('Mete_data_code', 'Meteorological data code', '-', 'str', 'AERM (Aerosol measuring)'),
+    ('Manufacturer_model', 'Manufacturer and model', '-', 'str', 'Thermo Scientific TEOM 1405-DF'),
+    ('Software_version', 'Software version', '-', 'str', '-'),
+    ('AERM_sens_HGT', 'Aerosol measuring sensor height', 'm', 'f', '2.5'),
+    ('Data_level', 'Data level', '-', 'str', 'LX'),
+    ('Timezone', 'Timezone', '-', 'str', 'UTC+8'),
+    ('Time_resolution', 'Time resolution', 's', 'u2', '360'),
+    ('Obse_begi_DT', 'Observing beginning datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Obse_end_DT', 'Observing ending datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Data_crea_DT', 'Data creating datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Dataset_version', 'Dataset version', '-', 'str', '1.0'),
+]
+AERM_OBS_FIELDS = [
+    ('Datetime', 'Datetime', 'yyyy-mm-dd hh:mm:ss', 'str'),
+    ('Status_condition', 'Status condition', '-', 'u1'),
+    ('Temp_ambi', 'Ambient temperature', '°C', 'f'),
+    ('RH_ambi', 'Ambient RH', '%', 'f'),
+    ('Pres_ambi', 'Ambient pressure', 'atm', 'f'),
+    ('MC_TEOMA', 'Mass concentration for PM2.5 channel (TEOMA)', 'ug m-3', 'f'),
+    ('MC_TEOMA_refe', 'Reference mass concentration for PM2.5 channel (TEOMA)', 'ug m-3', 'f'),
+    ('MC_TEOMA_base', 'Base mass concentration for PM2.5 channel (TEOMA)', 'ug m-3', 'f'),
+    ('MC_TEOMA_1HR', '1-Hr massconcentration average for PM2.5 channel (TEOMA)', 'ug m-3', 'f'),
+    ('MC_TEOMA_24HR', '24-Hr mass concentration average for PM2.5 channel (TEOMA)', 'ug m-3', 'f'),
+    ('MC_TEOMB', 'Mass concentration for PM coarse channel (TEOMB)', 'ug m-3', 'f'),
+    ('MC_TEOMB_refe', 'Reference mass concentration for PM coarse channel (TEOMB)', 'ug m-3', 'f'),
+    ('MC_TEOMB_base', 'Base mass concentration for PM coarse channel (TEOMB)', 'ug m-3', 'f'),
+    ('MC_TEOMB_1HR', '1-Hr mass concentration average for PM coarse channel (TEOMB)', 'ug m-3', 'f'),
+    ('MC_TEOMB_24HR', '24-Hr mass concentration average for PM coarse channel (TEOMB)', 'ug m-3', 'f'),
+    ('MC_dich_1HR', '1-Hr dichot mass concentration average for PM 10', 'ug m-3', 'f'),
+    ('MC_dich_24HR', '24-Hr mass concentration average for PM 10', 'ug m-3', 'f'),
+    ('Nois_TEOMA', 'Noise of PM2.5 channel (TEOMA)', '-', 'f'),
+    ('Nois_TEOMB', 'Noise of PM coarse channel (TEOMB)', '-', 'f'),
+    ('Flow_mass_TEOMA', 'Flow mass of PM2.5 channel (TEOMA)', 'L min–1', 'f'),
+    ('Flow_mass_TEOMB', 'Flow mass of PM coarse channel (TEOMC)', 'L min–1', 'f'),
+    ('Flow_mass_bypa', 'Bypass flow mass', 'L min–1', 'f'),
+    ('Q_MC_TEOMA', 'Quality control code of mass concentration for PM2.5 channel (TEOMA)', '-', 'u1'),
+    ('Q_MC_TEOMA_refe', 'Quality control code of reference mass concentration for PM2.5 channel (TEOMA)', '-', 'u1'),
+    ('Q_MC_TEOMA_base', 'Quality control code of base mass concentration for PM2.5 channel (TEOMA)', '-', 'u1'),
+    ('Q_MC_TEOMA_1HR', 'Quality control code of 1-Hr mass concentration average for PM2.5 channel (TEOMA)', '-', 'u1'),
+    ('Q_MC_TEOMA_24HR', 'Quality control code of 24-Hr mass concentration average for PM2.5 channel (TEOMA)', '-',
+     'u1'),
+    ('Q_MC_TEOMB', 'Quality control code of Mass concentration for PM coarse channel (TEOMB)', '-', 'u1'),
+    ('Q_MC_TEOMB_refe', 'Quality control code of reference mass concentration for PM coarse channel (TEOMB)', '-',
+     'u1'),
+    ('Q_MC_TEOMB_base', 'Quality control code of base mass concentration for PM coarse channel (TEOMB)', '-', 'u1'),
+    ('Q_MC_TEOMB_1HR', 'Quality control code of 1-Hr mass concentration average for PM coarse channel (TEOMB)', '-',
+     'u1'),
+    ('Q_MC_TEOMB_24HR', 'Quality control code of 24-Hr mass concentration average for PM coarse channel (TEOMB)', '-',
+     'u1'),
+    ('Q_MC_dich_1HR', 'Quality control code of 1-Hr mass concentration average for PM10', '-', 'u1'),
+    ('Q_MC_dich_24HR', 'Quality control code of 24-Hr mass concentration average for PM 10', '-', 'u1'),
+]
+
+# --------------------------------能见度仪-------------------------------- #
+VIS_HEADER_FIELDS = [
+    ('Station_name', 'Station name', '-', 'str', 'Lushan cloud and fog experiment station'),
+    ('Country', 'Country', '-', 'str', 'China'),
+    ('Province', 'Province', '-', 'str', 'Jiangxi'),
+    ('City', 'City', '-', 'str', 'Jiujiang'),
+    ('County', 'County', '-', 'str', 'Lushan scenic area'),
+    ('Station_ID', 'Station identity', '-', 'str', 'LSYWZ'),
+    ('LAT', 'Latitude', '°', 'f', '29.57'),
+    ('LON', 'Longitude', '°', 'f', '115.97'),
+    ('ALT', 'Altitude', 'm', 'u2', '1080'),
+    ('Station_type', 'Station type', '-', 'u1', '1'),
+    ('Station_level', 'Station level', '-', 'str', '015'),
+    ('Admi_code_CHN', 'Administrative area code of China', '-', 'str', '360400'),
+    ('Mete_data_code', 'Meteorological data code', '-', 'str', 'VIS (Visibility)'),
+    ('Manufacturer_model', 'Manufacturer and model', '-', 'str', 'Vaisala PWD22'),
+    ('Software_version', 'Software version', '-', 'str',
+     'Huayun visibility detection sub-station monitoring program 1.01'),
+    ('VIS_sens_HGT', 'Visibility sensor height', 'm', 'f', '2.5'),
+    ('Data_level', 'Data level', '-', 'str', 'LX'),
+    ('Timezone', 'Timezone', '-', 'str', 'UTC+8'),
+    ('Time_resolution', 'Time resolution', 's', 'u1', '16'),
+    ('Obse_begi_DT', 'Observing beginning datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Obse_end_DT', 'Observing ending datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Data_crea_DT', 'Data creating datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Dataset_version', 'Dataset version', '-', 'str', '1.0'),
+]
+VIS_OBS_FIELDS = [
+    ('Datetime', 'Datetime', 'yyyy-mm-dd hh:mm:ss', 'str'),
+    ('VIS_hori_1MIN', 'Average horizontal visibility in 1 minute', 'm', 'f'),
+    ('VIS_hori_10MIN', 'Average horizontal visibility in 10 minute', 'm', 'f'),
+    ('Q_VIS_hori_1MIN', 'Quality control code of average horizontal visibility in 1 minute', '-', 'u1'),
+    ('Q_VIS_hori_10MIN', 'Quality control code of average horizontal visibility in 10 minute', '-', 'u1'),
+]
+
+# --------------------------------云高仪三级数据-------------------------------- #
+YCCL_L3_HEADER_FIELDS = [
+    ('Station_name', 'Station name', '-', 'str', 'Lushan cloud and fog experiment station'),
+    ('Country', 'Country', '-', 'str', 'China'),
+    ('Province', 'Province', '-', 'str', 'Jiangxi'),
+    ('City', 'City', '-', 'str', 'Jiujiang'),
+    ('County', 'County', '-', 'str', 'Lushan scenic area'),
+    ('Station_ID', 'Station identity', '-', 'str', 'LSYWZ'),
+    ('LAT', 'Latitude', '°', 'f', '29.57'),
+    ('LON', 'Longitude', '°', 'f', '115.97'),
+    ('ALT', 'Altitude', 'm', 'u2', '1080'),
+    ('Station_type', 'Station type', '-', 'u1', '1'),
+    ('Station_level', 'Station level', '-', 'str', '015'),
+    ('Admi_code_CHN', 'Administrative area code of China', '-', 'str', '360400'),
+    ('Mete_data_code', 'Meteorological data code', '-', 'str', 'YCCL (Laser ceilometer)'),
+    ('Manufacturer_model', 'Manufacturer and model', '-', 'str', 'Vaisala CL31'),
+    ('Software_version', 'Software version', '-', 'str', 'BL-view 1.1'),
+    ('YCCL_sens_HGT', 'Laser ceilometer sensor height', 'm', 'f', '0.0'),
+    ('Data_level', 'Data level', '-', 'str', 'L3'),
+    ('Timezone', 'Timezone', '-', 'str', 'UTC+8'),
+    ('Time_resolution', 'Time resolution', 's', 'u1', '16'),
+    ('Obse_begi_DT', 'Observing beginning datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Obse_end_DT', 'Observing ending datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Data_crea_DT', 'Data creating datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Dataset_version', 'Dataset version', '-', 'str', '1.0'),
+]
+YCCL_L3_OBS_FIELDS = [
+    ('Datetime', 'Datetime', 'yyyy-mm-dd hh:mm:ss', 'str'),
+    ('Unixtime', 'UNIX time (Time stamp)', '-', 'str'),
+    ('Sample_count', 'Sample count', '-', 'u4'),
+    ('BL_HGT_1', 'First boundary layer height candidate (-999 if no candidate)', 'm', 'i'),
+    ('BL_IDX_1', 'Quality index for first boundary layer height candidate (-999 if no candidate)', '-', 'i'),
+    ('BL_HGT_2', 'Second boundary layer height candidate (-999 if no candidate)', 'm', 'i'),
+    ('BL_IDX_2', 'Quality index for second boundary layer height candidate (-999 if no candidate)', '-', 'i'),
+    ('BL_HGT_3', 'Third boundary layer height candidate (-999 if no candidate)', 'm', 'i'),
+    ('BL_IDX_3', 'Quality index for third boundary layer height candidate (-999 if no candidate)', '-', 'i'),
+    ('Cloud_status', 'Cloud status', '-', 'u1'),
+    ('Cloud_base_1', 'First cloud base or vertical visibility  (-999 if no cloud base or vertical visibility)', 'm',
+     'i'),
+    ('Cloud_base_2', 'Second cloud base or vertical visibility  (-999 if no cloud base or vertical visibility)', 'm',
+     'i'),
+    ('Cloud_base_3', 'Third cloud base or vertical visibility  (-999 if no cloud base or vertical visibility)', 'm',
+     'i'),
+    ('Parameters', 'Parameters', '-', 'str'),
+    ('Q_BL_HGT_1', 'Quality control code of boundary layer height 1', '-', 'u1'),
+    ('Q_BL_HGT_2', 'Quality control code of boundary layer height 2', '-', 'u1'),
+    ('Q_BL_HGT_3', 'Quality control code of boundary layer height 3', '-', 'u1'),
+    ('Q_Cloud_base_1', 'Quality control code of cloud base height 1', '-', 'u1'),
+    ('Q_Cloud_base_2', 'Quality control code of cloud base height 2', '-', 'u1'),
+    ('Q_Cloud_base_3', 'Quality control code of cloud base height 3', '-', 'u1'),
+]
+
+# --------------------------------雨滴谱-------------------------------- #
+RSD_HEADER_FIELDS = [
+    ('Station_name', 'Station name', '-', 'str', 'Lushan cloud and fog experiment station'),
+    ('Country', 'Country', '-', 'str', 'China'),
+    ('Province', 'Province', '-', 'str', 'Jiangxi'),
+    ('City', 'City', '-', 'str', 'Jiujiang'),
+    ('County', 'County', '-', 'str', 'Lushan scenic area'),
+    ('Station_ID', 'Station identity', '-', 'str', 'LSYWZ'),
+    ('LAT', 'Latitude', '°', 'f', '29.57'),
+    ('LON', 'Longitude', '°', 'f', '115.97'),
+    ('ALT', 'Altitude', 'm', 'u2', '1080'),
+    ('Station_type', 'Station type', '-', 'u1', '1'),
+    ('Station_level', 'Station level', '-', 'str', '015'),
+    ('Admi_code_CHN', 'Administrative area code of China', '-', 'str', '360400'),
+    ('Mete_data_code', 'Meteorological data code', '-', 'str', 'RSD (Raindrop spectrum data)'),
+    ('Manufacturer_model', 'Manufacturer and model', '-', 'str', 'Thies Clima, Laser Precipitation Monitor'),
+    ('Software_version', 'Software version', '-', 'str', 'LNM view'),
+    ('RSD_sens_HGT', 'Raindrop size distribution sensor height', 'm', 'f', '1.5'),
+    ('Data_level', 'Data level', '-', 'str', 'LX'),
+    ('Timezone', 'Timezone', '-', 'str', 'UTC+8'),
+    ('Time_resolution', 'Time resolution', 's', 'u1', '60'),
+    ('Numb_part_diam_clas', 'Number of particle diameter class', '-', 'u1', '22'),
+    ('Numb_part_velo_clas', 'Number of particle velocity class', '-', 'u1', '20'),
+    ('Part_diam_clas', 'Particle diameter class', 'mm', 'array',
+     '[0.125,0.25) [0.25,0.375) [0.375,0.5) [0.5,0.75) [0.75,1) [1,1.25) [1.25,1.5) [1.5,1.75) [1.75,2) [2,2.5) '
+     '[2.5,3) [3,3.5) [3.5,4) [4,4.5) [4.5,5) [5,5.5) [5.5,6) [6,6.5) [6.5,7) [7,7.5) [7.5,8) [8,∞)'),
+    ('Part_velo_clas', 'Particle velocity class', 'm s-1', 'array',
+     '[0,0.2) [0.2,0.4) [0.4,0.6) [0.6,0.8) [0.8,1) [1,1.4) [1.4,1.8) [1.8,2.2) [2.2,2.6) [2.6,3) [3,3.4) [3.4,4.2) '
+     '[4.2,5) [5,5.8) [5.8,6.6) [6.6,7.4) [7.4,8.2) [8.2,9) [9,10) [10,∞)'),
+    ('Obse_begi_DT', 'Observing beginning datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Obse_end_DT', 'Observing ending datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Data_crea_DT', 'Data creating datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Dataset_version', 'Dataset version', '-', 'str', '1.0'),
+]
+RSD_OBS_FIELDS = [
+    ('Datetime', 'Datetime', 'yyyy-mm-dd hh:mm:ss', 'str'),
+    ('Rain', 'Rain', '-', 'u1'),
+    ('Number_particles', 'Number of all measured particles', '-', 'u4'),
+    ('Syno_4677_5MIN', '5M Synop Tab.4677 (5 minutes mean value)', '-', 'i'),
+    ('Syno_4680_5MIN', '5M Synop Tab.4680 (5 minutes mean value)', '-', 'i'),
+    ('Syno_4678_5MIN', '5M Synop Tab.4678 (5 minutes mean value)', '-', 'str'),
+    ('Syno_4677_1MIN', '1M Synop Tab.4677 (1 minutes mean value)', '-', 'i'),
+    ('Syno_4680_1MIN', '1M Synop Tab.4680 (1 minutes mean value)', '-', 'i'),
+    ('Syno_4678_1MIN', '1M Synop Tab.4678 (1 minutes mean value)', '-', 'str'),
+    ('Prec_inte_tota_1MIN', '1M Intensity (mm h-1) total precipitation', 'mm h-1', 'f'),
+    ('Prec_inte_liqu_1MIN', '1M Intensity (mm h-1) liquid precipitation', 'mm h-1', 'f'),
+    ('Prec_inte_soli_1MIN', '1M Intensity (mm h-1) solid precipitation', 'mm h-1', 'f'),
+    ('Prec_cumu', 'Precipitation amount', 'mm', 'f'),
+    ('Prec_spec', 'Precipitation spectrum', '-', 'array'),
+    ('Q_data', 'Quality control code of data', '-', 'u1'),
+]
+
+# --------------------------------微波辐射计-------------------------------- #
+MRD_HEADER_FIELDS = [
+    ('Station_name', 'Station name', '-', 'str', 'Lushan cloud and fog experiment station'),
+    ('Country', 'Country', '-', 'str', 'China'),
+    ('Province', 'Province', '-', 'str', 'Jiangxi'),
+    ('City', 'City', '-', 'str', 'Jiujiang'),
+    ('County', 'County', '-', 'str', 'Lushan scenic area'),
+    ('Station_ID', 'Station identity', '-', 'str', 'LSYWZ'),
+    ('LAT', 'Latitude', '° ', 'f', '29.57'),
+    ('LON', 'Longitude', '° ', 'f', '115.97'),
+    ('ALT', 'Altitude', 'm', 'u2', '1080'),
+    ('Station_type', 'Station type', '-', 'u1', '1'),
+    ('Station_level', 'Station level', '-', 'str', '015'),
+    ('Admi_code_CHN', 'Administrative area code of China', '-', 'str', '360400'),
+    ('Mete_data_code', 'Meteorological data code', '-', 'str', 'MRD (Microwave radiometer data)'),
+    ('Manufacturer_model', 'Manufacturer and model', '-', 'str', 'RAD (Radiometric MP-3000A)'),
+    ('Software_version', 'Software version', '-', 'str', 'VizMet-B'),
+    ('MRD_sens_HGT', 'Microwave radiometer sensor height', 'm', 'f', '1.0'),
+    ('Data_level', 'Data level', '-', 'str', 'L2'),
+    ('Timezone', 'Timezone', '-', 'str', 'UTC+8'),
+    ('HGT', 'Height', 'km', 'array',
+     '0 0.5 0.1 0.15 0.2 0.25 0.3 0.35 0.4 0.45 0.5 0.6 0.7 0.8 0.9 1 1.1 1.2 1.3 1.4 1.5 1.6 1.7 1.8 1.9 2 2.25 2.5 '
+     '2.75 3 3.25 3.5 3.75 4 4.25 4.5 4.75 5 5.25 5.5 5.75 6 6.25 6.75 7 7.25 7.5 7.75 8 8.25 8.5 8.75 9 9.25 9.5 '
+     '9.75 10'),
+    ('Obse_begi_DT', 'Observing beginning datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Obse_end_DT', 'Observing ending datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Data_crea_DT', 'Data creating datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Dataset_version', 'Dataset version', '-', 'str', '1.0'),
+]
+MRD_OBS_FIELDS = [
+    ('Datetime', 'Datetime', 'yyyy-mm-dd hh:mm:ss', 'str'),
+    ('Datetime_31',
+     '31 datetime of GPS datetime, latitude, longitude, altitude, magnetic variation, status, quality and number '
+     'satellites', 'yyyy-mm-dd hh:mm:ss', 'str'),
+    ('GPS_DT', 'GPS datetime', 'yyyy-mm-dd hh:mm:ss', 'str'),
+    ('LAT', 'Latitude', '°', 'f'),
+    ('LON', 'Longitude', '°', 'f'),
+    ('ALT', 'Altitude', 'm', 'f'),
+    ('Magnetic_variation', 'Magnetic variation', '-', 'f'),
+    ('Status', 'Status', '-', 'str'),
+    ('Quality', 'Quality', '-', 'f'),
+    ('Number_satellites', 'Number satellites', '-', 'f'),
+    ('Datetime_201',
+     '201 datetime of ambient temperature at surface, relative humidity at surface, pressure at surface, infrared '
+     'temperature at surface and rain', 'yyyy-mm-dd hh:mm:ss', 'str'),
+    ('Temp_ambi', 'Ambient temperature at surface', 'K', 'f'),
+    ('RH', 'Relative humidity at surface', '%', 'f'),
+    ('Pres', 'Pressure at surface', 'hPa', 'f'),
+    ('Temp_IR', 'Infrared temperature at surface', 'K', 'f'),
+    ('Rain', 'Rain', '-', 'u1'),
+    ('Datetime_301', '301 datetime of Vint, Lint, Cloud_base', 'yyyy-mm-dd hh:mm:ss', 'str'),
+    ('Vint', 'Column integrated vapor', 'cm', 'f'),
+    ('Lint', 'Column integrated liquid water', 'mm', 'f'),
+    ('Cloud_base', 'Cloud base height', 'km', 'f'),
+    ('Datetime_401', '401 datetime of Temp_prof', 'yyyy-mm-dd hh:mm:ss', 'str'),
+    ('Temp_prof', 'Temperature vector retrieval data record (profile)', 'K', 'array'),
+    ('Datetime_402', '402 datetime of VAP_prof', 'yyyy-mm-dd hh:mm:ss', 'str'),
+    ('VAP_prof', 'Vapor density vector retrieval data record (profile)', 'g m-3', 'array'),
+    ('Datetime_403', '403 datetime of LWC_prof', 'yyyy-mm-dd hh:mm:ss', 'str'),
+    ('LWC_prof', 'Liquid density vector retrieval data record (profile)', 'g m-3', 'array'),
+    ('Datetime_404', '404 datetime of RH_prof', 'yyyy-mm-dd hh:mm:ss', 'str'),
+    ('RH_prof', 'Relative humidity vector retrieval data record (profile)', '%', 'array'),
+    ('Q_Temp_ambi', 'Quality control code of ambient temperature at surface', '-', 'u1'),
+    ('Q_RH', 'Quality control code of relative humidity at surface', '-', 'u1'),
+    ('Q_Pres', 'Quality control code of pressure at surface', '-', 'u1'),
+    ('Q_Temp_IR', 'Quality control code of infrared temperature at surface', '-', 'u1'),
+    ('Q_Rain', 'Quality control code of rain', '-', 'u1'),
+    ('Q_Vint', 'Quality control code of column integrated vapor (precipitable water vapor)', '-', 'u1'),
+    ('Q_Lint', 'Quality control code of column integrated vapor (liquid water path)', '-', 'u1'),
+    ('Q_CB', 'Quality control code of cloud base height', '-', 'u1'),
+    ('Q_Temp_prof', 'Quality control code of temperature vector retrieval data record (profile)', '-', 'u1'),
+    ('Q_VAP_prof', 'Quality control code of vapor density vector retrieval data record (profile)', '-', 'u1'),
+    ('Q_LWC_prof', 'Quality control code of liquid density vector retrieval data record (profile)', '-', 'u1'),
+    ('Q_RH_prof', 'Quality control code of relative humidity vector retrieval data record (profile)', '-', 'u1'),
+]
+
+# --------------------------------云高仪二级数据-------------------------------- #
+YCCL_L2_HEADER_FIELDS = [
+    ('Station_name', 'Station name', '-', 'str', 'Lushan cloud and fog experiment station'),
+    ('Country', 'Country', '-', 'str', 'China'),
+    ('Province', 'Province', '-', 'str', 'Jiangxi'),
+    ('City', 'City', '-', 'str', 'Jiujiang'),
+    ('County', 'County', '-', 'str', 'Lushan scenic area'),
+    ('Station_ID', 'Station identity', '-', 'str', 'LSYWZ'),
+    ('LAT', 'Latitude', '°', 'f', '29.57'),
+    ('LON', 'Longitude', '°', 'f', '115.97'),
+    ('ALT', 'Altitude', 'm', 'u2', '1080'),
+    ('Station_type', 'Station type', '-', 'u1', '1'),
+    ('Station_level', 'Station level', '-', 'str', '015'),
+    ('Admi_code_CHN', 'Administrative area code of China', '-', 'str', '360400'),
+    ('Mete_data_code', 'Meteorological data code', '-', 'str', 'YCCL (Laser ceilometer)'),
+    ('Manufacturer_model', 'Manufacturer and model', '-', 'str', 'Vaisala CL31'),
+    ('Software_version', 'Software version', '-', 'str', 'BL-view 1.1'),
+    ('YCCL_sens_HGT', 'Laser ceilometer sensor height', 'm', 'f', '0.0'),
+    ('Date_level', 'Data level', '-', 'str', 'L2'),
+    ('Timezone', 'Timezone', '-', 'str', 'UTC+8'),
+    ('Time_resolution', 'Time resolution', 's', 'u1', '16'),
+    ('Obse_begi_DT', 'Observing beginning datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Obse_end_DT', 'Observing ending datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Data_crea_DT', 'Data creating datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Dataset_version', 'Dataset version', '-', 'str', '1.0'),
+]
+YCCL_L2_OBS_FIELDS = [
+    ('Datetime', 'Datetime', 'yyyy-mm-dd hh:mm:ss', 'str'),
+    ('Unixtime', 'UNIX time (Time stamp)', '-', 'str'),
+    ('BS_prof', 'Backscatter profile', '10-9 m-1 sr-1', 'array'),
+    ('Q_BS_prof', 'Quality control code of backscatter profile', '-', 'u1'),
+]
+
+# --------------------------------微雨雷达平均数据和再处理数据-------------------------------- #
+RRD_HEADER_FIELDS = [
+    ('Station_name', 'Station name', '-', 'str', 'Lushan cloud and fog experiment station'),
+    ('Country', 'Country', '-', 'str', 'China'),
+    ('Province', 'Province', '-', 'str', 'Jiangxi'),
+    ('City', 'City', '-', 'str', 'Jiujiang'),
+    ('County', 'County', '-', 'str', 'Lushan scenic area'),
+    ('Station_ID', 'Station identity', '-', 'str', 'LSYWZ'),
+    ('LAT', 'Latitude', '°', 'f', '29.57'),
+    ('LON', 'Longitude', '°', 'f', '115.97'),
+    ('ALT', 'Altitude', 'm', 'u2', '1080'),
+    ('Station_type', 'Station type', '-', 'u1', '1'),
+    ('Station_level', 'Station level', '-', 'str', '015'),
+    ('Admi_code_CHN', 'Administrative area code of China', '-', 'str', '360400'),
+    ('Mete_data_code', 'Meteorological data code', '-', 'str', 'RRD (Rain radar data)'),
+    ('Manufacturer_model', 'Manufacturer and model', '-', 'str', 'METE (METEK)'),
+    ('RRD_sens_HGT', 'Rain radar height', 'm', 'f', '1.5'),
+    ('Service_version', 'Version number of the MRR Service (service version number)', '-', 'str', 'SVS: 6.0.0.6'),
+    ('Device_version', 'Version number of the MRR firmware (device version)', '-', 'str', 'DVS: 6.00'),
+    ('Devi_seri_numb', 'Serial number of the MRR (device serial number)', '-', 'str', 'DSN: 0505123820'),
+    ('Calibration_constant', 'Calibration constant', '-', 'str', 'CC: 2279042'),
+    ('MMR_data_qual', 'Micro Rain Radar Data quality', '-', 'str', 'MDQ: 100'),
+    ('Time_AVG', 'Averaging time in seconds', 's', 'u1', '60'),
+    ('Sampling_rate', 'Sampling rate of the RADAR signal in the time domain', 'Hz', 'u2', '125000'),
+    ('Data_level', 'Data level', '-', 'str', 'Lpro/Lave'),
+    ('Timezone', 'Timezone', '-', 'str', 'UTC+8'),
+    ('Time_resolution', 'Time resolution', 's', 'u1', '10'),
+    ('Obse_begi_DT', 'Observing beginning datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Obse_end_DT', 'Observing ending datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Data_crea_DT', 'Data creating datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Dataset_version', 'Dataset version', '-', 'str', '1.0'),
+]
+RRD_OBS_FIELDS = [
+    ('Datetime', 'Datetime', 'yyyy-mm-dd hh:mm:ss', 'str'),
+    ('HGT', 'Height', 'm', 'array31_i'),
+    ('Transfer_function', 'Transfer function', '-', 'array31_f'),
+    ('Spectral_reflectivities', 'Spectral reflectivities', 'dB', 'array64'),
+    ('Drop_size', 'Drop size', 'mm', 'array64'),
+    ('Spec_drop_dens', 'Spectral drop densities', 'mm-1 m-3', 'array64'),
+    ('Path_Inte_Atte', 'Path integrated attenuation', 'dB', 'array31_f'),
+    ('Z_Atte', 'Attenuated radar reflectivity', 'dBZ', 'array31_f'),
+    ('Z_Atte_corr', 'Radar reflectivity', 'dBZ', 'array31_f'),
+    ('Rain_rate', 'Rain rate', 'mm h-1', 'array31_f'),
+    ('LWC', 'Liquid water content', 'g m-3', 'array31_f'),
+    ('W', 'Fall velocity', 'm s-1', 'array31_f'),
+    ('Q_data', 'Quality control code of data', '-', 'u1'),
+]
+
+# --------------------------------微雨雷达原始数据-------------------------------- #
+RRD_LRAW_HEADER_FIELDS = [
+    ('Station_name', 'Station name', '-', 'str', 'Lushan cloud and fog experiment station'),
+    ('Country', 'Country', '-', 'str', 'China'),
+    ('Province', 'Province', '-', 'str', 'Jiangxi'),
+    ('City', 'City', '-', 'str', 'Jiujiang'),
+    ('County', 'County', '-', 'str', 'Lushan scenic area'),
+    ('Station_ID', 'Station identity', '-', 'str', 'LSYWZ'),
+    ('LAT', 'Latitude', '°', 'f', '29.57'),
+    ('LON', 'Longitude', '°', 'f', '115.97'),
+    ('ALT', 'Altitude', 'm', 'u2', '1080'),
+    ('Station_type', 'Station type', '-', 'u1', '1'),
+    ('Station_level', 'Station level', '-', 'str', '015'),
+    ('Admi_code_CHN', 'Administrative area code of China', '-', 'str', '360400'),
+    ('Mete_data_code', 'Meteorological data code', '-', 'str', 'RRD (Rain radar data)'),
+    ('Manufacturer_model', 'Manufacturer and model', '-', 'str', 'METE (METEK)'),
+    ('RRD_sens_HGT', 'Rain radar height', 'm', 'f', '1.5'),
+    ('Service_version', 'Version number of the MRR Service (service version number)', '-', 'str', 'SVS: 6.0.0.6'),
+    ('Device_version', 'Device version number (firmware)', '-', 'str', 'DVS: 6.00'),
+    ('Devi_seri_numb', 'Device serial number', '-', 'str', 'DSN: 0505123820'),
+    ('Bandwidth', 'Bandwidth', '-', 'str', 'BW: 40200'),
+    ('Calibration_constant', 'Calibration constant', '-', 'str', 'CC: 2279042'),
+    ('MMR_data_qual', 'Micro Rain Radar Data quality', '-', 'str', 'MDQ: 100'),
+    ('Data_level', 'Data level', '-', 'str', 'Lraw'),
+    ('Timezone', 'Timezone', '-', 'str', 'UTC+8'),
+    ('Time_resolution', 'Time resolution', 's', 'u1', '10'),
+    ('Obse_begi_DT', 'Observing beginning datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Obse_end_DT', 'Observing ending datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Data_crea_DT', 'Data creating datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Dataset_version', 'Dataset version', '-', 'str', '1.0'),
+]
+RRD_LRAW_OBS_FIELDS = [
+    ('Datetime', 'Datetime', 'yyyy-mm-dd hh:mm:ss', 'str'),
+    ('HGT', 'Height', 'm', 'array32_i'),
+    ('Transfer_function', 'Transfer function', '-', 'array32_d'),
+    ('Spectral_reflectivities', 'Spectral reflectivities', 'dB', 'array64'),
+    ('Q_data', 'Quality control code of data', '-', 'u1'),
+]
+
+# --------------------------------雨量筒-------------------------------- #
+PRE_HEADER_FIELDS = [
+    ('Station_name', 'Station name', '-', 'str', 'Lushan cloud and fog experiment station'),
+    ('Country', 'Country', '-', 'str', 'China'),
+    ('Province', 'Province', '-', 'str', 'Jiangxi'),
+    ('City', 'City', '-', 'str', 'Jiujiang'),
+    ('County', 'County', '-', 'str', 'Lushan scenic area'),
+    ('Station_ID', 'Station identity', '-', 'str', 'LSYWZ'),
+    ('LAT', 'Latitude', '°', 'f', '29.57'),
+    ('LON', 'Longitude', '°', 'f', '115.97'),
+    ('ALT', 'Altitude', 'm', 'u2', '1080'),
+    ('Station_type', 'Station type', '-', 'u1', '1'),
+    ('Station_level', 'Station level', '-', 'str', '015'),
+    ('Admi_code_CHN', 'Administrative area code of China', '-', 'str', '360400'),
+    ('Mete_data_code', 'Meteorological data code', '-', 'str', 'PRE (Precipitation)'),
+    ('Manufacturer_model', 'Manufacturer and model', '-', 'str', 'HOBO onset RG3-M'),
+    ('Software_version', 'Software version', '-', 'str', 'HOBOware'),
+    ('Prec_sens_HGT', 'Rain gauge height', 'm', 'f', '1.2'),
+    ('Data_level', 'Data level', '-', 'str', 'LX'),
+    ('Timezone', 'Timezone', '-', 'str', 'UTC+8'),
+    ('Time_resolution', 'Time resolution', 's', 'str', '-'),
+    ('Obse_begi_DT', 'Observing beginning datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Obse_end_DT', 'Observing ending datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Data_crea_DT', 'Data creating datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Dataset_version', 'Dataset version', '-', 'str', '1.0'),
+]
+PRE_OBS_FIELDS = [
+    ('Datetime', 'Datetime', 'yyyy-mm-dd hh:mm:ss', 'str'),
+    ('TEM', 'Temperature', '°C', 'f'),
+    ('PRE', 'Precipitation', 'mm', 'f'),
+    ('TEM_Max', 'Temperature maximum', '°C', 'f'),
+    ('PRE_Cum', 'Cumulative precipitation', 'mm', 'f'),
+    ('Q_TEM', 'Quality control code of temperature', '-', 'i'),
+    ('Q_PRE', 'Quality control code of precipitation', '-', 'i'),
+    ('Q_TEM_Max', 'Quality control code of temperature maximum', '-', 'i'),
+    ('Q_PRE_Cum', 'Quality control code of cumulative precipitation', '-', 'i'),
+]
+
+# --------------------------------雾滴谱-------------------------------- #
+FSD_HEADER_FIELDS = [
+    ('Station_name', 'Station name', '-', 'str', 'Lushan cloud and fog experiment station'),
+    ('Country', 'Country', '-', 'str', 'China'),
+    ('Province', 'Province', '-', 'str', 'Jiangxi'),
+    ('City', 'City', '-', 'str', 'Jiujiang'),
+    ('County', 'County', '-', 'str', 'Lushan scenic area'),
+    ('Station_ID', 'Station identity', '-', 'str', 'LSYWZ'),
+    ('LAT', 'Latitude', '°', 'f', '29.57'),
+    ('LON', 'Longitude', '°', 'f', '115.97'),
+    ('ALT', 'Altitude', 'm', 'u2', '1080'),
+    ('Station_type', 'Station type', '-', 'str', '1'),
+    ('Station_level', 'Station level', '-', 'str', '015'),
+    ('Admi_code_CHN', 'Administrative area code of China', '-', 'str', '360400'),
+    ('Mete_data_code', 'Meteorological data code', '-', 'str', 'FSD (Fog droplet distribution)'),
+    ('Manufacturer_model', 'Manufacturer and model', '-', 'str', 'DMT FM-100'),
+    ('Software_version', 'Software version', '-', 'str', 'PADS3 (Old version) / PADS4 (New version)'),
+    ('FSD_sens_HGT', 'Fog monitor height', 'm', 'f', '0.8'),
+    ('Data_level', 'Data level', '-', 'str', 'LX'),
+    ('Timezone', 'Timezone', '-', 'str', 'UTC+8'),
+    ('Time_resolution', 'Time resolution', 's', 'u1', '1'),
+    ('Sample_area', 'Sample area', 'mm2', 'f', '0.24'),
+    ('Channel_count', 'Channel count', '-', 'u1', '20'),
+    ('Size_each_bin', 'Size of each bin', 'um', 'array', '2 4 6 8 10 12 14 16 18 20 23 26 29 32 35 38 41 44 47 50'),
+    ('Obse_begi_DT', 'Observing beginning datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Obse_end_DT', 'Observing ending datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Data_crea_DT', 'Data creating datetime', 'yyyy-mm-dd hh:mm:ss', 'str', ''),
+    ('Dataset_version', 'Dataset version', '-', 'str', '1.0'),
+]
+FSD_OBS_FIELDS = [
+    # ('Numb_part_chan', 'Particles number per channel', '-', 'array'),
+    ('Datetime', 'Datetime', 'yyyy - mm - dd hh:mm: ss', 'str'),
+    ('Temp_ambi', 'Ambient temperature', '°C', 'f'),
+    ('Temp_reco', 'Recovery temperature', '°C', 'f'),
+    ('Reje_DOF', 'Reject particles that fall outside the FM 100’s depth of field', '-', 'f'),
+    ('Numb_conc', 'Number concentration', 'cm-3', 'f'),
+    ('Volu_conc', 'Volume concentration', 'um3 cm-3', 'f'),
+    ('LWC', 'Liquid water content', 'g m-3', 'f'),
+    ('MVD', 'Median volume diameter', 'um', 'f'),
+    ('ED', 'Effective diameter', 'um', 'f'),
+    ('TAS', 'True air speed', 'm s-1', 'f'),
+    ('Status', 'Status', '-', 'f'),
+    ('Q_data', 'Quality control code of data', '-', 'u1'),
+    ('Numb_part_ch0', 'Numb_part_ch0', 'Numb_part_ch0', 'f'),
+    ('Numb_part_ch1', 'Numb_part_ch1', 'Numb_part_ch1', 'f'),
+    ('Numb_part_ch2', 'Numb_part_ch2', 'Numb_part_ch2', 'f'),
+    ('Numb_part_ch3', 'Numb_part_ch3', 'Numb_part_ch3', 'f'),
+    ('Numb_part_ch4', 'Numb_part_ch4', 'Numb_part_ch4', 'f'),
+    ('Numb_part_ch5', 'Numb_part_ch5', 'Numb_part_ch5', 'f'),
+    ('Numb_part_ch6', 'Numb_part_ch6', 'Numb_part_ch6', 'f'),
+    ('Numb_part_ch7', 'Numb_part_ch7', 'Numb_part_ch7', 'f'),
+    ('Numb_part_ch8', 'Numb_part_ch8', 'Numb_part_ch8', 'f'),
+    ('Numb_part_ch9', 'Numb_part_ch9', 'Numb_part_ch9', 'f'),
+    ('Numb_part_ch10', 'Numb_part_ch10', 'Numb_part_ch10', 'f'),
+    ('Numb_part_ch11', 'Numb_part_ch11', 'Numb_part_ch11', 'f'),
+    ('Numb_part_ch12', 'Numb_part_ch12', 'Numb_part_ch12', 'f'),
+    ('Numb_part_ch13', 'Numb_part_ch13', 'Numb_part_ch13', 'f'),
+    ('Numb_part_ch14', 'Numb_part_ch14', 'Numb_part_ch14', 'f'),
+    ('Numb_part_ch15', 'Numb_part_ch15', 'Numb_part_ch15', 'f'),
+    ('Numb_part_ch16', 'Numb_part_ch16', 'Numb_part_ch16', 'f'),
+    ('Numb_part_ch17', 'Numb_part_ch17', 'Numb_part_ch17', 'f'),
+    ('Numb_part_ch18', 'Numb_part_ch18', 'Numb_part_ch18', 'f'),
+    ('Numb_part_ch19', 'Numb_part_ch19', 'Numb_part_ch19', 'f'),
+]
+
+# --------------------------------设备注册-------------------------------- #
+# 观测要素只有'Datetime'一个维度的设备数据
+for _name, _filename_codes, _header_fields, _obs_fields, _is_quality_control in [
+    ('AWS', ('SURF', 'MOBS', 'SUOB', 'LSYW', 'AWS', 'HY', 'LX'), AWS_HEADER_FIELDS, AWS_OBS_FIELDS, True),
+    ('AERM', ('SURF', 'MOBS', 'SUOB', 'LSYW', 'AERM', 'THER', 'LX'), AERM_HEADER_FIELDS, AERM_OBS_FIELDS, True),
+    ('VIS', ('SURF', 'MOBS', 'SUOB', 'LSYW', 'VIS', 'VAIS', 'LX'), VIS_HEADER_FIELDS, VIS_OBS_FIELDS, True),
+    # 云高仪三级数据, 无质控码
+    ('YCCL_L3', ('UPAR', 'MOBS', 'SUOB', 'LSYW', 'YCCL', 'VAIS', 'L3'), YCCL_L3_HEADER_FIELDS, YCCL_L3_OBS_FIELDS,
+     False),
+]:
+    register_instrument(InstrumentSpec(
+        _name, _filename_codes, _header_fields, _obs_fields, 'generate_one_day_one_dim_nc_file',
+        'generate_one_day_one_dim_csv_file', 'one_dime_csv_read', nc_writer_args=(_name,), csv_writer_args=(_name,),
+        csv_reader_args=(_name,), is_quality_control=_is_quality_control))
+# 以下为需要单独设置文件结构的设备
+register_instrument(InstrumentSpec(
+    'RSD', ('SURF', 'MOBS', 'SUOB', 'LSYW', 'RSD', 'THIE', 'LX'), RSD_HEADER_FIELDS, RSD_OBS_FIELDS,
+    'generate_one_day_rsd_nc_file', 'generate_one_day_rsd_csv_file', 'table_csv_read',
+    csv_reader_args=('RSD',), csv_array_shapes={'Prec_spec': (22, 20)}))
+register_instrument(InstrumentSpec(
+    'MRD', ('UPAR', 'MOBS', 'SUOB', 'LSYW', 'MRD', 'RAD', 'L2'), MRD_HEADER_FIELDS, MRD_OBS_FIELDS,
+    'generate_one_day_mrd_nc_file', 'generate_one_day_mrd_csv_file', 'table_csv_read',
+    csv_reader_args=('MRD',), time_code='Datetime_301'))
+# 云高仪二级数据, 无质控码
+register_instrument(InstrumentSpec(
+    'YCCL_L2', ('UPAR', 'MOBS', 'SUOB', 'LSYW', 'YCCL', 'VAIS', 'L2'), YCCL_L2_HEADER_FIELDS, YCCL_L2_OBS_FIELDS,
+    'generate_one_day_yccl_l2_nc_file', 'generate_one_day_yccl_l2_csv_file', 'table_csv_read',
+    csv_reader_args=('YCCL_L2',), is_quality_control=False))
+# 微雨雷达平均数据和再处理数据使用相同的字段和生成函数, 文件头中的数据级别不同
+for _level in ['Lave', 'Lpro']:
+    register_instrument(InstrumentSpec(
+        'RRD_' + _level, ('RADA', 'MOBS', 'SUOB', 'LSYW', 'RRD', 'METE', _level), RRD_HEADER_FIELDS, RRD_OBS_FIELDS,
+        'generate_one_day_rrd_lave_nc_file', 'generate_one_day_rrd_lave_csv_file', 'rrd_lpro_and_lave_csv_read',
+        nc_writer_args=(_level,), csv_writer_args=('RRD_' + _level,), header_overrides={15: _level},
+        csv_header_overrides={22: _level}))
+register_instrument(InstrumentSpec(
+    'RRD_Lraw', ('RADA', 'MOBS', 'SUOB', 'LSYW', 'RRD', 'METE', 'Lraw'), RRD_LRAW_HEADER_FIELDS, RRD_LRAW_OBS_FIELDS,
+    'generate_one_day_rrd_lraw_nc_file', 'generate_one_day_rrd_lraw_csv_file', 'rrd_lraw_csv_read'))
+register_instrument(InstrumentSpec(
+    'PRE', ('SURF', 'MOBS', 'SUOB', 'LSYW', 'PRE', 'HOBO', 'LX'), PRE_HEADER_FIELDS, PRE_OBS_FIELDS,
+    'generate_one_day_pre_nc_file', 'generate_one_day_pre_csv_file', 'pre_csv_read'))
+# 雾滴谱csv文件中各通道的粒子数合并为'Numb_part_chan'一列
+register_instrument(InstrumentSpec(
+    'FSD', ('SURF', 'MOBS', 'SUOB', 'LSYW', 'FSD', 'DMT', 'LX'), FSD_HEADER_FIELDS, FSD_OBS_FIELDS,
+    'generate_one_day_fsd_nc_file', 'generate_one_day_fsd_csv_file', 'table_csv_read',
+    csv_reader_args=('FSD',), csv_array_shapes={'Numb_part_chan': None}))
@@ -0,0 +1,59 @@
+# -*- coding:utf-8 -*-
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import pytest
+from filewriter import CheckpointManifest, split_days, record_task_results
+
+
+def _days(*days):
+    return [datetime(2020, 3, day) for day in days]
+
+
+def test_split_days_groups_consecutive_days():
+    tasks = split_days(_days(1, 2, 3, 4, 5), 2)
+    assert tasks == [(datetime(2020, 3, 1), datetime(2020, 3, 3)), (datetime(2020, 3, 3), datetime(2020, 3, 5)),
+                     (datetime(2020, 3, 5), datetime(2020, 3, 6))]
+
+
+def test_split_days_does_not_cover_gaps():
+    # 断点续传时跳过的观测日 (3日、6日) 不在任何时间范围内
+    tasks = split_days(_days(1, 2, 4, 5, 7), 7)
+    assert tasks == [(datetime(2020, 3, 1), datetime(2020, 3, 3)), (datetime(2020, 3, 4), datetime(2020, 3, 6)),
+                     (datetime(2020, 3, 7), datetime(2020, 3, 8))]
+
+
+def test_split_days_clips_to_start_and_end():
+    tasks = split_days(_days(1, 2), 1, start=datetime(2020, 3, 1, 6), end=datetime(2020, 3, 2, 12))
+    assert tasks == [(datetime(2020, 3, 1, 6), datetime(2020, 3, 2)), (datetime(2020, 3, 2), datetime(2020, 3, 2, 12))]
+    assert split_days([], 3) == []
+
+
+def test_record_task_results_records_successes_before_raising():
+    def task(day):
+        if day == 1:
+            raise RuntimeError('failed')
+        return {f'2020-03-0{day}': {}}
+
+    manifest = CheckpointManifest()
+    with ThreadPoolExecutor(3) as executor:
+        futures = [executor.submit(task, day) for day in (1, 2, 3)]
+        with pytest.raises(RuntimeError):
+            record_task_results(futures, manifest)
+    assert sorted(manifest.days) == ['2020-03-02', '2020-03-03']
+
+
+def test_resume_and_incremental_start(tmp_path):
+    manifest = CheckpointManifest.for_export(str(tmp_path), 'AWS', 'nc')
+    assert manifest.resume_start() is None
+    assert manifest.incremental_start(datetime(2020, 1, 1)) == datetime(2020, 1, 1)
+    manifest.record_day('2020-03-01', 'a.nc', 1440, datetime(2020, 3, 1, 23, 59))
+    manifest.record_day('2020-03-02', 'b.nc', 600, datetime(2020, 3, 2, 9, 59))
+    # 继续导出从最后一个完成的观测日的下一天开始, 增量导出从高水位线所在观测日的0时开始
+    assert manifest.resume_start() == datetime(2020, 3, 3)
+    assert manifest.incremental_start() == datetime(2020, 3, 2)
+    assert manifest.resume_start(datetime(2020, 4, 1)) == datetime(2020, 4, 1)
+    assert manifest.incremental_start(datetime(2020, 4, 1)) == datetime(2020, 4, 1)
+    # 清单保存到文件, 重新打开后内容一致
+    reopened = CheckpointManifest.for_export(str(tmp_path), 'AWS', 'nc')
+    assert reopened.days == manifest.days
+    assert reopened.high_water_mark() == datetime(2020, 3, 2, 9, 59)
@@ -0,0 +1,67 @@
+# -*- coding:utf-8 -*-
+import bson
+import numpy as np
+import pytest
+from bson.int64 import Int64
+from bson.raw_bson import RawBSONDocument
+from filewriter import RawBSONRecords
+
+
+class _Cursor(list):
+    def close(self):
+        pass
+
+
+def _decode(document):
+    return RawBSONRecords(_Cursor()).decode(bson.encode(document))
+
+
+def _assert_same(decoded, expected):
+    assert decoded.keys() == expected.keys()
+    for key, value in expected.items():
+        if isinstance(decoded[key], np.ndarray):
+            assert decoded[key].tolist() == value
+            assert decoded[key].dtype == np.asarray(value).dtype
+        else:
+            assert decoded[key] == value
+
+
+@pytest.mark.parametrize('values', [
+    list(range(300)),                               # int32
+    [Int64(2 ** 40 + i) for i in range(300)],       # int64
+    [i / 7 for i in range(300)],                    # double
+])
+def test_numeric_array_matches_bson_decode(values):
+    document = {'Datetime': 'x', 'Q': 1, 'array': values}
+    decoded = _decode(document)
+    assert isinstance(decoded['array'], np.ndarray)
+    _assert_same(decoded, bson.decode(bson.encode(document)))
+
+
+def test_mixed_array_is_decoded_as_list():
+    values = [float(i) if i % 2 else i for i in range(300)]
+    document = {'array': values, 'other': 'Nan'}
+    decoded = _decode(document)
+    assert isinstance(decoded['array'], list)
+    assert decoded == bson.decode(bson.encode(document))
+
+
+def test_two_dimensional_array_matches_bson_decode():
+    values = [[float(i * 64 + j) for j in range(64)] for i in range(32)]
+    document = {'spec': values, 'HGT': list(range(32))}
+    decoded = _decode(document)
+    assert decoded['spec'].shape == (32, 64)
+    _assert_same(decoded, bson.decode(bson.encode(document)))
+
+
+def test_small_array_is_decoded_as_list():
+    document = {'array': [1.0, 2.0, 3.0]}
+    assert _decode(document) == bson.decode(bson.encode(document))
+
+
+def test_first_record_without_arrays_keeps_fast_path():
+    documents = [{'array': [1.0]}] + [{'array': [float(i)] * 300} for i in range(3)]
+    records = RawBSONRecords(_Cursor(RawBSONDocument(bson.encode(d)) for d in documents))
+    decoded = list(records)
+    assert isinstance(decoded[0]['array'], list)
+    assert all(isinstance(d['array'], np.ndarray) for d in decoded[1:])
@@ -0,0 +1,51 @@
+# -*- coding:utf-8 -*-
+import numpy as np
+import pytest
+from filewriter import decode_prec_spec
+
+
+def _column(records):
+    column = np.empty(len(records), dtype=object)
+    column[:] = records
+    return column
+
+
+def test_known_prec_spec():
+    values = [f'{i % 1000:03d}' for i in range(440)]
+    result = decode_prec_spec(_column([values]))
+    assert result.shape == (1, 22, 20)
+    assert result.dtype == np.uint16
+    assert result[0].ravel().tolist() == list(range(440))
+
+
+def test_merged_values():
+    # 部分记录中相邻两个值合并为一个"ddd ddd"字符串
+    merged = ['001 002'] * 220
+    result = decode_prec_spec(_column([['003'] * 440, merged]))
+    assert result[0].ravel().tolist() == [3] * 440
+    assert result[1].ravel().tolist() == [1, 2] * 220
+
+
+def test_non_digit_values_fall_back():
+    values = ['7'] + ['000'] * 439
+    result = decode_prec_spec(_column([values]))
+    assert result[0, 0, 0] == 7
+    assert result.sum() == 7
+
+
+def test_numeric_column():
+    column = np.arange(880).reshape(2, 440)
+    result = decode_prec_spec(column)
+    assert result.shape == (2, 22, 20)
+    assert result[1, 0, 0] == 440
+
+
+def test_wrong_count_per_record_raises():
+    # 两条记录的值的个数合计正确, 但每条记录的个数不正确时不能错位解码
+    with pytest.raises(ValueError):
+        decode_prec_spec(_column([['001'] * 441, ['002'] * 439]))
+
+
+def test_wrong_total_count_raises():
+    with pytest.raises(ValueError):
+        decode_prec_spec(_column([['001'] * 439]))